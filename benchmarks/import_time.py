@@ -0,0 +1,70 @@
+"""
+Measure the cold import time of the package with `python -X importtime`.
+
+    python -m benchmarks.import_time [--module twitterapiv2.search_recent]
+"""
+from __future__ import annotations
+
+import argparse
+import subprocess
+import sys
+
+DEFAULT_MODULE = "twitterapiv2.search_recent"
+CLIENT_MODULES = (
+    "twitterapiv2.likes",
+    "twitterapiv2.manage_tweets",
+    "twitterapiv2.search_all",
+    "twitterapiv2.search_recent",
+    "twitterapiv2.shard_planner",
+    "twitterapiv2.tweets_counts",
+    "twitterapiv2.tweets_lookup",
+)
+# Seconds allowed for a cold import of DEFAULT_MODULE, enforced by the tests
+IMPORT_BUDGET = 0.4
+# Modules every client import must not load, they are imported when first used
+LAZY_MODULES = ("authlib", "sqlite3", "gzip")
+
+
+def import_profile(module: str = DEFAULT_MODULE) -> dict[str, float]:
+    """
+    Import module, or comma separated modules, in a fresh interpreter.
+
+    Returns:
+        Cumulative import time in seconds, by name of each imported module
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    profile: dict[str, float] = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        profile[name.strip()] = int(cumulative) / 1e6
+    return profile
+
+
+def import_time(module: str = DEFAULT_MODULE, repeat: int = 3) -> float:
+    """Fastest cold import of module out of `repeat`, in seconds."""
+    return min(import_profile(module)[module] for _ in range(repeat))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--module", default=DEFAULT_MODULE)
+    args = parser.parse_args()
+
+    profile = import_profile(args.module)
+    slowest = sorted(profile.items(), key=lambda item: item[1], reverse=True)
+    for name, seconds in slowest[:15]:
+        print(f"{seconds * 1e3:9.2f} ms  {name}")
+    loaded = [name for name in LAZY_MODULES if name in profile]
+    if loaded:
+        print(f"Eagerly imported: {', '.join(loaded)}")
+
+
+if __name__ == "__main__":
+    main()
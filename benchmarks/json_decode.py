@@ -0,0 +1,57 @@
+"""
+Compare JSON decoders on realistic search recent pages.
+
+    python -m benchmarks.json_decode [--pages N]
+"""
+from __future__ import annotations
+
+import argparse
+import timeit
+from typing import TYPE_CHECKING
+
+from twitterapiv2.util.json_decoder import default_decoder
+from twitterapiv2.util.json_decoder import stdlib_decoder
+
+from benchmarks.payloads import recent_page_bytes
+
+if TYPE_CHECKING:
+    from twitterapiv2.util.json_decoder import JSONDecoder
+
+
+def decoders() -> dict[str, JSONDecoder]:
+    """Decoders available in this environment."""
+    available: dict[str, JSONDecoder] = {"json": stdlib_decoder}
+    if default_decoder() is not stdlib_decoder:
+        available["orjson"] = default_decoder()
+    return available
+
+
+def measure(decoder: JSONDecoder, content: bytes, number: int) -> float:
+    """Best of five runs, in seconds per decode."""
+    timer = timeit.Timer(lambda: decoder(content))
+    return min(timer.repeat(repeat=5, number=number)) / number
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, default=200, help="decodes per run")
+    args = parser.parse_args()
+
+    content = recent_page_bytes(100)
+    print(f"payload: 100 tweets with expansions, {len(content) / 1024:.1f} KiB")
+
+    baseline = None
+    for name, decoder in decoders().items():
+        seconds = measure(decoder, content, args.pages)
+        baseline = baseline or seconds
+        print(
+            f"{name:>8}: {seconds * 1e3:7.3f} ms/page "
+            f"{1 / seconds:8.0f} pages/s  {baseline / seconds:5.2f}x"
+        )
+    if len(decoders()) == 1:
+        print("orjson not installed: pip install twitterapiv2[orjson]")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,111 @@
+"""Realistic, deterministic Twitter API payloads for offline benchmarks."""
+from __future__ import annotations
+
+import json
+import random
+from datetime import datetime
+from datetime import timedelta
+from typing import Any
+
+from twitterapiv2.model.recent import Recent
+
+LANGS = ["en", "en", "en", "es", "ja", "pt", "und"]
+WORDS = "hello world python twitter api search recent tweet lookup benchmark".split()
+
+
+def recent_page(
+    size: int = 100,
+    *,
+    seed: int = 0,
+    next_token: str | None = "b26v89c19zqg8o3fpdy5zsnp3n3qzp909cim472adoxa5",
+    first_id: int = 1461880347478528007,
+) -> Recent:
+    """Build a search recent page with full tweet fields and expansions."""
+    rng = random.Random(seed)
+    created = datetime(2021, 11, 20, 2, 5, 1)
+    authors = [str(rng.randrange(10**9, 10**10)) for _ in range(max(size // 3, 1))]
+    tweets: list[dict[str, Any]] = []
+    media: list[dict[str, Any]] = []
+    for index in range(size):
+        tweet_id = str(first_id - index * 1000)
+        author_id = rng.choice(authors)
+        text = " ".join(rng.choice(WORDS) for _ in range(rng.randint(8, 40)))
+        tweet: dict[str, Any] = {
+            "id": tweet_id,
+            "text": f"RT @user{author_id[:4]}: {text} #hashtag https://t.co/qVLlxCEBA4",
+            "author_id": author_id,
+            "conversation_id": tweet_id,
+            "created_at": (created - timedelta(seconds=index)).strftime(
+                "%Y-%m-%dT%H:%M:%S.000Z"
+            ),
+            "edit_history_tweet_ids": [tweet_id],
+            "lang": rng.choice(LANGS),
+            "possibly_sensitive": False,
+            "reply_settings": "everyone",
+            "source": "Twitter for iPhone",
+            "public_metrics": {
+                "retweet_count": rng.randint(0, 5000),
+                "reply_count": rng.randint(0, 100),
+                "like_count": rng.randint(0, 10000),
+                "quote_count": rng.randint(0, 50),
+            },
+            "entities": {
+                "hashtags": [{"start": 40, "end": 48, "tag": "hashtag"}],
+                "urls": [
+                    {
+                        "start": 49,
+                        "end": 72,
+                        "url": "https://t.co/qVLlxCEBA4",
+                        "expanded_url": "https://example.com/some/long/path",
+                        "display_url": "example.com/some/long…",
+                    }
+                ],
+                "mentions": [
+                    {"start": 3, "end": 12, "username": f"user{author_id[:4]}"}
+                ],
+            },
+            "context_annotations": [
+                {
+                    "domain": {"id": "46", "name": "Brand Category"},
+                    "entity": {"id": "781974596752842752", "name": "Services"},
+                }
+            ],
+        }
+        if index % 4 == 0:
+            media_key = f"3_{tweet_id}"
+            tweet["attachments"] = {"media_keys": [media_key]}
+            media.append(
+                {"media_key": media_key, "type": "photo", "width": 1200, "height": 675}
+            )
+        tweets.append(tweet)
+
+    users = [
+        {
+            "id": author_id,
+            "name": f"User {author_id[-4:]}",
+            "username": f"user{author_id[:4]}",
+            "created_at": "2012-03-01T12:00:00.000Z",
+            "verified": False,
+            "public_metrics": {
+                "followers_count": rng.randint(0, 10**6),
+                "following_count": rng.randint(0, 5000),
+                "tweet_count": rng.randint(0, 10**5),
+                "listed_count": rng.randint(0, 500),
+            },
+        }
+        for author_id in authors
+    ]
+    meta: dict[str, Any] = {
+        "newest_id": tweets[0]["id"] if tweets else None,
+        "oldest_id": tweets[-1]["id"] if tweets else None,
+        "result_count": len(tweets),
+    }
+    if next_token:
+        meta["next_token"] = next_token
+    page = {"data": tweets, "includes": {"users": users, "media": media}, "meta": meta}
+    return page  # type: ignore
+
+
+def recent_page_bytes(size: int = 100, **kwargs: Any) -> bytes:
+    """Encoded `recent_page()`, as sent by Twitter."""
+    return json.dumps(recent_page(size, **kwargs), separators=(",", ":")).encode()
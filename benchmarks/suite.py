@@ -0,0 +1,256 @@
+"""
+Offline benchmark suite, every request is served by a mock Twitter transport.
+
+    python -m benchmarks.suite                          # run and report
+    python -m benchmarks.suite --save baseline.json     # record a baseline
+    python -m benchmarks.suite --compare baseline.json  # fail on regressions
+
+With `--compare` the exit status is 1 when any benchmark is worse than the
+baseline by more than `--tolerance` (fraction, default 0.15).
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import asdict
+from dataclasses import dataclass
+
+from twitterapiv2._appauth_client import AppAuthClient
+from twitterapiv2.http_pool import HttpPool
+from twitterapiv2.model.application_auth import ApplicationAuth
+from twitterapiv2.model.compact_tweets import CompactTweets
+from twitterapiv2.rate_limit import RateLimiter
+from twitterapiv2.search_recent import SearchRecent
+from twitterapiv2.tweets_lookup import TweetsLookup
+from twitterapiv2.util.json_decoder import default_decoder
+
+from benchmarks.import_time import import_time
+from benchmarks.json_decode import measure
+from benchmarks.payloads import recent_page_bytes
+from benchmarks.transport import MockTwitter
+
+DEFAULT_TOLERANCE = 0.15
+
+
+@dataclass(frozen=True)
+class Result:
+    """Outcome of one benchmark."""
+
+    name: str
+    value: float
+    unit: str
+    higher_is_better: bool
+
+    def regressed(self, baseline: Result, tolerance: float) -> bool:
+        """True if worse than the baseline by more than `tolerance`."""
+        if self.higher_is_better:
+            return self.value < baseline.value * (1 - tolerance)
+        return self.value > baseline.value * (1 + tolerance)
+
+
+def best_of(repeat: int, func: Callable[[], object]) -> float:
+    """Fastest of `repeat` runs of func, in seconds."""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def _auth(bearer: str | None = "bearer") -> ApplicationAuth:
+    return ApplicationAuth("consumer_key", "consumer_secret", bearer)
+
+
+def bench_search(pages: int, repeat: int) -> list[Result]:
+    """Pages per second through `SearchRecent.iter_pages()` (`.fetch()`)."""
+    mock = MockTwitter(pages=pages)
+    pool = HttpPool(transport=mock.transport())
+
+    def run() -> None:
+        client = SearchRecent.from_model(_auth(), pool=pool)
+        client.query("hello")
+        for _ in client.iter_pages():
+            pass
+
+    seconds = best_of(repeat, run)
+    pool.close()
+    return [Result("search_recent_pages", pages / seconds, "pages/s", True)]
+
+
+def bench_lookup(tweets: int, repeat: int) -> list[Result]:
+    """Tweets per second through `TweetsLookup.fetch_many()`."""
+    mock = MockTwitter(pages=1)
+    pool = HttpPool(transport=mock.transport())
+    ids = [str(1461880347478528007 - index) for index in range(tweets)]
+
+    def run() -> None:
+        client = TweetsLookup.from_model(_auth(), pool=pool)
+        # The mock window never resets, pacing would measure the wait
+        client.rate_limiter = RateLimiter(pace=False)
+        for _ in client.fetch_many(ids, max_workers=4):
+            pass
+
+    seconds = best_of(repeat, run)
+    pool.close()
+    return [Result("tweets_lookup", tweets / seconds, "tweets/s", True)]
+
+
+def bench_auth(requests: int, repeat: int) -> list[Result]:
+    """Bearer token request and per-request authorization header cost."""
+    mock = MockTwitter(pages=1)
+    pool = HttpPool(transport=mock.transport())
+
+    def fetch_token() -> None:
+        auth_client = AppAuthClient(_auth(None), SearchRecent.scopes)
+        auth_client.http = pool.client
+        auth_client.get_bearer()
+
+    client = SearchRecent.from_model(_auth(), pool=pool)
+
+    def build_headers() -> None:
+        for _ in range(requests):
+            client.headers
+
+    token = best_of(repeat, fetch_token)
+    headers = best_of(repeat, build_headers) / requests
+    pool.close()
+    return [
+        Result("auth_token_request", token * 1e3, "ms", False),
+        Result("auth_header_per_request", headers * 1e6, "us", False),
+    ]
+
+
+def bench_decode(pages: int, repeat: int) -> list[Result]:
+    """Decode cost of a 100 tweet page with expansions, default decoder."""
+    content = recent_page_bytes(100)
+    seconds = min(measure(default_decoder(), content, pages) for _ in range(repeat))
+    return [Result("json_decode_page", seconds * 1e3, "ms", False)]
+
+
+def bench_memory(tweets: int) -> list[Result]:
+    """Peak memory holding 10k tweets, as pages of dicts and as CompactTweets."""
+    mock = MockTwitter(pages=max(tweets // 100, 1))
+    pool = HttpPool(transport=mock.transport())
+    scale = 10_000 / tweets
+
+    def peak(collect: Callable[[SearchRecent], object]) -> float:
+        client = SearchRecent.from_model(_auth(), pool=pool)
+        client.query("hello")
+        client.http  # create the http client outside of the measurement
+        tracemalloc.start()
+        try:
+            held = collect(client)
+            _, peak_bytes = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        del held
+        return peak_bytes * scale / 1024
+
+    dicts = peak(lambda client: list(client.iter_tweets()))
+    compact = peak(lambda client: CompactTweets.from_pages(client.iter_pages()))
+    pool.close()
+    return [
+        Result("memory_10k_tweets", dicts, "KiB", False),
+        Result("memory_10k_tweets_compact", compact, "KiB", False),
+    ]
+
+
+def bench_import(repeat: int) -> list[Result]:
+    """Cold import of a client module in a fresh interpreter."""
+    seconds = import_time(repeat=repeat)
+    return [Result("import_search_recent", seconds * 1e3, "ms", False)]
+
+
+def run_suite(*, quick: bool = False) -> list[Result]:
+    """Run every benchmark. `quick` reduces the work for a smoke run."""
+    repeat = 1 if quick else 5
+    scale = 10 if quick else 1
+    results: list[Result] = []
+    results += bench_search(pages=50 // scale, repeat=repeat)
+    results += bench_lookup(tweets=5_000 // scale, repeat=repeat)
+    results += bench_auth(requests=10_000 // scale, repeat=repeat)
+    results += bench_decode(pages=200 // scale, repeat=repeat)
+    results += bench_memory(tweets=10_000 // scale)
+    results += bench_import(repeat=repeat)
+    return results
+
+
+def save(path: str, results: list[Result]) -> None:
+    """Write results as a baseline file."""
+    baseline = {
+        "python": platform.python_version(),
+        "results": {result.name: asdict(result) for result in results},
+    }
+    with open(path, "w", encoding="utf-8") as outfile:
+        json.dump(baseline, outfile, indent=2)
+
+
+def load(path: str) -> dict[str, Result]:
+    """Read results of a baseline file, by name."""
+    with open(path, encoding="utf-8") as infile:
+        baseline = json.load(infile)
+    return {name: Result(**result) for name, result in baseline["results"].items()}
+
+
+def compare(
+    results: list[Result],
+    baseline: dict[str, Result],
+    tolerance: float,
+) -> list[str]:
+    """Report results against the baseline, return names of regressed results."""
+    regressed = []
+    for result in results:
+        base = baseline.get(result.name)
+        if base is None:
+            print(f"{result.name:<28} {result.value:12.2f} {result.unit:<8} (new)")
+            continue
+        change = (result.value - base.value) / base.value if base.value else 0.0
+        status = "ok"
+        if result.regressed(base, tolerance):
+            status = "REGRESSED"
+            regressed.append(result.name)
+        print(
+            f"{result.name:<28} {result.value:12.2f} {result.unit:<8} "
+            f"baseline {base.value:12.2f} {change:+7.1%}  {status}"
+        )
+    return regressed
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--save", metavar="PATH", help="write results as baseline")
+    parser.add_argument("--compare", metavar="PATH", help="compare with baseline")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=DEFAULT_TOLERANCE,
+        help="allowed fraction of regression (default: %(default)s)",
+    )
+    parser.add_argument("--quick", action="store_true", help="smoke run, less work")
+    args = parser.parse_args(argv)
+
+    results = run_suite(quick=args.quick)
+
+    regressed: list[str] = []
+    if args.compare:
+        regressed = compare(results, load(args.compare), args.tolerance)
+    else:
+        for result in results:
+            print(f"{result.name:<28} {result.value:12.2f} {result.unit}")
+    if args.save:
+        save(args.save, results)
+
+    if regressed:
+        print(f"Regressed beyond {args.tolerance:.0%}: {', '.join(regressed)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,72 @@
+"""Offline Twitter API served through `httpx.MockTransport` for benchmarks."""
+from __future__ import annotations
+
+import json
+from typing import Any
+
+import httpx
+
+from benchmarks.payloads import recent_page
+from benchmarks.payloads import recent_page_bytes
+
+HEADERS = {
+    "content-type": "application/json; charset=utf-8",
+    "x-rate-limit-limit": "450",
+    "x-rate-limit-remaining": "449",
+    "x-rate-limit-reset": "4102444800",
+}
+TOKEN = b'{"token_type":"bearer","access_token":"AAAA%2FAAA%3DAAAAAAAAxxxxxx"}'
+
+
+class MockTwitter:
+    """
+    Serve search, lookup, and token endpoints from pre-encoded payloads.
+
+    Search responses cycle through `pages` distinct pages, each linking to the
+    next with `next_token`. The last page ends pagination.
+    """
+
+    def __init__(self, *, pages: int = 10, page_size: int = 100, seed: int = 0) -> None:
+        self.requests = 0
+        self._pages = [
+            recent_page_bytes(
+                page_size,
+                seed=seed + index,
+                next_token=f"page{index + 1}" if index + 1 < pages else None,
+                first_id=1461880347478528007 - index * page_size * 1000,
+            )
+            for index in range(pages)
+        ]
+        self._tweet = recent_page(1, seed=seed)["data"][0]
+
+    def transport(self) -> httpx.MockTransport:
+        """Sync transport, for `HttpPool(transport=...)`."""
+        return httpx.MockTransport(self.handle)
+
+    def async_transport(self) -> httpx.MockTransport:
+        """Async transport, for `HttpPool(async_transport=...)`."""
+
+        async def handle(request: httpx.Request) -> httpx.Response:
+            return self.handle(request)
+
+        return httpx.MockTransport(handle)
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        path = request.url.path
+        if path == "/oauth2/token":
+            return httpx.Response(200, headers=HEADERS, content=TOKEN)
+        if path.startswith("/2/tweets/search/"):
+            token = request.url.params.get("next_token")
+            index = int(token[4:]) if token else 0
+            return httpx.Response(200, headers=HEADERS, content=self._pages[index])
+        if path == "/2/tweets":
+            ids = request.url.params["ids"].split(",")
+            return httpx.Response(200, headers=HEADERS, content=self._lookup(ids))
+        return httpx.Response(404, headers=HEADERS, content=b'{"title":"Not Found"}')
+
+    def _lookup(self, ids: list[str]) -> bytes:
+        data: list[dict[str, Any]] = [
+            {**self._tweet, "id": tweet_id} for tweet_id in ids
+        ]
+        return json.dumps({"data": data}, separators=(",", ":")).encode()
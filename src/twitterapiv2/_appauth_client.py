@@ -8,29 +8,50 @@ from __future__ import annotations
 import logging
 from base64 import b64encode
 from typing import Any
+from typing import TYPE_CHECKING
 from urllib import parse
 
 import httpx
+from twitterapiv2._auth_client import AsyncAuthClient
 from twitterapiv2._auth_client import AuthClient
+from twitterapiv2.http_pool import LazyClient
 from twitterapiv2.model.application_auth import ApplicationAuth
+from twitterapiv2.model.oauth_token import OAuthToken
 
+if TYPE_CHECKING:
+    from twitterapiv2.token_store import TokenStore
+
+
+class _AppAuthBase:
+    """Internal: Credential handling shared by sync and async app auth clients."""
 
-class AppAuthClient(AuthClient):
     logger = logging.getLogger(__name__)
 
     twitter_api = "https://api.twitter.com"
 
-    def __init__(self, auth_model: ApplicationAuth, scopes: list[str]) -> None:
-        """Provide ApplicatoinAuth model for authentication."""
-        self.http = httpx.Client()
+    def __init__(
+        self,
+        auth_model: ApplicationAuth,
+        scopes: list[str],
+        *,
+        token_store: TokenStore | None = None,
+    ) -> None:
         self._keys = auth_model
         self._scopes = scopes.copy()
+        self.token_store = token_store
 
-    def get_bearer(self) -> str | None:
-        """Aquire bearer token from Twitter, or return current."""
-        if not self._keys.consumer_bearer:
-            self._get_bearer_token()
-        return self._keys.consumer_bearer
+    @property
+    def _store_key(self) -> str:
+        return f"app:{self._keys.consumer_key}"
+
+    def _load_stored_bearer(self) -> None:
+        """Load bearer from the token store, if one is defined."""
+        if self.token_store is None:
+            return
+        token = self.token_store.load(self._store_key)
+        if token is not None:
+            self.logger.debug("Using bearer token from token store")
+            self._keys.consumer_bearer = token.access_token
 
     def _encoded_credentials(self) -> str:
         """Create encoded token credential string."""
@@ -42,6 +63,45 @@ class AppAuthClient(AuthClient):
         union = ":".join([key, secret]).encode()
         return b64encode(union).decode()
 
+    def _token_headers(self) -> dict[str, str]:
+        """Headers for the oauth2/token request."""
+        return {
+            "Content-Type": "applicaton/x-www-form-urlencoded;charset=UTF-8",
+            "Authorization": "Basic " + self._encoded_credentials(),
+        }
+
+    def _store_bearer(self, result: dict[str, Any]) -> None:
+        """Validate token response and store the bearer on the auth model."""
+        if "token_type" not in result or "access_token" not in result:
+            self.logger.debug("Invalid response: %s", result)
+            raise ValueError("Unexpected Authentication response.")
+
+        self._keys.consumer_bearer = result["access_token"]
+        if self.token_store is not None:
+            self.token_store.save(self._store_key, OAuthToken.from_oauth(result))
+
+
+class AppAuthClient(_AppAuthBase, AuthClient):
+    http = LazyClient(httpx.Client)
+
+    def __init__(
+        self,
+        auth_model: ApplicationAuth,
+        scopes: list[str],
+        *,
+        token_store: TokenStore | None = None,
+    ) -> None:
+        """Provide ApplicatoinAuth model for authentication. Optional token store."""
+        super().__init__(auth_model, scopes, token_store=token_store)
+
+    def get_bearer(self) -> str | None:
+        """Aquire bearer token from Twitter, or return current."""
+        if not self._keys.consumer_bearer:
+            self._load_stored_bearer()
+        if not self._keys.consumer_bearer:
+            self._get_bearer_token()
+        return self._keys.consumer_bearer
+
     def _get_bearer_token(self) -> None:
         """Get bearer token for Twitter API v2, uses provided if exists."""
         # Twitter does not frequently auto-expire bearer tokens. This will not
@@ -53,18 +113,50 @@ class AppAuthClient(AuthClient):
 
         result = self._post_request(url=url, fields=fields)
 
-        if "token_type" not in result or "access_token" not in result:
-            self.logger.debug("Invalid response: %s", result)
-            raise ValueError("Unexpected Authentication response.")
-
-        self._keys.consumer_bearer = result["access_token"]
+        self._store_bearer(result)
 
     def _post_request(self, url: str, fields: dict[str, str]) -> dict[str, Any]:
         """Internal use: makes validate and invalidate calls, returns result"""
-        headers = {
-            "Content-Type": "applicaton/x-www-form-urlencoded;charset=UTF-8",
-            "Authorization": "Basic " + self._encoded_credentials(),
-        }
+        headers = self._token_headers()
         resp = self.http.post(url=url, params=fields, headers=headers)
 
         return resp.json() if resp.is_success else {}
+
+
+class AsyncAppAuthClient(_AppAuthBase, AsyncAuthClient):
+    http = LazyClient(httpx.AsyncClient)
+
+    def __init__(
+        self,
+        auth_model: ApplicationAuth,
+        scopes: list[str],
+        *,
+        token_store: TokenStore | None = None,
+    ) -> None:
+        """Provide ApplicationAuth model for authentication. Async http client."""
+        super().__init__(auth_model, scopes, token_store=token_store)
+
+    async def get_bearer(self) -> str | None:
+        """Aquire bearer token from Twitter, or return current."""
+        if not self._keys.consumer_bearer:
+            self._load_stored_bearer()
+        if not self._keys.consumer_bearer:
+            await self._get_bearer_token()
+        return self._keys.consumer_bearer
+
+    async def _get_bearer_token(self) -> None:
+        """Get bearer token for Twitter API v2, uses provided if exists."""
+        self.logger.debug("Requesting bearer token with consumer credentials")
+        url = self.twitter_api + "/oauth2/token"
+        fields = {"grant_type": "client_credentials"}
+
+        result = await self._post_request(url=url, fields=fields)
+
+        self._store_bearer(result)
+
+    async def _post_request(self, url: str, fields: dict[str, str]) -> dict[str, Any]:
+        """Internal use: makes validate and invalidate calls, returns result"""
+        headers = self._token_headers()
+        resp = await self.http.post(url=url, params=fields, headers=headers)
+
+        return resp.json() if resp.is_success else {}
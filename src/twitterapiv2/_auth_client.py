@@ -14,3 +14,15 @@ class AuthClient(abc.ABC):
     @abc.abstractmethod
     def get_bearer(self) -> str | None:
         raise NotImplementedError()
+
+
+class AsyncAuthClient(abc.ABC):
+    """Abstract for all async auth clients."""
+
+    @abc.abstractmethod
+    def __init__(self, auth_model: Any, scopes: list[str]) -> None:
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    async def get_bearer(self) -> str | None:
+        raise NotImplementedError()
@@ -5,39 +5,132 @@ https://developer.twitter.com/en/docs/authentication/oauth-2-0/authorization-cod
 """
 from __future__ import annotations
 
+import asyncio
 import base64
 import hashlib
 import logging
 import os
 import re
+import threading
+from typing import Any
+from typing import TYPE_CHECKING
 
-from authlib.integrations.httpx_client import OAuth2Client  # type: ignore  # no stubs
+from twitterapiv2._auth_client import AsyncAuthClient
 from twitterapiv2._auth_client import AuthClient
 from twitterapiv2.model.client_auth import ClientAuth
+from twitterapiv2.model.oauth_token import OAuthToken
+
+if TYPE_CHECKING:
+    from authlib.integrations.httpx_client import AsyncOAuth2Client  # type: ignore
+    from authlib.integrations.httpx_client import OAuth2Client  # type: ignore
+    from twitterapiv2.token_store import TokenStore
 
 TWITTER_AUTH = "https://twitter.com/i/oauth2/authorize"
 TWITTER_TOKEN = "https://api.twitter.com/2/oauth2/token"
 
 # TODO:
-#   track expiry on bearer token
-#   handle reauth request
 #   handle revoke request
 
 
-class UserAuthClient(AuthClient):
+class _UserAuthBase:
+    """Internal: Token state shared by sync and async user auth clients."""
+
     logger = logging.getLogger(__name__)
 
-    def __init__(self, auth_model: ClientAuth, scopes: list[str]) -> None:
-        """Provide ClientAuth model for authentication."""
+    def __init__(
+        self,
+        auth_model: ClientAuth,
+        scopes: list[str],
+        *,
+        token_store: TokenStore | None = None,
+        store_key: str | None = None,
+    ) -> None:
         self._keys = auth_model
         self._scopes = scopes
         self._bearer: str | None = None
+        self._token: OAuthToken | None = None
+        self.token_store = token_store
+        self._store_key = store_key or f"user:{auth_model.client_id}"
+
+    def _load_stored_token(self) -> None:
+        """Load token from the token store, if one is defined."""
+        if self.token_store is None:
+            return
+        token = self.token_store.load(self._store_key)
+        if token is not None:
+            self.logger.debug("Using user token from token store")
+            self._token = token
+            self._bearer = token.access_token
+
+    def _set_token(self, token: dict[str, Any]) -> None:
+        """Track a granted or refreshed token, saving it to the token store."""
+        self._token = OAuthToken.from_oauth(token)
+        self._bearer = self._token.access_token
+        if self.token_store is not None:
+            self.token_store.save(self._store_key, self._token)
+
+    def _expired_refresh_token(self) -> str | None:
+        """
+        Drop an expired token.
+
+        Returns:
+            The refresh token of the expired token, if one was granted
+        """
+        if self._token is None or not self._token.expired():
+            return None
+        self.logger.debug("User token expired")
+        refresh_token = self._token.refresh_token
+        self._token = None
+        self._bearer = None
+        return refresh_token
+
+    def _oauth2_kwargs(self) -> dict[str, Any]:
+        return {
+            "client_id": self._keys.client_id,
+            "client_secret": self._keys.client_secret,
+            "scope": self._scopes,
+            "redirect_uri": self._keys.redirect_uri,
+        }
+
+
+class UserAuthClient(_UserAuthBase, AuthClient):
+    def __init__(
+        self,
+        auth_model: ClientAuth,
+        scopes: list[str],
+        *,
+        token_store: TokenStore | None = None,
+        store_key: str | None = None,
+    ) -> None:
+        """
+        Provide ClientAuth model for authentication.
+
+        Include the `offline.access` scope to be granted a refresh token. With a
+        token store the token is reused across runs and refreshed when expired.
+        Tokens are stored under `user:<client_id>` unless a `store_key` is
+        given, users of the same app sharing a store each need their own key.
+        """
+        super().__init__(
+            auth_model, scopes, token_store=token_store, store_key=store_key
+        )
+        self._lock = threading.Lock()
 
     def get_bearer(self) -> str | None:
-        """Aquire bearer token from Twitter, or return current."""
-        if not self._bearer:
-            self._get_bearer_token()
-        return self._bearer
+        """
+        Aquire bearer token from Twitter, or return current.
+
+        Thread-safe, an expired token is refreshed (or authorized) once while
+        concurrent callers wait for the new bearer. Refresh tokens are single use.
+        """
+        with self._lock:
+            if not self._bearer:
+                self._load_stored_token()
+            refresh_token = self._expired_refresh_token()
+            if refresh_token:
+                self._refresh_bearer_token(refresh_token)
+            if not self._bearer:
+                self._get_bearer_token()
+            return self._bearer
 
     def _get_bearer_token(self) -> None:
         """Get bearer token."""
@@ -61,16 +154,26 @@ class UserAuthClient(AuthClient):
             code_verifier=code_verifier,
         )
 
-        self._bearer = token.get("access_token")
+        self._set_token(token)
+
+    def _refresh_bearer_token(self, refresh_token: str) -> None:
+        """Refresh bearer token, falls back to authorization if refresh fails."""
+        try:
+            token = self._oauth2_client().refresh_token(
+                url=TWITTER_TOKEN,
+                refresh_token=refresh_token,
+            )
+        except Exception as err:
+            self.logger.warning("Refresh of user token failed: %s", err)
+            return
+        self._set_token(token)
 
     def _oauth2_client(self) -> OAuth2Client:
         """Create oauth client."""
-        return OAuth2Client(
-            client_id=self._keys.client_id,
-            client_secret=self._keys.client_secret,
-            scope=self._scopes,
-            redirect_uri=self._keys.redirect_uri,
-        )
+        # authlib is slow to import, load it only once user auth is needed
+        from authlib.integrations.httpx_client import OAuth2Client  # type: ignore
+
+        return OAuth2Client(**self._oauth2_kwargs())
 
     @staticmethod
     def _get_authorization_response(auth_url: str) -> str:
@@ -90,3 +193,82 @@ class UserAuthClient(AuthClient):
         code_byte = hashlib.sha256(code_verifier.encode("utf-8")).digest()
         code_challenge = base64.urlsafe_b64encode(code_byte).decode("utf-8")
         return code_challenge.replace("=", "")
+
+
+class AsyncUserAuthClient(_UserAuthBase, AsyncAuthClient):
+    def __init__(
+        self,
+        auth_model: ClientAuth,
+        scopes: list[str],
+        *,
+        token_store: TokenStore | None = None,
+        store_key: str | None = None,
+    ) -> None:
+        """Provide ClientAuth model for authentication. See `UserAuthClient`."""
+        super().__init__(
+            auth_model, scopes, token_store=token_store, store_key=store_key
+        )
+        # Created on first use, within the running event loop
+        self._lock: asyncio.Lock | None = None
+
+    async def get_bearer(self) -> str | None:
+        """Aquire bearer token from Twitter, or return current. Task-safe."""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            if not self._bearer:
+                self._load_stored_token()
+            refresh_token = self._expired_refresh_token()
+            if refresh_token:
+                await self._refresh_bearer_token(refresh_token)
+            if not self._bearer:
+                await self._get_bearer_token()
+            return self._bearer
+
+    async def _get_bearer_token(self) -> None:
+        """Get bearer token."""
+        code_verifier = UserAuthClient._code_verifier()
+
+        oauth = self._oauth2_client()
+
+        auth_url, _ = oauth.create_authorization_url(
+            url=TWITTER_AUTH,
+            code_verifier=code_verifier,
+            code_challenge=UserAuthClient._code_challenge(code_verifier),
+            code_challenge_method="S256",
+        )
+
+        # input() blocks, keep the event loop free while the user authorizes
+        loop = asyncio.get_running_loop()
+        auth_response = await loop.run_in_executor(
+            None,
+            UserAuthClient._get_authorization_response,
+            auth_url,
+        )
+
+        token = await oauth.fetch_token(
+            url=TWITTER_TOKEN,
+            grant_type="authorization_code",
+            authorization_response=auth_response,
+            code_verifier=code_verifier,
+        )
+
+        self._set_token(token)
+
+    async def _refresh_bearer_token(self, refresh_token: str) -> None:
+        """Refresh bearer token, falls back to authorization if refresh fails."""
+        try:
+            token = await self._oauth2_client().refresh_token(
+                url=TWITTER_TOKEN,
+                refresh_token=refresh_token,
+            )
+        except Exception as err:
+            self.logger.warning("Refresh of user token failed: %s", err)
+            return
+        self._set_token(token)
+
+    def _oauth2_client(self) -> AsyncOAuth2Client:
+        """Create async oauth client."""
+        from authlib.integrations.httpx_client import AsyncOAuth2Client  # type: ignore
+
+        return AsyncOAuth2Client(**self._oauth2_kwargs())
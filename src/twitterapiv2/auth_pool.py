@@ -0,0 +1,276 @@
+"""
+Spread requests of one client across several credentials.
+
+    pool = AuthPool.from_models([app_one, app_two, user], SearchRecent.scopes)
+    client = SearchRecent(pool)
+
+Each credential learns its own rate limit state from response headers. Every
+request is sent with the credential that has the most remaining budget for the
+endpoint. App-only and user context credentials have separate limits on read
+endpoints, so both are used there.
+
+Endpoints acting on behalf of a user, including `/2/users/me`, are always sent
+with the one user credential of the pool acting as the user (`.user`). A token
+cannot act for another user, so these requests are never rotated.
+"""
+from __future__ import annotations
+
+import itertools
+import threading
+from collections.abc import Iterable
+from collections.abc import Sequence
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Generic
+from typing import TYPE_CHECKING
+from typing import TypeVar
+
+from twitterapiv2._appauth_client import AppAuthClient
+from twitterapiv2._appauth_client import AsyncAppAuthClient
+from twitterapiv2._auth_client import AsyncAuthClient
+from twitterapiv2._auth_client import AuthClient
+from twitterapiv2._userauth_client import AsyncUserAuthClient
+from twitterapiv2._userauth_client import UserAuthClient
+from twitterapiv2.model.application_auth import ApplicationAuth
+from twitterapiv2.model.client_auth import ClientAuth
+from twitterapiv2.rate_limit import RateLimiter
+
+if TYPE_CHECKING:
+    from twitterapiv2.token_store import TokenStore
+
+# GET endpoints without app-only access, all other methods require a user
+USER_CONTEXT_ENDPOINTS = frozenset({"GET /2/users/me"})
+
+AuthT = TypeVar("AuthT", AuthClient, AsyncAuthClient)
+
+
+def requires_user_context(url: str, method: str = "GET") -> bool:
+    """True if the endpoint cannot be requested with app-only auth."""
+    endpoint = RateLimiter.endpoint(url, method)
+    return not endpoint.startswith("GET ") or endpoint in USER_CONTEXT_ENDPOINTS
+
+
+@dataclass
+class Credential(Generic[AuthT]):
+    """An auth client of a pool and its rate limit state."""
+
+    auth_client: AuthT
+    rate_limiter: RateLimiter = field(default_factory=RateLimiter)
+    requests: int = 0
+
+    @property
+    def user_context(self) -> bool:
+        """True for OAuth2 user context, False for app-only credentials."""
+        return isinstance(self.auth_client, (UserAuthClient, AsyncUserAuthClient))
+
+    def budget(self, url: str, method: str = "GET") -> float:
+        """Requests remaining for the endpoint, infinite if never requested."""
+        return self.rate_limiter.budget(url, method)
+
+
+class _AuthPoolBase(Generic[AuthT]):
+    """Internal: Credential selection shared by sync and async pools."""
+
+    def __init__(
+        self,
+        auth_clients: Iterable[AuthT],
+        user: AuthT | None = None,
+    ) -> None:
+        self.credentials: list[Credential[AuthT]] = [
+            Credential(auth_client) for auth_client in auth_clients
+        ]
+        if not self.credentials:
+            raise ValueError("At least one credential is required.")
+        users = [
+            index
+            for index, credential in enumerate(self.credentials)
+            if credential.user_context
+            and (user is None or credential.auth_client is user)
+        ]
+        if user is not None and not users:
+            raise ValueError("User must be a user auth client of the pool.")
+        self._user_index = users[0] if users else None
+        self._order = itertools.count()
+        self._last_used: dict[int, int] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def user(self) -> Credential[AuthT]:
+        """
+        The user credential acting on behalf of the user.
+
+        Raises:
+            ValueError: The pool has no user context credential
+        """
+        if self._user_index is None:
+            raise ValueError("No user context credential in pool.")
+        return self.credentials[self._user_index]
+
+    def acquire(self, url: str, method: str = "GET") -> tuple[Credential[AuthT], float]:
+        """
+        Pick the credential with the most remaining budget and reserve a request.
+
+        Ties go to the least recently used credential. Endpoints requiring user
+        context are always sent with `.user`.
+
+        Returns:
+            The credential and seconds to wait, as paced by its rate limiter
+
+        Raises:
+            ValueError: The endpoint requires user context and the pool has none
+        """
+        if requires_user_context(url, method):
+            if self._user_index is None:
+                endpoint = RateLimiter.endpoint(url, method)
+                raise ValueError(f"No user context credential in pool for {endpoint}")
+            candidates = [(self._user_index, self.credentials[self._user_index])]
+        else:
+            candidates = list(enumerate(self.credentials))
+        with self._lock:
+            index, credential = max(
+                candidates,
+                key=lambda item: (
+                    item[1].budget(url, method),
+                    -self._last_used.get(item[0], -1),
+                ),
+            )
+            self._last_used[index] = next(self._order)
+            credential.requests += 1
+            return credential, credential.rate_limiter.delay(url, method)
+
+
+class AuthPool(_AuthPoolBase[AuthClient], AuthClient):
+    """Pool of auth clients, used in place of a single auth client."""
+
+    def __init__(
+        self,
+        auth_clients: Iterable[AuthClient],
+        user: AuthClient | None = None,
+    ) -> None:
+        """
+        Create a pool of any mix of app and user auth clients.
+
+        Args:
+            auth_clients: Credentials of the pool
+            user: User auth client acting on behalf of the user, defaults to the
+                first user auth client of the pool
+        """
+        super().__init__(auth_clients, user)
+
+    @classmethod
+    def from_models(
+        cls,
+        auth_models: Iterable[ApplicationAuth | ClientAuth],
+        scopes: list[str],
+        *,
+        token_store: TokenStore | None = None,
+        store_keys: Sequence[str | None] | None = None,
+    ) -> AuthPool:
+        """
+        Build a pool with an auth client per auth model.
+
+        Args:
+            auth_models: App and user credentials, the first user acts as `.user`
+            scopes: Scopes requested by user credentials
+            token_store: Store of the tokens of every credential
+            store_keys: Token store key per auth model, in order, used by user
+                credentials (None: default key). Users of the same app sharing
+                a token store need their own keys
+
+        Raises:
+            ValueError: Unknown auth model, or users sharing a token store key
+        """
+        auth_clients: list[AuthClient] = []
+        users: list[UserAuthClient] = []
+        for model, store_key in _with_store_keys(auth_models, store_keys):
+            if isinstance(model, ApplicationAuth):
+                auth_clients.append(
+                    AppAuthClient(model, scopes, token_store=token_store)
+                )
+            elif isinstance(model, ClientAuth):
+                users.append(
+                    UserAuthClient(
+                        model, scopes, token_store=token_store, store_key=store_key
+                    )
+                )
+                auth_clients.append(users[-1])
+            else:
+                raise ValueError(f"Unknown auth model type: {type(model).__name__}")
+        if token_store is not None:
+            _check_store_keys([user._store_key for user in users])
+        return cls(auth_clients)
+
+    def get_bearer(self) -> str | None:
+        """Bearer of the first credential, requests of clients pick per endpoint."""
+        return self.credentials[0].auth_client.get_bearer()
+
+
+class AsyncAuthPool(_AuthPoolBase[AsyncAuthClient], AsyncAuthClient):
+    """Pool of async auth clients, used in place of a single auth client."""
+
+    def __init__(
+        self,
+        auth_clients: Iterable[AsyncAuthClient],
+        user: AsyncAuthClient | None = None,
+    ) -> None:
+        """Create a pool of async app and user auth clients. See `AuthPool`."""
+        super().__init__(auth_clients, user)
+
+    @classmethod
+    def from_models(
+        cls,
+        auth_models: Iterable[ApplicationAuth | ClientAuth],
+        scopes: list[str],
+        *,
+        token_store: TokenStore | None = None,
+        store_keys: Sequence[str | None] | None = None,
+    ) -> AsyncAuthPool:
+        """Build a pool with an async auth client per auth model. See `AuthPool`."""
+        auth_clients: list[AsyncAuthClient] = []
+        users: list[AsyncUserAuthClient] = []
+        for model, store_key in _with_store_keys(auth_models, store_keys):
+            if isinstance(model, ApplicationAuth):
+                auth_clients.append(
+                    AsyncAppAuthClient(model, scopes, token_store=token_store)
+                )
+            elif isinstance(model, ClientAuth):
+                users.append(
+                    AsyncUserAuthClient(
+                        model, scopes, token_store=token_store, store_key=store_key
+                    )
+                )
+                auth_clients.append(users[-1])
+            else:
+                raise ValueError(f"Unknown auth model type: {type(model).__name__}")
+        if token_store is not None:
+            _check_store_keys([user._store_key for user in users])
+        return cls(auth_clients)
+
+    async def get_bearer(self) -> str | None:
+        """Bearer of the first credential, requests of clients pick per endpoint."""
+        return await self.credentials[0].auth_client.get_bearer()
+
+
+def _with_store_keys(
+    auth_models: Iterable[ApplicationAuth | ClientAuth],
+    store_keys: Sequence[str | None] | None,
+) -> list[tuple[ApplicationAuth | ClientAuth, str | None]]:
+    """Pair auth models with their token store key, None for the default key."""
+    models = list(auth_models)
+    if store_keys is None:
+        return [(model, None) for model in models]
+    if len(store_keys) != len(models):
+        raise ValueError("store_keys must hold one key per auth model.")
+    return list(zip(models, store_keys))
+
+
+def _check_store_keys(store_keys: list[str]) -> None:
+    """Raise ValueError if user credentials would share a token store key."""
+    seen: set[str] = set()
+    for store_key in store_keys:
+        if store_key in seen:
+            raise ValueError(
+                f"Users share the token store key '{store_key}', give each user "
+                "its own key with store_keys."
+            )
+        seen.add(store_key)
@@ -0,0 +1,192 @@
+"""
+Pluggable response caches for GET requests of client classes.
+
+Assign a cache to a client's `.cache` to reuse decoded responses of identical
+requests. Responses of `/2/users/me` are keyed by the credential of the user,
+all other responses are shared by every client using the cache.
+"""
+from __future__ import annotations
+
+import abc
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from collections.abc import Mapping
+from contextlib import suppress
+from dataclasses import dataclass
+from typing import Any
+from urllib.parse import urlencode
+
+# Field parameters holding comma separated lists where order has no meaning
+UNORDERED_SUFFIXES = (".fields", "expansions")
+
+
+def cache_key(url: str, params: Mapping[str, Any]) -> str:
+    """
+    Canonical key of a GET request.
+
+    Parameters are sorted by name and comma separated field lists sorted by value,
+    so equal queries built in any order share a key.
+    """
+    canonical = []
+    for name in sorted(params):
+        value = params[name]
+        if name.endswith(UNORDERED_SUFFIXES) and isinstance(value, str):
+            value = ",".join(sorted(value.split(",")))
+        canonical.append((name, value))
+    return f"{url}?{urlencode(canonical)}"
+
+
+@dataclass
+class CacheStats:
+    """Hit and miss counters of a response cache."""
+
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Ratio of lookups served from the cache, 0.0 before any lookup."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class ResponseCache(abc.ABC):
+    """Abstract for all response caches. Entries expire after `ttl` seconds."""
+
+    def __init__(self, ttl: float, clock: Callable[[], float] = time.time) -> None:
+        self.ttl = ttl
+        self.stats = CacheStats()
+        self._clock = clock
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any | None:
+        """Return cached response of key, None if missing or expired."""
+        with self._lock:
+            value = self._load(key, self._clock())
+            if value is None:
+                self.stats.misses += 1
+            else:
+                self.stats.hits += 1
+            return value
+
+    def set(self, key: str, value: Any) -> None:  # noqa: A003
+        """Cache a decoded response."""
+        with self._lock:
+            self._store(key, value, self._clock() + self.ttl)
+
+    @abc.abstractmethod
+    def clear(self) -> None:
+        """Remove all entries."""
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def _load(self, key: str, now: float) -> Any | None:
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def _store(self, key: str, value: Any, expires: float) -> None:
+        raise NotImplementedError()
+
+
+class MemoryCache(ResponseCache):
+    """In-memory LRU cache with TTL expiry."""
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: float = 300.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Create in-memory cache.
+
+        Args:
+            maxsize: Number of responses held before least recently used are evicted
+            ttl: Seconds a response remains valid
+            clock: Source of the current epoch time, in seconds
+        """
+        super().__init__(ttl, clock)
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def _load(self, key: str, now: float) -> Any | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= now:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def _store(self, key: str, value: Any, expires: float) -> None:
+        self._entries[key] = (expires, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+
+class FileCache(ResponseCache):
+    """On-disk cache, one JSON file per response. Survives process restarts."""
+
+    def __init__(
+        self,
+        directory: str,
+        ttl: float = 3600.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Create on-disk cache.
+
+        Args:
+            directory: Directory for cache files, created if missing
+            ttl: Seconds a response remains valid
+            clock: Source of the current epoch time, in seconds
+        """
+        super().__init__(ttl, clock)
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            for filename in os.listdir(self.directory):
+                if filename.endswith(".json"):
+                    os.remove(os.path.join(self.directory, filename))
+
+    def _path(self, key: str) -> str:
+        digest = hashlib.sha256(key.encode()).hexdigest()
+        return os.path.join(self.directory, f"{digest}.json")
+
+    def _load(self, key: str, now: float) -> Any | None:
+        path = self._path(key)
+        try:
+            with open(path, encoding="utf-8") as infile:
+                entry = json.load(infile)
+        except (OSError, ValueError):
+            return None
+        if entry["expires"] <= now:
+            with suppress(OSError):
+                os.remove(path)
+            return None
+        return entry["value"]
+
+    def _store(self, key: str, value: Any, expires: float) -> None:
+        path = self._path(key)
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as outfile:
+            json.dump({"expires": expires, "value": value}, outfile)
+        os.replace(temp_path, path)
@@ -0,0 +1,134 @@
+"""
+Persistent checkpoint stores for incremental, resumable polling of searches.
+
+Assign a store to a search client's `.checkpoint_store`. Each fetch then
+requests only tweets newer than the last completed run (`since_id`) and
+resumes an interrupted run from its saved `next_token`.
+"""
+from __future__ import annotations
+
+import abc
+import json
+import os
+import sqlite3
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from twitterapiv2.model.checkpoint import Checkpoint
+
+
+class CheckpointStore(abc.ABC):
+    """Abstract for all checkpoint stores. Checkpoints are saved by query key."""
+
+    @abc.abstractmethod
+    def load(self, key: str) -> Checkpoint | None:
+        """Return stored checkpoint of key, None if not stored."""
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def save(self, key: str, checkpoint: Checkpoint) -> None:
+        """Store checkpoint under key, replacing any existing checkpoint."""
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove checkpoint of key, if stored."""
+        raise NotImplementedError()
+
+
+class FileCheckpointStore(CheckpointStore):
+    """Store checkpoints in a JSON file."""
+
+    def __init__(self, path: str) -> None:
+        """Provide path of the JSON file. Created on first save."""
+        self.path = path
+        self._lock = threading.Lock()
+
+    def load(self, key: str) -> Checkpoint | None:
+        """Return stored checkpoint of key, None if not stored."""
+        with self._lock:
+            checkpoint = self._read().get(key)
+        return Checkpoint(**checkpoint) if checkpoint else None
+
+    def save(self, key: str, checkpoint: Checkpoint) -> None:
+        """Store checkpoint under key, replacing any existing checkpoint."""
+        with self._lock:
+            checkpoints = self._read()
+            checkpoints[key] = checkpoint.to_dict()
+            self._write(checkpoints)
+
+    def delete(self, key: str) -> None:
+        """Remove checkpoint of key, if stored."""
+        with self._lock:
+            checkpoints = self._read()
+            if checkpoints.pop(key, None) is not None:
+                self._write(checkpoints)
+
+    def _read(self) -> dict[str, dict[str, Any]]:
+        try:
+            with open(self.path, encoding="utf-8") as infile:
+                return json.load(infile)
+        except FileNotFoundError:
+            return {}
+
+    def _write(self, checkpoints: dict[str, dict[str, Any]]) -> None:
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as outfile:
+            json.dump(checkpoints, outfile)
+        os.replace(temp_path, self.path)
+
+
+class SQLiteCheckpointStore(CheckpointStore):
+    """Store checkpoints in a SQLite database, safe to share between processes."""
+
+    def __init__(self, path: str) -> None:
+        """Provide path of the SQLite database. Created if missing."""
+        self.path = path
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS checkpoints ("
+                "key TEXT PRIMARY KEY, "
+                "newest_id TEXT, "
+                "next_token TEXT, "
+                "pending_newest_id TEXT)"
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection for one transaction, committed and closed on exit."""
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def load(self, key: str) -> Checkpoint | None:
+        """Return stored checkpoint of key, None if not stored."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT newest_id, next_token, pending_newest_id "
+                "FROM checkpoints WHERE key = ?",
+                (key,),
+            ).fetchone()
+        return Checkpoint(*row) if row else None
+
+    def save(self, key: str, checkpoint: Checkpoint) -> None:
+        """Store checkpoint under key, replacing any existing checkpoint."""
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO checkpoints VALUES (?, ?, ?, ?)",
+                (
+                    key,
+                    checkpoint.newest_id,
+                    checkpoint.next_token,
+                    checkpoint.pending_newest_id,
+                ),
+            )
+
+    def delete(self, key: str) -> None:
+        """Remove checkpoint of key, if stored."""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM checkpoints WHERE key = ?", (key,))
@@ -1,41 +1,73 @@
 """Core class inherited by client classes."""
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import logging
+import threading
+import time
+from collections.abc import Callable
 from datetime import datetime
 from typing import Any
+from typing import TYPE_CHECKING
+from typing import TypeVar
 
 import httpx
 from twitterapiv2._appauth_client import AppAuthClient
+from twitterapiv2._appauth_client import AsyncAppAuthClient
+from twitterapiv2._auth_client import AsyncAuthClient
 from twitterapiv2._auth_client import AuthClient
+from twitterapiv2._userauth_client import AsyncUserAuthClient
 from twitterapiv2._userauth_client import UserAuthClient
+from twitterapiv2.auth_pool import AsyncAuthPool
+from twitterapiv2.auth_pool import AuthPool
+from twitterapiv2.cache import cache_key
+from twitterapiv2.cache import ResponseCache
 from twitterapiv2.exceptions import InvalidResponseError
 from twitterapiv2.exceptions import ThrottledError
 from twitterapiv2.fields import Fields
+from twitterapiv2.http_pool import HttpPool
+from twitterapiv2.http_pool import LazyClient
+from twitterapiv2.metrics import RequestMetrics
 from twitterapiv2.model.application_auth import ApplicationAuth
 from twitterapiv2.model.client_auth import ClientAuth
 from twitterapiv2.model.user_ref import UserRef
+from twitterapiv2.rate_limit import RateLimiter
+from twitterapiv2.retry import RetryPolicy
+from twitterapiv2.util.json_decoder import default_decoder
 
+if TYPE_CHECKING:
+    from twitterapiv2.model.cursor import Cursor
+    from twitterapiv2.model.query_spec import QuerySpec
+    from twitterapiv2.token_store import TokenStore
+    from twitterapiv2.util.json_decoder import JSONDecoder
+
+URL_USER_ME = "https://api.twitter.com/2/users/me"
+
+logger = logging.getLogger(__name__)
+
+ClientT = TypeVar("ClientT", bound="ClientCore")
+AsyncClientT = TypeVar("AsyncClientT", bound="AsyncClientCore")
+
+
+class ClientBase:
+    """Internal: Query fields, pagination, and response state for all clients."""
 
-class ClientCore:
     scopes: list[str] = []
 
-    def __init__(self, auth_client: AuthClient) -> None:
-        """Define a ClientCore, contains `.field_builder()` and http client."""
-        self.http = httpx.Client()
+    def __init__(self) -> None:
         self.field_builder = Fields()
-        self.auth_client = auth_client
         self._last_response: httpx.Response | None = None
         self._next_token: str | None = None
-
-    @classmethod
-    def from_model(cls, auth_model: ApplicationAuth | ClientAuth) -> ClientCore:
-        """Build with auth client respective of auth model provided."""
-        if isinstance(auth_model, ApplicationAuth):
-            return cls(AppAuthClient(auth_model, ClientCore.scopes))
-        elif isinstance(auth_model, ClientAuth):
-            return cls(UserAuthClient(auth_model, ClientCore.scopes))
-        else:
-            raise ValueError(f"Unknown auth model type: {type(auth_model).__name__}")
+        self.rate_limiter: RateLimiter | None = None
+        self.retry_policy: RetryPolicy | None = None
+        self.retries = 0
+        self.hooks: list[Callable[[RequestMetrics], None]] = []
+        self._page_depth = 0
+        self.cache: ResponseCache | None = None
+        self.decoder: JSONDecoder = default_decoder()
+        self._last_content: bytes | None = None
+        self._lock = threading.Lock()
 
     @property
     def limit_remaining(self) -> int:
@@ -59,42 +91,354 @@ class ClientCore:
         fields["next_token"] = self._next_token
         return {key: value for key, value in fields.items() if value}
 
+    @property
+    def last_content(self) -> bytes | None:
+        """Raw body of the last GET response, None if served from `.cache`."""
+        return self._last_content
+
     @property
     def more(self) -> bool:
         """True if more pages exist, default is False."""
         return bool(self._next_token)
 
+    def raise_on_response(self, url: str, resp: httpx.Response) -> None:
+        """
+        Custom handling for Twitter status codes.
+
+        Args:
+            url: url response came from
+            resp: Response object
+
+        Returns:
+            None
+        """
+        if resp.status_code == 429:
+            rst = resp.headers.get("x-rate-limit-reset", "unknown")
+            raise ThrottledError(f"Throttled until '{rst}'")
+        if not (200 <= resp.status_code < 300):
+            raise InvalidResponseError(f"{resp.status_code}: {url} - '{resp.text}")
+
+    def _throttled(
+        self,
+        limiter: RateLimiter | None,
+        url: str,
+        method: str,
+        resp: httpx.Response,
+        waits: int,
+    ) -> bool:
+        """
+        Feed response to the rate limiter, True if a 429 should be waited out.
+
+        A request already throttled `.max_throttle_waits` times is not resent.
+        """
+        if limiter is None:
+            return False
+        limiter.update(url, resp, method)
+        return resp.status_code == 429 and waits < limiter.max_throttle_waits
+
+    def _retry_delay(
+        self,
+        method: str,
+        retries: int,
+        *,
+        resp: httpx.Response | None = None,
+        error: Exception | None = None,
+    ) -> float | None:
+        """Seconds to wait before resending a failed request, None to not retry."""
+        if self.retry_policy is None:
+            return None
+        delay = self.retry_policy.next_delay(method, retries, resp=resp, error=error)
+        if delay is not None:
+            with self._lock:
+                self.retries += 1
+        return delay
+
+    def _decode(self, resp: httpx.Response) -> Any:
+        """Decode JSON body of a response with `.decoder`."""
+        return self.decoder(resp.content)
+
+    def _finish(
+        self,
+        method: str,
+        url: str,
+        resp: httpx.Response,
+        *,
+        latency: float,
+        retries: int,
+        page_depth: int,
+        track: bool,
+    ) -> Any:
+        """
+        Raise on error status or decode the body, reporting to `.hooks`.
+
+        A tracked response becomes the last response of the client, read by
+        `.limit_remaining` and `.limit_reset`.
+        """
+        if track:
+            self._last_response = resp
+        json_body = None
+        decode_time = 0.0
+        try:
+            self.raise_on_response(url, resp)
+            started = time.perf_counter()
+            json_body = self._decode(resp)
+            decode_time = time.perf_counter() - started
+        finally:
+            self._report_attempt(
+                method,
+                url,
+                resp,
+                latency=latency,
+                retries=retries,
+                page_depth=page_depth,
+                decode_time=decode_time,
+            )
+        return json_body
+
+    def _report_attempt(
+        self,
+        method: str,
+        url: str,
+        resp: httpx.Response | None,
+        *,
+        latency: float,
+        retries: int,
+        page_depth: int,
+        decode_time: float = 0.0,
+        retried: bool = False,
+        error: Exception | None = None,
+    ) -> None:
+        """Report one attempt of a request to `.hooks`, resp is None on error."""
+        if not self.hooks:
+            return
+        self._report(
+            RequestMetrics(
+                endpoint=RateLimiter.endpoint(url, method),
+                status=resp.status_code if resp is not None else 0,
+                latency=latency,
+                response_bytes=len(resp.content) if resp is not None else 0,
+                decode_time=decode_time,
+                limit_remaining=_limit_remaining(resp) if resp is not None else None,
+                page_depth=page_depth,
+                retries=retries,
+                retried=retried,
+                error=type(error).__name__ if error is not None else None,
+            )
+        )
+
+    def _report(self, metrics: RequestMetrics) -> None:
+        """Send metrics to each hook, a failing hook does not fail the request."""
+        for hook in self.hooks:
+            try:
+                hook(metrics)
+            except Exception:
+                logger.exception("Request metrics hook %r failed", hook)
+
+    def _next_page_depth(self, params: dict[str, Any]) -> int:
+        """Pagination depth of a GET request, 1 unless continuing a query."""
+        token = params.get("next_token") or params.get("pagination_token")
+        return self._page_depth + 1 if token else 1
+
+    def _from_cache(self, url: str, params: dict[str, Any] | str) -> Any | None:
+        """Return cached response of a GET request, None on miss or no cache."""
+        if self.cache is None:
+            return None
+        return self.cache.get(_request_key(url, params))
+
+    def _to_cache(self, url: str, params: dict[str, Any] | str, json_body: Any) -> None:
+        """Store response of a GET request in the cache, if one is defined."""
+        if self.cache is not None:
+            self.cache.set(_request_key(url, params), json_body)
+
+    def _handle_page(self, json_body: Any) -> Any:
+        """Capture the pagination token of a GET response, return the body."""
+        meta = json_body.get("meta")
+        self._next_token = meta.get("next_token") if meta else None
+        return json_body
+
+
+class ClientCore(ClientBase):
+    http = LazyClient(httpx.Client)
+
+    def __init__(self, auth_client: AuthClient) -> None:
+        """Define a ClientCore, contains `.field_builder()` and http client."""
+        super().__init__()
+        self.auth_client = auth_client
+
+    @classmethod
+    def from_model(
+        cls: type[ClientT],
+        auth_model: ApplicationAuth | ClientAuth,
+        *,
+        pool: HttpPool | None = None,
+        token_store: TokenStore | None = None,
+        store_key: str | None = None,
+    ) -> ClientT:
+        """
+        Build with auth client respective of auth model provided.
+
+        `store_key` names the token of a ClientAuth model in the token store,
+        see `UserAuthClient`.
+        """
+        auth_client: AuthClient
+        if isinstance(auth_model, ApplicationAuth):
+            auth_client = AppAuthClient(auth_model, cls.scopes, token_store=token_store)
+        elif isinstance(auth_model, ClientAuth):
+            auth_client = UserAuthClient(
+                auth_model,
+                cls.scopes,
+                token_store=token_store,
+                store_key=store_key,
+            )
+        else:
+            raise ValueError(f"Unknown auth model type: {type(auth_model).__name__}")
+        client = cls(auth_client)
+        if pool is not None:
+            client.use_pool(pool)
+        return client
+
+    def use_pool(self, pool: HttpPool) -> None:
+        """Send requests, including app bearer token requests, through the pool."""
+        self.http = pool.client
+        auth_clients: list[AuthClient] = [self.auth_client]
+        if isinstance(self.auth_client, AuthPool):
+            auth_clients = [cred.auth_client for cred in self.auth_client.credentials]
+        for auth_client in auth_clients:
+            if isinstance(auth_client, AppAuthClient):
+                auth_client.http = pool.client
+
     @property
     def headers(self) -> dict[str, str]:
         """Build headers with TW_BEARER_TOKEN from environ."""
         return {"Authorization": f"Bearer {self.auth_client.get_bearer()}"}
 
+    def _route(
+        self,
+        url: str,
+        method: str,
+    ) -> tuple[RateLimiter | None, dict[str, str]]:
+        """
+        Wait for the rate limit of a request, return its limiter and headers.
+
+        With an AuthPool, the credential with the most remaining budget for the
+        endpoint is used along with its own rate limiter.
+        """
+        if isinstance(self.auth_client, AuthPool):
+            credential, delay = self.auth_client.acquire(url, method)
+            if delay > 0:
+                time.sleep(delay)
+            bearer = credential.auth_client.get_bearer()
+            return credential.rate_limiter, {"Authorization": f"Bearer {bearer}"}
+        if self.rate_limiter is not None:
+            self.rate_limiter.wait(url, method)
+        return self.rate_limiter, self.headers
+
     def get_user(self) -> UserRef:
-        """Return the authenticated user's profile."""
-        result = self.get("https://api.twitter.com/2/users/me")
-        return UserRef(**result.json()["data"])
+        """
+        Return the authenticated user's profile.
+
+        Served from `.cache` if defined, keyed by the credential of the user. With
+        an AuthPool, the profile is of the pool's `.user`.
+        """
+        auth_client = self.auth_client
+        if isinstance(auth_client, AuthPool):
+            auth_client = auth_client.user.auth_client
+        key = _user_key(auth_client.get_bearer())
+        result = self._from_cache(key, {})
+        if result is None:
+            _, result = self._request("get", URL_USER_ME, page_depth=1, params={})
+            self._to_cache(key, {}, result)
+        return UserRef(**result["data"])
 
-    def get(self, url: str) -> Any:
+    def get(self, url: str, params: dict[str, Any] | None = None) -> Any:
         """
         Send GET request to url with defined fields encoded into URL.
 
         Args:
             url: Target Twitter API URL
+            params: Query parameters to send in place of the defined fields
 
         Returns:
             JSON response as Any
         """
-        self._last_response = self.http.get(
-            url=url,
-            params=self.fields,
-            headers=self.headers,
+        params = self.fields if params is None else params
+        page_depth = self._next_page_depth(params)
+        json_body = self._get_json(url, params, page_depth=page_depth)
+        self._page_depth = page_depth
+        return self._handle_page(json_body)
+
+    def get_prepared(self, spec: QuerySpec) -> Any:
+        """
+        Send GET request of a prepared query, the defined fields are ignored.
+
+        Pagination is handled internally as with `.get()`, the `next_token` of
+        the client is applied to the pre-encoded query string of the spec.
+        """
+        page_depth = self._next_page_depth({"next_token": self._next_token})
+        query = spec.query_string(self._next_token)
+        json_body = self._get_json(spec.url, query, page_depth=page_depth)
+        self._page_depth = page_depth
+        return self._handle_page(json_body)
+
+    def fetch_page(self, cursor: Cursor) -> Any:
+        """
+        Fetch the next page of a cursor, only the cursor is advanced.
+
+        Thread-safe, the pagination and response state of each query is kept
+        by its cursor while the connection pool, `.rate_limiter`, and `.cache`
+        of the client are shared.
+
+        Raises:
+            ValueError: The cursor has no more pages
+        """
+        if cursor.done:
+            raise ValueError("Cursor has no more pages.")
+        query = cursor.spec.query_string(cursor.next_token)
+        resp, page = self._get_response(
+            cursor.spec.url, query, page_depth=cursor.pages + 1
         )
-        self.raise_on_response(url, self._last_response)
-        json_body = self._last_response.json()
-        meta = json_body.get("meta")
-        self._next_token = meta.get("next_token") if meta else None
+        cursor.advance(page, resp)
+        return page
+
+    def _get_json(
+        self,
+        url: str,
+        params: dict[str, Any] | str,
+        page_depth: int = 1,
+    ) -> Any:
+        """
+        GET request served from `.cache` if defined, pagination is untouched.
+
+        `params` is either a dictionary or a pre-encoded query string.
+        """
+        resp, json_body = self._get_response(
+            url, params, page_depth=page_depth, track=True
+        )
+        self._last_content = None if resp is None else resp.content
         return json_body
 
+    def _get_response(
+        self,
+        url: str,
+        params: dict[str, Any] | str,
+        page_depth: int = 1,
+        *,
+        track: bool = False,
+    ) -> tuple[httpx.Response | None, Any]:
+        """
+        GET request served from `.cache` (response is None) if defined.
+
+        Stateless unless `track` is set, see `._request()`.
+        """
+        json_body = self._from_cache(url, params)
+        if json_body is not None:
+            return None, json_body
+        resp, json_body = self._request(
+            "get", url, page_depth=page_depth, track=track, params=params
+        )
+        self._to_cache(url, params, json_body)
+        return resp, json_body
+
     def post(self, url: str, json: dict[str, Any]) -> Any:
         """
         Send POST request to url with defined fields encoded into URL.
@@ -106,9 +450,7 @@ class ClientCore:
         Returns:
             JSON response as Any
         """
-        self._last_response = self.http.post(url=url, headers=self.headers, json=json)
-        self.raise_on_response(url, self._last_response)
-        return self._last_response.json()
+        return self._request("post", url, json=json)[1]
 
     def delete(self, url: str) -> Any:
         """
@@ -120,23 +462,372 @@ class ClientCore:
         Returns:
             JSON response as Any
         """
-        self._last_response = self.http.delete(url=url, headers=self.headers)
-        self.raise_on_response(url, self._last_response)
-        return self._last_response.json()
+        return self._request("delete", url)[1]
 
-    def raise_on_response(self, url: str, resp: httpx.Response) -> None:
+    def _request(
+        self,
+        method: str,
+        url: str,
+        *,
+        page_depth: int = 0,
+        track: bool = True,
+        **kwargs: Any,
+    ) -> tuple[httpx.Response, Any]:
         """
-        Custom handling for Twitter status codes.
+        Send request, waiting on the `.rate_limiter` when one is defined.
+
+        Throttled (429) responses are waited out and resent when a rate limiter
+        is defined, up to its `.max_throttle_waits` times, otherwise raise
+        ThrottledError. Transient failures are resent as allowed by the
+        `.retry_policy` when one is defined. Each attempt is reported to `.hooks`.
+
+        With an AuthPool as auth client, each attempt is sent with the credential
+        of the most remaining budget, waiting on its own rate limiter.
+
+        Unless `track` is False the response is kept as the last response of the
+        client for `.limit_remaining`, concurrent cursor fetches do not track.
+
+        Returns:
+            The response and its decoded JSON body
+        """
+        send = getattr(self.http, method)
+        retries = 0
+        throttled = 0
+        while True:
+            limiter, headers = self._route(url, method)
+            started = time.perf_counter()
+            try:
+                resp: httpx.Response = send(url=url, headers=headers, **kwargs)
+            except Exception as err:
+                latency = time.perf_counter() - started
+                delay = self._retry_delay(method, retries, error=err)
+                self._report_attempt(
+                    method,
+                    url,
+                    None,
+                    latency=latency,
+                    retries=retries,
+                    page_depth=page_depth,
+                    retried=delay is not None,
+                    error=err,
+                )
+                if delay is None:
+                    raise
+            else:
+                latency = time.perf_counter() - started
+                if self._throttled(limiter, url, method, resp, throttled):
+                    self._report_attempt(
+                        method,
+                        url,
+                        resp,
+                        latency=latency,
+                        retries=retries,
+                        page_depth=page_depth,
+                    )
+                    throttled += 1
+                    continue
+                delay = self._retry_delay(method, retries, resp=resp)
+                if delay is None:
+                    break
+                self._report_attempt(
+                    method,
+                    url,
+                    resp,
+                    latency=latency,
+                    retries=retries,
+                    page_depth=page_depth,
+                    retried=True,
+                )
+            retries += 1
+            time.sleep(delay)
+        json_body = self._finish(
+            method,
+            url,
+            resp,
+            latency=latency,
+            retries=retries,
+            page_depth=page_depth,
+            track=track,
+        )
+        return resp, json_body
+
+
+class AsyncClientCore(ClientBase):
+    http = LazyClient(httpx.AsyncClient)
+
+    def __init__(self, auth_client: AsyncAuthClient) -> None:
+        """Define an AsyncClientCore, contains `.field_builder()` and http client."""
+        super().__init__()
+        self.auth_client = auth_client
+
+    @classmethod
+    def from_model(
+        cls: type[AsyncClientT],
+        auth_model: ApplicationAuth | ClientAuth,
+        *,
+        pool: HttpPool | None = None,
+        token_store: TokenStore | None = None,
+        store_key: str | None = None,
+    ) -> AsyncClientT:
+        """Build with async auth client respective of auth model provided."""
+        auth_client: AsyncAuthClient
+        if isinstance(auth_model, ApplicationAuth):
+            auth_client = AsyncAppAuthClient(
+                auth_model,
+                cls.scopes,
+                token_store=token_store,
+            )
+        elif isinstance(auth_model, ClientAuth):
+            auth_client = AsyncUserAuthClient(
+                auth_model,
+                cls.scopes,
+                token_store=token_store,
+                store_key=store_key,
+            )
+        else:
+            raise ValueError(f"Unknown auth model type: {type(auth_model).__name__}")
+        client = cls(auth_client)
+        if pool is not None:
+            client.use_pool(pool)
+        return client
+
+    def use_pool(self, pool: HttpPool) -> None:
+        """Send requests, including app bearer token requests, through the pool."""
+        self.http = pool.async_client
+        auth_clients: list[AsyncAuthClient] = [self.auth_client]
+        if isinstance(self.auth_client, AsyncAuthPool):
+            auth_clients = [cred.auth_client for cred in self.auth_client.credentials]
+        for auth_client in auth_clients:
+            if isinstance(auth_client, AsyncAppAuthClient):
+                auth_client.http = pool.async_client
+
+    async def headers(self) -> dict[str, str]:
+        """Build headers with bearer token of the auth client."""
+        return {"Authorization": f"Bearer {await self.auth_client.get_bearer()}"}
+
+    async def _route(
+        self,
+        url: str,
+        method: str,
+    ) -> tuple[RateLimiter | None, dict[str, str]]:
+        """Wait for the rate limit of a request. See `ClientCore._route()`."""
+        if isinstance(self.auth_client, AsyncAuthPool):
+            credential, delay = self.auth_client.acquire(url, method)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            bearer = await credential.auth_client.get_bearer()
+            return credential.rate_limiter, {"Authorization": f"Bearer {bearer}"}
+        if self.rate_limiter is not None:
+            await self.rate_limiter.async_wait(url, method)
+        return self.rate_limiter, await self.headers()
+
+    async def get_user(self) -> UserRef:
+        """Return the authenticated user's profile. See `ClientCore.get_user()`."""
+        auth_client = self.auth_client
+        if isinstance(auth_client, AsyncAuthPool):
+            auth_client = auth_client.user.auth_client
+        key = _user_key(await auth_client.get_bearer())
+        result = self._from_cache(key, {})
+        if result is None:
+            _, result = await self._request("get", URL_USER_ME, page_depth=1, params={})
+            self._to_cache(key, {}, result)
+        return UserRef(**result["data"])
+
+    async def get(self, url: str, params: dict[str, Any] | None = None) -> Any:
+        """
+        Send GET request to url with defined fields encoded into URL.
 
         Args:
-            url: url response came from
-            resp: Response object
+            url: Target Twitter API URL
+            params: Query parameters to send in place of the defined fields
 
         Returns:
-            None
+            JSON response as Any
         """
-        if resp.status_code == 429:
-            rst = resp.headers["x-rate-limit-reset"]
-            raise ThrottledError(f"Throttled until '{rst}'")
-        if not (200 <= resp.status_code < 300):
-            raise InvalidResponseError(f"{resp.status_code}: {url} - '{resp.text}")
+        params = self.fields if params is None else params
+        page_depth = self._next_page_depth(params)
+        json_body = await self._get_json(url, params, page_depth=page_depth)
+        self._page_depth = page_depth
+        return self._handle_page(json_body)
+
+    async def get_prepared(self, spec: QuerySpec) -> Any:
+        """Send GET request of a prepared query. See `ClientCore.get_prepared()`."""
+        page_depth = self._next_page_depth({"next_token": self._next_token})
+        query = spec.query_string(self._next_token)
+        json_body = await self._get_json(spec.url, query, page_depth=page_depth)
+        self._page_depth = page_depth
+        return self._handle_page(json_body)
+
+    async def fetch_page(self, cursor: Cursor) -> Any:
+        """
+        Fetch the next page of a cursor, only the cursor is advanced.
+
+        Safe to run concurrently for many cursors. See `ClientCore.fetch_page()`.
+        """
+        if cursor.done:
+            raise ValueError("Cursor has no more pages.")
+        query = cursor.spec.query_string(cursor.next_token)
+        resp, page = await self._get_response(
+            cursor.spec.url, query, page_depth=cursor.pages + 1
+        )
+        cursor.advance(page, resp)
+        return page
+
+    async def _get_json(
+        self,
+        url: str,
+        params: dict[str, Any] | str,
+        page_depth: int = 1,
+    ) -> Any:
+        """
+        GET request served from `.cache` if defined, pagination is untouched.
+
+        `params` is either a dictionary or a pre-encoded query string.
+        """
+        resp, json_body = await self._get_response(
+            url, params, page_depth=page_depth, track=True
+        )
+        self._last_content = None if resp is None else resp.content
+        return json_body
+
+    async def _get_response(
+        self,
+        url: str,
+        params: dict[str, Any] | str,
+        page_depth: int = 1,
+        *,
+        track: bool = False,
+    ) -> tuple[httpx.Response | None, Any]:
+        """
+        GET request served from `.cache` (response is None) if defined.
+
+        Stateless unless `track` is set, see `._request()`.
+        """
+        json_body = self._from_cache(url, params)
+        if json_body is not None:
+            return None, json_body
+        resp, json_body = await self._request(
+            "get", url, page_depth=page_depth, track=track, params=params
+        )
+        self._to_cache(url, params, json_body)
+        return resp, json_body
+
+    async def post(self, url: str, json: dict[str, Any]) -> Any:
+        """
+        Send POST request to url with defined fields encoded into URL.
+
+        Args:
+            url: Target Twitter API URL
+            json: JSON body to send
+
+        Returns:
+            JSON response as Any
+        """
+        return (await self._request("post", url, json=json))[1]
+
+    async def delete(self, url: str) -> Any:
+        """
+        Send DELETE request to url with defined fields encoded into URL.
+
+        Args:
+            url: Target Twitter API URL
+
+        Returns:
+            JSON response as Any
+        """
+        return (await self._request("delete", url))[1]
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        *,
+        page_depth: int = 0,
+        track: bool = True,
+        **kwargs: Any,
+    ) -> tuple[httpx.Response, Any]:
+        """
+        Send request, waiting on the `.rate_limiter` when one is defined.
+
+        See `ClientCore._request()` for throttle, retry and hooks behavior.
+
+        Returns:
+            The response and its decoded JSON body
+        """
+        send = getattr(self.http, method)
+        retries = 0
+        throttled = 0
+        while True:
+            limiter, headers = await self._route(url, method)
+            started = time.perf_counter()
+            try:
+                resp: httpx.Response = await send(url=url, headers=headers, **kwargs)
+            except Exception as err:
+                latency = time.perf_counter() - started
+                delay = self._retry_delay(method, retries, error=err)
+                self._report_attempt(
+                    method,
+                    url,
+                    None,
+                    latency=latency,
+                    retries=retries,
+                    page_depth=page_depth,
+                    retried=delay is not None,
+                    error=err,
+                )
+                if delay is None:
+                    raise
+            else:
+                latency = time.perf_counter() - started
+                if self._throttled(limiter, url, method, resp, throttled):
+                    self._report_attempt(
+                        method,
+                        url,
+                        resp,
+                        latency=latency,
+                        retries=retries,
+                        page_depth=page_depth,
+                    )
+                    throttled += 1
+                    continue
+                delay = self._retry_delay(method, retries, resp=resp)
+                if delay is None:
+                    break
+                self._report_attempt(
+                    method,
+                    url,
+                    resp,
+                    latency=latency,
+                    retries=retries,
+                    page_depth=page_depth,
+                    retried=True,
+                )
+            retries += 1
+            await asyncio.sleep(delay)
+        json_body = self._finish(
+            method,
+            url,
+            resp,
+            latency=latency,
+            retries=retries,
+            page_depth=page_depth,
+            track=track,
+        )
+        return resp, json_body
+
+
+def _request_key(url: str, params: dict[str, Any] | str) -> str:
+    """Cache key of a GET request, a pre-encoded query string is canonical."""
+    return f"{url}?{params}" if isinstance(params, str) else cache_key(url, params)
+
+
+def _user_key(bearer: str | None) -> str:
+    """URL of the authenticated user scoped by a digest of the bearer token."""
+    digest = hashlib.sha256((bearer or "").encode("utf-8")).hexdigest()[:16]
+    return f"{URL_USER_ME}#{digest}"
+
+
+def _limit_remaining(resp: httpx.Response) -> int | None:
+    """Value of the `x-rate-limit-remaining` header, None if missing."""
+    remaining = resp.headers.get("x-rate-limit-remaining")
+    return int(remaining) if remaining is not None else None
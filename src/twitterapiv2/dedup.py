@@ -0,0 +1,303 @@
+"""
+Memory-bounded de-duplication of tweets by id, across pages, queries and runs.
+
+    seen = load_filter("seen.bin", default=BloomFilter(10**9, error_rate=0.001))
+    for tweet in client.iter_tweets(dedup=seen):
+        ...
+    seen.save("seen.bin")
+
+`ExactFilter` holds every id in an open addressing table of int64 slots, 8
+bytes per slot filled to between half the load factor and the load factor,
+about 13 to 27 bytes per id at the default of 0.6. `BloomFilter` holds a fixed
+bit array sized for a capacity and false positive rate, about 1.2 bytes per id
+at 1% and 1.8 bytes at 0.1%. A false positive drops a new tweet as a
+duplicate, ids are never missed.
+"""
+from __future__ import annotations
+
+import abc
+import hashlib
+import math
+import os
+import struct
+import sys
+import threading
+from array import array
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from twitterapiv2.model.recent import Data
+    from twitterapiv2.model.recent import Recent
+
+# File header: magic, format version, filter kind
+_MAGIC = b"TWDF"
+_VERSION = 1
+_HEADER = struct.Struct("<4sBB")
+_EXACT = 1
+_BLOOM = 2
+
+# Fibonacci hashing multiplier, spreads sequential ids across the table
+_GOLDEN = 0x9E3779B97F4A7C15
+_MASK64 = (1 << 64) - 1
+
+
+class TweetFilter(abc.ABC):
+    """Abstract for all tweet id filters. Thread-safe."""
+
+    # Filter kind recorded in saved files
+    _kind: int
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+
+    def add(self, tweet_id: str | int) -> bool:
+        """Record a tweet id, True if it was not seen before."""
+        with self._lock:
+            return self._add(int(tweet_id))
+
+    def __contains__(self, tweet_id: object) -> bool:
+        if not isinstance(tweet_id, (str, int)):
+            return False
+        try:
+            value = int(tweet_id)
+        except ValueError:
+            return False
+        with self._lock:
+            return self._contains(value)
+
+    def filter(self, tweets: Iterable[Data]) -> list[Data]:  # noqa: A003
+        """Return tweets not seen before, in order, recording their ids."""
+        return [tweet for tweet in tweets if self.add(tweet["id"])]
+
+    def filter_page(self, page: Recent) -> Recent:
+        """Return the page with tweets seen before removed from `data`."""
+        if not page.get("data"):
+            return page
+        return {**page, "data": self.filter(page["data"])}
+
+    def save(self, path: str) -> None:
+        """Write the filter state to path, replaced atomically."""
+        with self._lock:
+            header = _HEADER.pack(_MAGIC, _VERSION, self._kind)
+            payload = self._dump()
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "wb") as outfile:
+            outfile.write(header)
+            outfile.write(payload)
+        os.replace(temp_path, path)
+
+    @abc.abstractmethod
+    def __len__(self) -> int:
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def _add(self, tweet_id: int) -> bool:
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def _contains(self, tweet_id: int) -> bool:
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def _dump(self) -> bytes:
+        raise NotImplementedError()
+
+
+class ExactFilter(TweetFilter):
+    """Exact set of tweet ids in a compact int64 open addressing table."""
+
+    _kind = _EXACT
+    _STATE = struct.Struct("<QQ?")
+
+    def __init__(self, capacity: int = 1024, load_factor: float = 0.6) -> None:
+        """
+        Create an empty exact filter.
+
+        Args:
+            capacity: Number of ids held before the table first grows
+            load_factor: Fraction of table slots filled before it doubles
+        """
+        if not 0 < load_factor < 1:
+            raise ValueError("load_factor must be between 0 and 1")
+        super().__init__()
+        self.load_factor = load_factor
+        self._bits = max(4, math.ceil(math.log2(max(capacity, 1) / load_factor)))
+        self._slots = array("q", bytes(8 << self._bits))
+        self._count = 0
+        # Empty slots are 0, tweet id 0 is tracked apart
+        self._has_zero = False
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _slot(self, tweet_id: int) -> int:
+        """Index of the slot holding the id, or of the empty slot ending its probe."""
+        mask = len(self._slots) - 1
+        index = ((tweet_id * _GOLDEN) & _MASK64) >> (64 - self._bits)
+        slots = self._slots
+        while slots[index] and slots[index] != tweet_id:
+            index = (index + 1) & mask
+        return index
+
+    def _add(self, tweet_id: int) -> bool:
+        if tweet_id == 0:
+            added = not self._has_zero
+            self._has_zero = True
+        else:
+            index = self._slot(tweet_id)
+            added = not self._slots[index]
+            self._slots[index] = tweet_id
+        if added:
+            self._count += 1
+            if self._count > len(self._slots) * self.load_factor:
+                self._grow()
+        return added
+
+    def _contains(self, tweet_id: int) -> bool:
+        if tweet_id == 0:
+            return self._has_zero
+        return bool(self._slots[self._slot(tweet_id)])
+
+    def _grow(self) -> None:
+        old_slots = self._slots
+        self._bits += 1
+        self._slots = array("q", bytes(8 << self._bits))
+        for tweet_id in old_slots:
+            if tweet_id:
+                self._slots[self._slot(tweet_id)] = tweet_id
+
+    def _dump(self) -> bytes:
+        state = self._STATE.pack(self._bits, self._count, self._has_zero)
+        slots = array("q", self._slots)
+        if sys.byteorder == "big":
+            slots.byteswap()
+        return struct.pack("<d", self.load_factor) + state + slots.tobytes()
+
+    @classmethod
+    def _restore(cls, payload: memoryview) -> ExactFilter:
+        (load_factor,) = struct.unpack_from("<d", payload)
+        bits, count, has_zero = cls._STATE.unpack_from(payload, 8)
+        seen = cls(load_factor=load_factor)
+        seen._bits = bits
+        seen._slots = array("q")
+        seen._slots.frombytes(payload[8 + cls._STATE.size :])
+        if sys.byteorder == "big":
+            seen._slots.byteswap()
+        if len(seen._slots) != 1 << bits:
+            raise ValueError("Truncated exact filter state")
+        seen._count = count
+        seen._has_zero = has_zero
+        return seen
+
+
+class BloomFilter(TweetFilter):
+    """Probabilistic set of tweet ids of fixed size, may report false positives."""
+
+    _kind = _BLOOM
+    _STATE = struct.Struct("<QdQQQ")
+
+    def __init__(self, capacity: int, error_rate: float = 0.001) -> None:
+        """
+        Create an empty Bloom filter.
+
+        Args:
+            capacity: Number of ids expected, the error rate rises beyond it
+            error_rate: False positive rate at capacity, between 0 and 1
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+        super().__init__()
+        self.capacity = capacity
+        self.error_rate = error_rate
+        bits = -capacity * math.log(error_rate) / math.log(2) ** 2
+        self.size = max(8, math.ceil(bits / 8) * 8)
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray(self.size // 8)
+        self._count = 0
+
+    def __len__(self) -> int:
+        """Number of ids added, ids taken for false positives are not counted."""
+        return self._count
+
+    def _positions(self, tweet_id: int) -> list[int]:
+        # Double hashing, k positions from the two halves of one digest
+        digest = hashlib.blake2b(
+            tweet_id.to_bytes(8, "little", signed=True), digest_size=16
+        ).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        return [(first + i * second) % self.size for i in range(self.hashes)]
+
+    def _add(self, tweet_id: int) -> bool:
+        added = False
+        for position in self._positions(tweet_id):
+            byte, bit = divmod(position, 8)
+            if not self._bits[byte] & (1 << bit):
+                self._bits[byte] |= 1 << bit
+                added = True
+        self._count += added
+        return added
+
+    def _contains(self, tweet_id: int) -> bool:
+        return all(
+            self._bits[position // 8] & (1 << position % 8)
+            for position in self._positions(tweet_id)
+        )
+
+    def _dump(self) -> bytes:
+        state = self._STATE.pack(
+            self.capacity, self.error_rate, self.size, self.hashes, self._count
+        )
+        return state + bytes(self._bits)
+
+    @classmethod
+    def _restore(cls, payload: memoryview) -> BloomFilter:
+        capacity, error_rate, size, hashes, count = cls._STATE.unpack_from(payload)
+        bits = payload[cls._STATE.size :]
+        if len(bits) != size // 8:
+            raise ValueError("Truncated Bloom filter state")
+        # Skip __init__, the bit array of a large filter is only allocated once
+        seen = cls.__new__(cls)
+        TweetFilter.__init__(seen)
+        seen.capacity = capacity
+        seen.error_rate = error_rate
+        seen.size = size
+        seen.hashes = hashes
+        seen._bits = bytearray(bits)
+        seen._count = count
+        return seen
+
+
+def load_filter(path: str, default: TweetFilter | None = None) -> TweetFilter:
+    """
+    Load a filter written by `.save()`.
+
+    Args:
+        path: File written by `TweetFilter.save()`
+        default: Filter returned when the file does not exist
+
+    Raises:
+        FileNotFoundError: The file does not exist and no default is given
+        ValueError: The file is not a saved filter
+    """
+    try:
+        with open(path, "rb") as infile:
+            content = infile.read()
+    except FileNotFoundError:
+        if default is None:
+            raise
+        return default
+    if len(content) < _HEADER.size:
+        raise ValueError(f"Not a tweet filter file: {path}")
+    magic, version, kind = _HEADER.unpack_from(content)
+    if magic != _MAGIC or version != _VERSION:
+        raise ValueError(f"Not a tweet filter file: {path}")
+    payload = memoryview(content)[_HEADER.size :]
+    if kind == _EXACT:
+        return ExactFilter._restore(payload)
+    if kind == _BLOOM:
+        return BloomFilter._restore(payload)
+    raise ValueError(f"Unknown tweet filter kind {kind}: {path}")
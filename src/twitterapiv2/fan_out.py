@@ -0,0 +1,257 @@
+"""
+Run many search queries concurrently over one client, sharing its rate budget.
+
+    runner = FanOut(client, ["from:alice", "from:bob", "#python"])
+    for query, tweet in runner.run():
+        ...
+
+Queries are served round-robin, one page per turn, so each query gets an equal
+share of the endpoint's rate limit. Requests wait on the client's
+`.rate_limiter`, a RateLimiter is assigned if none is defined. With a `dedup`
+filter, a tweet matched by several queries is only yielded once.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncGenerator
+from collections.abc import Iterable
+from collections.abc import Iterator
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+from typing import Union
+
+from twitterapiv2.model.cursor import Cursor
+from twitterapiv2.model.query_spec import QuerySpec
+from twitterapiv2.model.recent import Data
+from twitterapiv2.model.recent import Recent
+from twitterapiv2.rate_limit import RateLimiter
+from twitterapiv2.search_recent import AsyncSearchRecent
+from twitterapiv2.search_recent import SearchRecent
+
+if TYPE_CHECKING:
+    from twitterapiv2.dedup import TweetFilter
+
+Query = Union[str, QuerySpec]
+
+
+@dataclass
+class QueryProgress:
+    """Progress of one query of a fan-out run."""
+
+    query: str
+    pages: int = 0
+    tweets: int = 0
+    duplicates: int = 0
+    done: bool = False
+    error: Exception | None = None
+
+
+class _FanOutBase:
+    """Internal: Cursors and progress shared by sync and async runners."""
+
+    def __init__(
+        self,
+        client: SearchRecent | AsyncSearchRecent,
+        queries: Iterable[Query],
+        *,
+        max_pages: int | None = None,
+        dedup: TweetFilter | None = None,
+    ) -> None:
+        if client.rate_limiter is None:
+            client.rate_limiter = RateLimiter()
+        self.max_pages = max_pages
+        self.dedup = dedup
+        self.cursors: dict[str, Cursor] = {}
+        self.progress: dict[str, QueryProgress] = {}
+        # Tweets of fetched pages not yet yielded, kept when a run is stopped
+        self._unyielded: deque[tuple[str, Data]] = deque()
+        specs: set[QuerySpec] = set()
+        for query in queries:
+            spec = query if isinstance(query, QuerySpec) else _spec(client, query)
+            if spec in specs:
+                continue
+            specs.add(spec)
+            # Same query text with other fields (e.g. a time slice) is its own query
+            label = spec.get("query") or spec.key
+            if label in self.cursors:
+                label = spec.key
+            self.cursors[label] = Cursor(spec)
+            self.progress[label] = QueryProgress(label)
+
+    @property
+    def done(self) -> bool:
+        """True once every query has completed or failed and all tweets yielded."""
+        if self._unyielded:
+            return False
+        return all(progress.done for progress in self.progress.values())
+
+    def _pending(self) -> deque[str]:
+        """Labels of unfinished queries, in round-robin order."""
+        return deque(label for label, prog in self.progress.items() if not prog.done)
+
+    def _keep(
+        self,
+        label: str,
+        page: Recent | None,
+        error: BaseException | None,
+    ) -> None:
+        """Record a fetched page or failure, queueing its tweets to be yielded."""
+        tweets = self._record(label, page, error)
+        self._unyielded.extend((label, tweet) for tweet in tweets)
+
+    def _record(
+        self,
+        label: str,
+        page: Recent | None,
+        error: BaseException | None,
+    ) -> list[Data]:
+        """Update progress with a fetched page or failure, return its tweets."""
+        progress = self.progress[label]
+        if error is not None:
+            if not isinstance(error, Exception):
+                raise error
+            progress.error = error
+            progress.done = True
+            return []
+        tweets = (page or {}).get("data") or []
+        unique = tweets if self.dedup is None else self.dedup.filter(tweets)
+        progress.pages += 1
+        progress.tweets += len(unique)
+        progress.duplicates += len(tweets) - len(unique)
+        cursor = self.cursors[label]
+        limited = self.max_pages is not None and progress.pages >= self.max_pages
+        progress.done = not cursor.more or limited
+        return unique
+
+
+class FanOut(_FanOutBase):
+    """Run many queries of a SearchRecent client concurrently, round-robin."""
+
+    def __init__(
+        self,
+        client: SearchRecent,
+        queries: Iterable[Query],
+        *,
+        max_workers: int = 4,
+        max_pages: int | None = None,
+        dedup: TweetFilter | None = None,
+    ) -> None:
+        """
+        Create a fan-out runner.
+
+        Args:
+            client: Client serving all queries, its defined fields (other than
+                `.query()`) apply to queries given as strings
+            queries: Query strings or prepared specs, identical queries run once.
+                Queries are labeled by their query text, or by `spec.key` when
+                the text repeats with other fields
+            max_workers: Number of concurrent requests
+            max_pages: Pages fetched per query at most (None: all pages)
+            dedup: Filter of tweet ids already yielded, by any query or run
+        """
+        super().__init__(client, queries, max_pages=max_pages, dedup=dedup)
+        self.client = client
+        self.max_workers = max_workers
+
+    def run(self) -> Iterator[tuple[str, Data]]:
+        """
+        Yield `(query, tweet)` for every tweet of every query, as pages arrive.
+
+        A failing query is recorded in `.progress` and the others continue.
+        Calling `.run()` again resumes unfinished queries, starting with the
+        tweets of pages fetched but not yielded when the last run stopped.
+        """
+        turns = self._pending()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            running: dict[Future[Recent], str] = {}
+            try:
+                while self._unyielded:
+                    yield self._unyielded.popleft()
+                while turns or running:
+                    while turns and len(running) < self.max_workers:
+                        label = turns.popleft()
+                        future = executor.submit(
+                            self.client.fetch_page, self.cursors[label]
+                        )
+                        running[future] = label
+                    finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        label = running.pop(future)
+                        error = future.exception()
+                        page = None if error is not None else future.result()
+                        self._keep(label, page, error)
+                        if not self.progress[label].done:
+                            turns.append(label)
+                        while self._unyielded:
+                            yield self._unyielded.popleft()
+            finally:
+                # Requests already sent advanced their cursor, keep their pages
+                for future, label in running.items():
+                    if not future.cancel():
+                        error = future.exception()
+                        page = None if error is not None else future.result()
+                        self._keep(label, page, error)
+
+
+class AsyncFanOut(_FanOutBase):
+    """Run many queries of an AsyncSearchRecent client concurrently, round-robin."""
+
+    def __init__(
+        self,
+        client: AsyncSearchRecent,
+        queries: Iterable[Query],
+        *,
+        max_concurrency: int = 4,
+        max_pages: int | None = None,
+        dedup: TweetFilter | None = None,
+    ) -> None:
+        """Create an async fan-out runner. See `FanOut`."""
+        super().__init__(client, queries, max_pages=max_pages, dedup=dedup)
+        self.client = client
+        self.max_concurrency = max_concurrency
+
+    async def run(self) -> AsyncGenerator[tuple[str, Data], None]:
+        """Yield `(query, tweet)` as pages arrive. See `FanOut.run()`."""
+        turns = self._pending()
+        running: dict[asyncio.Task[Recent], str] = {}
+        try:
+            while self._unyielded:
+                yield self._unyielded.popleft()
+            while turns or running:
+                while turns and len(running) < self.max_concurrency:
+                    label = turns.popleft()
+                    fetch = self.client.fetch_page(self.cursors[label])
+                    running[asyncio.ensure_future(fetch)] = label
+                finished, _ = await asyncio.wait(
+                    running,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                for task in finished:
+                    label = running.pop(task)
+                    error = task.exception()
+                    page = None if error is not None else task.result()
+                    self._keep(label, page, error)
+                    if not self.progress[label].done:
+                        turns.append(label)
+                    while self._unyielded:
+                        yield self._unyielded.popleft()
+        finally:
+            # A task cancelled before its response did not advance its cursor
+            for task, label in running.items():
+                if not task.done():
+                    task.cancel()
+                elif not task.cancelled():
+                    error = task.exception()
+                    page = None if error is not None else task.result()
+                    self._keep(label, page, error)
+
+
+def _spec(client: SearchRecent | AsyncSearchRecent, query: str) -> QuerySpec:
+    """Spec of a query string with the other fields defined on the client."""
+    fields = {**client.field_builder.fields, "query": query}
+    return QuerySpec.build(client._url, fields, required=["query"])
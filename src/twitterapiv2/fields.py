@@ -104,10 +104,10 @@ class Fields:
         """
         self._fields["user.fields"] = user_fields if user_fields else None
 
-    def max_results(self, max_results: int | None) -> None:
-        """A number between 10 and 100. By default, set at 10 results."""
-        if max_results is not None and max_results not in range(10, 101):
-            raise ValueError("max_results must be between 10 and 100")
+    def max_results(self, max_results: int | None, maximum: int = 100) -> None:
+        """A number between 10 and 100 (`maximum`). By default, set at 10 results."""
+        if max_results is not None and max_results not in range(10, maximum + 1):
+            raise ValueError(f"max_results must be between 10 and {maximum}")
         self._fields["max_results"] = max_results if max_results else None
 
     def granularity(
@@ -0,0 +1,147 @@
+"""
+Shared, tunable HTTP connection pool for client and auth client classes.
+
+HTTP/2 requires the optional `h2` dependency: `pip install twitterapiv2[http2]`
+"""
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable
+from typing import Any
+from typing import Generic
+from typing import overload
+from typing import TypeVar
+
+import httpx
+
+ClientT = TypeVar("ClientT")
+
+
+class LazyClient(Generic[ClientT]):
+    """
+    Internal: Descriptor creating a private http client on first use.
+
+    Assigning a client (e.g. from an HttpPool) replaces it, deleting the
+    attribute restores the lazily created default.
+    """
+
+    def __init__(self, factory: Callable[[], ClientT]) -> None:
+        self._factory = factory
+        self._name = ""
+
+    def __set_name__(self, owner: type[Any], name: str) -> None:
+        self._name = f"_{name}"
+
+    @overload
+    def __get__(self, instance: None, owner: type[Any]) -> LazyClient[ClientT]:
+        ...
+
+    @overload
+    def __get__(self, instance: object, owner: type[Any]) -> ClientT:
+        ...
+
+    def __get__(
+        self,
+        instance: object | None,
+        owner: type[Any],
+    ) -> LazyClient[ClientT] | ClientT:
+        if instance is None:
+            return self
+        client = instance.__dict__.get(self._name)
+        if client is None:
+            client = instance.__dict__[self._name] = self._factory()
+        return client
+
+    def __set__(self, instance: object, value: ClientT) -> None:
+        instance.__dict__[self._name] = value
+
+    def __delete__(self, instance: object) -> None:
+        instance.__dict__.pop(self._name, None)
+
+
+class HttpPool:
+    """
+    One connection pool to share across every client and auth client.
+
+    Sharing a pool reuses keep-alive connections and the SSL context instead
+    of each client object opening its own. The sync and async http clients
+    are created on first use.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_connections: int | None = 100,
+        max_keepalive_connections: int | None = 20,
+        keepalive_expiry: float | None = 30.0,
+        timeout: float | None = 10.0,
+        connect_timeout: float | None = 5.0,
+        http2: bool = False,
+        transport: httpx.BaseTransport | None = None,
+        async_transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        """
+        Define pool limits. No connections are opened until first request.
+
+        Keyword Args:
+            max_connections: Maximum concurrent connections (None: no limit)
+            max_keepalive_connections: Idle connections kept open for reuse
+            keepalive_expiry: Seconds an idle connection is kept open
+            timeout: Default read, write, and pool timeout in seconds
+            connect_timeout: Timeout for establishing a connection in seconds
+            http2: Enable HTTP/2 multiplexing, requires `h2` to be installed
+            transport: Replace the sync transport (e.g. httpx.MockTransport)
+            async_transport: Replace the async transport
+        """
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.timeout = httpx.Timeout(timeout, connect=connect_timeout)
+        self.http2 = http2
+        self._transport = transport
+        self._async_transport = async_transport
+        self._client: httpx.Client | None = None
+        self._async_client: httpx.AsyncClient | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def client(self) -> httpx.Client:
+        """Shared sync http client."""
+        with self._lock:
+            if self._client is None:
+                self._client = httpx.Client(
+                    limits=self.limits,
+                    timeout=self.timeout,
+                    http2=self.http2,
+                    transport=self._transport,
+                )
+            return self._client
+
+    @property
+    def async_client(self) -> httpx.AsyncClient:
+        """Shared async http client."""
+        with self._lock:
+            if self._async_client is None:
+                self._async_client = httpx.AsyncClient(
+                    limits=self.limits,
+                    timeout=self.timeout,
+                    http2=self.http2,
+                    transport=self._async_transport,
+                )
+            return self._async_client
+
+    def close(self) -> None:
+        """Close the sync http client, it is recreated if used again."""
+        with self._lock:
+            client, self._client = self._client, None
+        if client is not None:
+            client.close()
+
+    async def aclose(self) -> None:
+        """Close the async http client, it is recreated if used again."""
+        with self._lock:
+            client, self._async_client = self._async_client, None
+        if client is not None:
+            await client.aclose()
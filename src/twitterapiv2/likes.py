@@ -5,24 +5,64 @@ https://developer.twitter.com/en/docs/twitter-api/tweets/manage-tweets/introduct
 """
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
+from collections.abc import Awaitable
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Iterator
 from typing import Any
 
+from twitterapiv2._auth_client import AsyncAuthClient
 from twitterapiv2._auth_client import AuthClient
+from twitterapiv2.client_core import AsyncClientCore
 from twitterapiv2.client_core import ClientCore
+from twitterapiv2.model.batch_result import LikeResult
+from twitterapiv2.rate_limit import RateLimiter
+from twitterapiv2.util.concurrency import async_bounded_map
+from twitterapiv2.util.concurrency import bounded_map
+from twitterapiv2.util.pagination import PageLimits
 
 URL_BASE = "https://api.twitter.com/2/users"
+URL_TWEETS = "https://api.twitter.com/2/tweets"
+
+# Query fields accepted by each endpoint, others defined on the client are dropped
+LIKED_TWEETS_FIELDS = frozenset(
+    {
+        "expansions",
+        "max_results",
+        "media.fields",
+        "place.fields",
+        "poll.fields",
+        "tweet.fields",
+        "user.fields",
+    }
+)
+LIKING_USERS_FIELDS = frozenset(
+    {"expansions", "max_results", "tweet.fields", "user.fields"}
+)
 
 
 class Likes(ClientCore):
     """Get a user's liked tweets or a tweet's liking users. Like or unlike a tweet."""
 
-    scopes = ["tweet.read", "tweet.write", "users.read"]
+    scopes = ["tweet.read", "tweet.write", "users.read", "offline.access"]
 
     def __init__(self, auth_client: AuthClient) -> None:
         """Create a Likes client."""
         super().__init__(auth_client)
         self._url = URL_BASE
         self._user_id: str | None = None
+        # URL the current pagination token belongs to
+        self._page_url: str | None = None
+
+        # Define field builder methods
+        self.expansions = self.field_builder.expansions
+        self.media_fields = self.field_builder.media_fields
+        self.place_fields = self.field_builder.place_fields
+        self.poll_fields = self.field_builder.poll_fields
+        self.tweet_fields = self.field_builder.tweet_fields
+        self.user_fields = self.field_builder.user_fields
+        self.max_results = self.field_builder.max_results
 
     @property
     def user_id(self) -> str:
@@ -42,14 +82,260 @@ class Likes(ClientCore):
         payload = {"tweet_id": tweet_id}
         return self.post(url, payload)
 
-    # TODO: Add support for fields
+    def like_many(
+        self,
+        tweet_ids: Iterable[str],
+        *,
+        max_workers: int = 4,
+    ) -> Iterator[LikeResult]:
+        """
+        Like any number of tweets concurrently, yielding results as completed.
+
+        A failure is reported in its result and does not stop the others. A
+        RateLimiter is assigned to the client if none is defined, keeping the
+        requests within the per-user rate limit.
+        """
+        return self._bulk(self.like, tweet_ids, max_workers)
+
+    def unlike_many(
+        self,
+        tweet_ids: Iterable[str],
+        *,
+        max_workers: int = 4,
+    ) -> Iterator[LikeResult]:
+        """Unlike any number of tweets concurrently. See `.like_many()`."""
+        return self._bulk(self.unlike, tweet_ids, max_workers)
+
+    def _bulk(
+        self,
+        method: Callable[[str], Any],
+        tweet_ids: Iterable[str],
+        max_workers: int,
+    ) -> Iterator[LikeResult]:
+        if self.rate_limiter is None:
+            self.rate_limiter = RateLimiter()
+        self.user_id  # resolve once, before requests run concurrently
+
+        def run(tweet_id: str) -> LikeResult:
+            try:
+                result = method(tweet_id)
+            except Exception as err:
+                return LikeResult(tweet_id, False, err)
+            return LikeResult(tweet_id, bool(result.get("data", {}).get("liked")))
+
+        yield from bounded_map(run, tweet_ids, max_workers=max_workers, ordered=False)
+
     def get_likes(self) -> Any:
-        """Get a user's liked tweets."""
+        """
+        Get a page of the user's liked tweets, with the defined fields.
+
+        Pagination is handled internally, each call returns the next page until
+        `.more` is False.
+        """
         url = f"{self._url}/{self.user_id}/liked_tweets"
-        return self.get(url)
+        return self.get(url, self._params(url, LIKED_TWEETS_FIELDS))
 
-    # TODO: Add support for fields
     def get_liking_users(self, tweet_id: str) -> Any:
-        """Get a tweet's liking users."""
-        url = f"https://api.twitter.com/2/tweets/{tweet_id}/liking_users"
-        return self.get(url)
+        """Get a page of a tweet's liking users. See `.get_likes()`."""
+        url = f"{URL_TWEETS}/{tweet_id}/liking_users"
+        return self.get(url, self._params(url, LIKING_USERS_FIELDS))
+
+    def iter_likes(
+        self,
+        *,
+        max_pages: int | None = None,
+        max_tweets: int | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Lazily yield the user's liked tweets, following `meta.next_token`."""
+        limits = PageLimits(max_pages, max_tweets)
+        return self._iter_data(self.get_likes, limits)
+
+    def iter_liking_users(
+        self,
+        tweet_id: str,
+        *,
+        max_pages: int | None = None,
+        max_users: int | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Lazily yield the users liking a tweet, following `meta.next_token`."""
+        limits = PageLimits(max_pages, max_users)
+        return self._iter_data(lambda: self.get_liking_users(tweet_id), limits)
+
+    def _iter_data(
+        self,
+        fetch: Callable[[], Any],
+        limits: PageLimits,
+    ) -> Iterator[dict[str, Any]]:
+        pages = count = 0
+        while True:
+            page = fetch()
+            pages += 1
+            for item in page.get("data") or []:
+                yield item
+                count += 1
+                if limits.max_tweets is not None and count >= limits.max_tweets:
+                    return
+            if not self.more or limits.reached(pages, count, {}):
+                return
+
+    def _params(self, url: str, names: frozenset[str]) -> dict[str, Any]:
+        """Defined fields accepted by the endpoint, with its pagination token."""
+        if url != self._page_url:
+            self._next_token = None
+            self._page_url = url
+        return _endpoint_params(self.fields, names)
+
+
+class AsyncLikes(AsyncClientCore):
+    """Async client for getting, liking, and unliking a user's liked tweets."""
+
+    scopes = ["tweet.read", "tweet.write", "users.read", "offline.access"]
+
+    def __init__(self, auth_client: AsyncAuthClient) -> None:
+        """Create an async Likes client."""
+        super().__init__(auth_client)
+        self._url = URL_BASE
+        self._user_id: str | None = None
+        # URL the current pagination token belongs to
+        self._page_url: str | None = None
+
+        # Define field builder methods
+        self.expansions = self.field_builder.expansions
+        self.media_fields = self.field_builder.media_fields
+        self.place_fields = self.field_builder.place_fields
+        self.poll_fields = self.field_builder.poll_fields
+        self.tweet_fields = self.field_builder.tweet_fields
+        self.user_fields = self.field_builder.user_fields
+        self.max_results = self.field_builder.max_results
+
+    async def user_id(self) -> str:
+        """Get the user id."""
+        if self._user_id is None:
+            self._user_id = (await self.get_user()).id
+        return self._user_id
+
+    async def unlike(self, tweet_id: str) -> bool:
+        """Unlike a tweet."""
+        url = f"{self._url}/{await self.user_id()}/likes/{tweet_id}"
+        return await self.delete(url)
+
+    async def like(self, tweet_id: str) -> bool:
+        """Like a tweet."""
+        url = f"{self._url}/{await self.user_id()}/likes"
+        payload = {"tweet_id": tweet_id}
+        return await self.post(url, payload)
+
+    async def like_many(
+        self,
+        tweet_ids: Iterable[str],
+        *,
+        max_concurrency: int = 4,
+    ) -> AsyncIterator[LikeResult]:
+        """Like any number of tweets concurrently. See `Likes.like_many()`."""
+        async for result in self._bulk(self.like, tweet_ids, max_concurrency):
+            yield result
+
+    async def unlike_many(
+        self,
+        tweet_ids: Iterable[str],
+        *,
+        max_concurrency: int = 4,
+    ) -> AsyncIterator[LikeResult]:
+        """Unlike any number of tweets concurrently. See `Likes.like_many()`."""
+        async for result in self._bulk(self.unlike, tweet_ids, max_concurrency):
+            yield result
+
+    async def _bulk(
+        self,
+        method: Callable[[str], Awaitable[Any]],
+        tweet_ids: Iterable[str],
+        max_concurrency: int,
+    ) -> AsyncIterator[LikeResult]:
+        if self.rate_limiter is None:
+            self.rate_limiter = RateLimiter()
+        await self.user_id()  # resolve once, before requests run concurrently
+
+        async def run(tweet_id: str) -> LikeResult:
+            try:
+                result = await method(tweet_id)
+            except Exception as err:
+                return LikeResult(tweet_id, False, err)
+            return LikeResult(tweet_id, bool(result.get("data", {}).get("liked")))
+
+        results = async_bounded_map(
+            run,
+            tweet_ids,
+            max_concurrency=max_concurrency,
+            ordered=False,
+        )
+        async for result in results:
+            yield result
+
+    async def get_likes(self) -> Any:
+        """Get a page of the user's liked tweets. See `Likes.get_likes()`."""
+        url = f"{self._url}/{await self.user_id()}/liked_tweets"
+        return await self.get(url, self._params(url, LIKED_TWEETS_FIELDS))
+
+    async def get_liking_users(self, tweet_id: str) -> Any:
+        """Get a page of a tweet's liking users. See `Likes.get_likes()`."""
+        url = f"{URL_TWEETS}/{tweet_id}/liking_users"
+        return await self.get(url, self._params(url, LIKING_USERS_FIELDS))
+
+    async def iter_likes(
+        self,
+        *,
+        max_pages: int | None = None,
+        max_tweets: int | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Lazily yield the user's liked tweets, following `meta.next_token`."""
+        limits = PageLimits(max_pages, max_tweets)
+        async for item in self._iter_data(self.get_likes, limits):
+            yield item
+
+    async def iter_liking_users(
+        self,
+        tweet_id: str,
+        *,
+        max_pages: int | None = None,
+        max_users: int | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Lazily yield the users liking a tweet, following `meta.next_token`."""
+        limits = PageLimits(max_pages, max_users)
+
+        async def fetch() -> Any:
+            return await self.get_liking_users(tweet_id)
+
+        async for item in self._iter_data(fetch, limits):
+            yield item
+
+    async def _iter_data(
+        self,
+        fetch: Callable[[], Awaitable[Any]],
+        limits: PageLimits,
+    ) -> AsyncIterator[dict[str, Any]]:
+        pages = count = 0
+        while True:
+            page = await fetch()
+            pages += 1
+            for item in page.get("data") or []:
+                yield item
+                count += 1
+                if limits.max_tweets is not None and count >= limits.max_tweets:
+                    return
+            if not self.more or limits.reached(pages, count, {}):
+                return
+
+    def _params(self, url: str, names: frozenset[str]) -> dict[str, Any]:
+        """Defined fields accepted by the endpoint, with its pagination token."""
+        if url != self._page_url:
+            self._next_token = None
+            self._page_url = url
+        return _endpoint_params(self.fields, names)
+
+
+def _endpoint_params(fields: dict[str, Any], names: frozenset[str]) -> dict[str, Any]:
+    """Filter fields to `names`, `next_token` is sent as `pagination_token`."""
+    params = {key: value for key, value in fields.items() if key in names}
+    if fields.get("next_token"):
+        params["pagination_token"] = fields["next_token"]
+    return params
@@ -5,19 +5,33 @@ https://developer.twitter.com/en/docs/twitter-api/tweets/manage-tweets/introduct
 """
 from __future__ import annotations
 
+import logging
+from collections.abc import AsyncIterator
+from collections.abc import Iterable
+from collections.abc import Iterator
+from collections.abc import Sequence
 from typing import Any
 
+from twitterapiv2._auth_client import AsyncAuthClient
 from twitterapiv2._auth_client import AuthClient
+from twitterapiv2.client_core import AsyncClientCore
 from twitterapiv2.client_core import ClientCore
+from twitterapiv2.model.batch_result import DeleteResult
+from twitterapiv2.model.batch_result import ThreadResult
 from twitterapiv2.model.tweet import Tweet
+from twitterapiv2.rate_limit import RateLimiter
+from twitterapiv2.util.concurrency import async_bounded_map
+from twitterapiv2.util.concurrency import bounded_map
 
 URL_BASE = "https://api.twitter.com/2/tweets"
 
+logger = logging.getLogger(__name__)
+
 
 class ManageTweets(ClientCore):
     """Create or delete a Tweet on behalf of an authenticated user."""
 
-    scopes = ["tweet.read", "tweet.write", "users.read"]
+    scopes = ["tweet.read", "tweet.write", "users.read", "offline.access"]
 
     def __init__(self, auth_client: AuthClient) -> None:
         """Create a ManageTweets client for sending and deleting Tweets."""
@@ -35,3 +49,135 @@ class ManageTweets(ClientCore):
     def delete_tweet(self, tweet_id: str) -> dict[str, Any]:
         """Delete a Tweet."""
         return self.delete(f"{self._url}/{tweet_id}")
+
+    def send_thread(
+        self,
+        tweets: Sequence[Tweet],
+        *,
+        reply_to: str | None = None,
+    ) -> ThreadResult:
+        """
+        Post tweets as a thread, each a reply to the one before.
+
+        Stops at the first failure, see `ThreadResult` to resume. The `.reply()`
+        of each tweet is set as it is posted. A RateLimiter is assigned to the
+        client if none is defined.
+
+        Args:
+            tweets: Tweets of the thread, in order
+            reply_to: Tweet ID the first tweet replies to (e.g. to resume)
+        """
+        if self.rate_limiter is None:
+            self.rate_limiter = RateLimiter()
+        tweet_ids: list[str] = []
+        for tweet in tweets:
+            parent_id = tweet_ids[-1] if tweet_ids else reply_to
+            if parent_id is not None:
+                tweet.reply(parent_id)
+            try:
+                tweet_ids.append(self.send_tweet(tweet)["data"]["id"])
+            except Exception as err:
+                logger.warning("Thread stopped after %d: %s", len(tweet_ids), err)
+                return ThreadResult(tweet_ids, err)
+        return ThreadResult(tweet_ids)
+
+    def delete_tweets(
+        self,
+        tweet_ids: Iterable[str],
+        *,
+        max_workers: int = 4,
+    ) -> Iterator[DeleteResult]:
+        """
+        Delete any number of tweets concurrently, yielding results as completed.
+
+        A failed delete is reported in its result and does not stop the others,
+        resume by deleting the IDs of failed results. A RateLimiter is assigned
+        to the client if none is defined, keeping deletes within the write limit.
+
+        Args:
+            tweet_ids: Iterable of Tweet IDs of any length
+            max_workers: Number of concurrent requests
+        """
+        if self.rate_limiter is None:
+            self.rate_limiter = RateLimiter()
+
+        def delete(tweet_id: str) -> DeleteResult:
+            try:
+                result = self.delete_tweet(tweet_id)
+            except Exception as err:
+                return DeleteResult(tweet_id, False, err)
+            return DeleteResult(tweet_id, bool(result.get("data", {}).get("deleted")))
+
+        yield from bounded_map(
+            delete, tweet_ids, max_workers=max_workers, ordered=False
+        )
+
+
+class AsyncManageTweets(AsyncClientCore):
+    """Async client to create or delete a Tweet on behalf of a user."""
+
+    scopes = ["tweet.read", "tweet.write", "users.read", "offline.access"]
+
+    def __init__(self, auth_client: AsyncAuthClient) -> None:
+        """Create an AsyncManageTweets client for sending and deleting Tweets."""
+        super().__init__(auth_client)
+        self._url = URL_BASE
+
+    def new_tweet(self, *, auto_truncate: bool = False) -> Tweet:
+        """Create a new Tweet object."""
+        return Tweet(auto_truncate=auto_truncate)
+
+    async def send_tweet(self, tweet: Tweet) -> dict[str, Any]:
+        """Send a Tweet."""
+        return await self.post(self._url, json=tweet.data)
+
+    async def delete_tweet(self, tweet_id: str) -> dict[str, Any]:
+        """Delete a Tweet."""
+        return await self.delete(f"{self._url}/{tweet_id}")
+
+    async def send_thread(
+        self,
+        tweets: Sequence[Tweet],
+        *,
+        reply_to: str | None = None,
+    ) -> ThreadResult:
+        """Post tweets as a thread. See `ManageTweets.send_thread()`."""
+        if self.rate_limiter is None:
+            self.rate_limiter = RateLimiter()
+        tweet_ids: list[str] = []
+        for tweet in tweets:
+            parent_id = tweet_ids[-1] if tweet_ids else reply_to
+            if parent_id is not None:
+                tweet.reply(parent_id)
+            try:
+                tweet_ids.append((await self.send_tweet(tweet))["data"]["id"])
+            except Exception as err:
+                logger.warning("Thread stopped after %d: %s", len(tweet_ids), err)
+                return ThreadResult(tweet_ids, err)
+        return ThreadResult(tweet_ids)
+
+    async def delete_tweets(
+        self,
+        tweet_ids: Iterable[str],
+        *,
+        max_concurrency: int = 4,
+    ) -> AsyncIterator[DeleteResult]:
+        """Delete tweets concurrently. See `ManageTweets.delete_tweets()`."""
+        if self.rate_limiter is None:
+            self.rate_limiter = RateLimiter()
+
+        async def delete(tweet_id: str) -> DeleteResult:
+            try:
+                result = await self.delete_tweet(tweet_id)
+            except Exception as err:
+                return DeleteResult(tweet_id, False, err)
+            return DeleteResult(tweet_id, bool(result.get("data", {}).get("deleted")))
+
+        results = async_bounded_map(
+            delete,
+            tweet_ids,
+            max_concurrency=max_concurrency,
+            ordered=False,
+        )
+        async for result in results:
+            yield result
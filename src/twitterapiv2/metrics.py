@@ -0,0 +1,160 @@
+"""
+Request instrumentation for client classes.
+
+Every attempt of a request made by a client, including throttled and retried
+responses and transport errors, is reported as `RequestMetrics` to each
+callable in the client's `.hooks`. `PrometheusCollector` is a hook that
+aggregates them for a Prometheus scrape endpoint:
+
+    collector = PrometheusCollector()
+    client.hooks.append(collector)
+    ...
+    text = collector.render()
+"""
+from __future__ import annotations
+
+import threading
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+# Seconds, from a fast cached response to a slow full-archive page
+LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+DECODE_BUCKETS = (0.0001, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1)
+PAGE_DEPTH_BUCKETS = (1, 2, 5, 10, 25, 50, 100, 250, 1000)
+
+
+@dataclass(frozen=True)
+class RequestMetrics:
+    """
+    Measurements of one attempt of a request, reported to the hooks of a client.
+
+    `retries` counts the resends of the retry policy before this attempt and
+    `retried` is True when the retry policy resent the request after it. An
+    attempt that raised before a response has status 0 and the exception type
+    as `error`.
+    """
+
+    endpoint: str
+    status: int
+    latency: float
+    response_bytes: int
+    decode_time: float
+    limit_remaining: int | None
+    page_depth: int
+    retries: int
+    retried: bool = False
+    error: str | None = None
+
+
+class _Histogram:
+    """Cumulative histogram per label value."""
+
+    def __init__(self, buckets: Sequence[float]) -> None:
+        self.buckets = tuple(buckets)
+        self.counts: dict[str, list[int]] = {}
+        self.sums: dict[str, float] = {}
+
+    def observe(self, label: str, value: float) -> None:
+        counts = self.counts.setdefault(label, [0] * (len(self.buckets) + 1))
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                counts[index] += 1
+        counts[-1] += 1
+        self.sums[label] = self.sums.get(label, 0.0) + value
+
+    def render(self, name: str, label_name: str) -> list[str]:
+        lines = []
+        for label, counts in sorted(self.counts.items()):
+            labels = f'{label_name}="{_escape(label)}"'
+            for bound, count in zip(self.buckets, counts):
+                lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {count}')
+            lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {counts[-1]}')
+            lines.append(f"{name}_sum{{{labels}}} {self.sums[label]}")
+            lines.append(f"{name}_count{{{labels}}} {counts[-1]}")
+        return lines
+
+
+class PrometheusCollector:
+    """Client hook aggregating request metrics per endpoint. Thread-safe."""
+
+    def __init__(self, namespace: str = "twitterapiv2") -> None:
+        """Create a collector, metric names are prefixed with `namespace`."""
+        self.namespace = namespace
+        self._requests: dict[tuple[str, int], int] = {}
+        self._bytes: dict[str, int] = {}
+        self._retries: dict[str, int] = {}
+        self._remaining: dict[str, int] = {}
+        self._latency = _Histogram(LATENCY_BUCKETS)
+        self._decode = _Histogram(DECODE_BUCKETS)
+        self._depth = _Histogram(PAGE_DEPTH_BUCKETS)
+        self._lock = threading.Lock()
+
+    def __call__(self, metrics: RequestMetrics) -> None:
+        """Record the metrics of a request."""
+        endpoint = metrics.endpoint
+        with self._lock:
+            key = (endpoint, metrics.status)
+            self._requests[key] = self._requests.get(key, 0) + 1
+            self._bytes[endpoint] = (
+                self._bytes.get(endpoint, 0) + metrics.response_bytes
+            )
+            self._retries[endpoint] = self._retries.get(endpoint, 0) + metrics.retried
+            if metrics.limit_remaining is not None:
+                self._remaining[endpoint] = metrics.limit_remaining
+            self._latency.observe(endpoint, metrics.latency)
+            self._decode.observe(endpoint, metrics.decode_time)
+            self._depth.observe(endpoint, metrics.page_depth)
+
+    def render(self) -> str:
+        """Return all metrics in the Prometheus text exposition format."""
+        name = self.namespace
+        lines: list[str] = []
+        with self._lock:
+            lines += _header(f"{name}_requests_total", "Requests by status", "counter")
+            for (endpoint, status), count in sorted(self._requests.items()):
+                labels = f'endpoint="{_escape(endpoint)}",status="{status}"'
+                lines.append(f"{name}_requests_total{{{labels}}} {count}")
+
+            lines += _counter(
+                f"{name}_response_bytes_total",
+                "Response body bytes received",
+                self._bytes,
+            )
+            lines += _counter(
+                f"{name}_retries_total",
+                "Requests resent by the retry policy",
+                self._retries,
+            )
+
+            lines += _header(
+                f"{name}_rate_limit_remaining",
+                "Requests remaining in the rate limit window",
+                "gauge",
+            )
+            for endpoint, remaining in sorted(self._remaining.items()):
+                labels = f'endpoint="{_escape(endpoint)}"'
+                lines.append(f"{name}_rate_limit_remaining{{{labels}}} {remaining}")
+
+            for histogram, metric, help_text in (
+                (self._latency, "request_duration_seconds", "Request latency"),
+                (self._decode, "decode_duration_seconds", "JSON decode time"),
+                (self._depth, "page_depth", "Pagination depth of requests"),
+            ):
+                lines += _header(f"{name}_{metric}", help_text, "histogram")
+                lines += histogram.render(f"{name}_{metric}", "endpoint")
+        return "\n".join(lines) + "\n"
+
+
+def _header(name: str, help_text: str, metric_type: str) -> list[str]:
+    return [f"# HELP {name} {help_text}", f"# TYPE {name} {metric_type}"]
+
+
+def _counter(name: str, help_text: str, values: dict[str, int]) -> list[str]:
+    lines = _header(name, help_text, "counter")
+    for endpoint, value in sorted(values.items()):
+        lines.append(f'{name}{{endpoint="{_escape(endpoint)}"}} {value}')
+    return lines
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
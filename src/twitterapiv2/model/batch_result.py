@@ -0,0 +1,54 @@
+"""Per-item outcomes of batch methods of client classes."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from dataclasses import field
+
+
+@dataclass(frozen=True)
+class ThreadResult:
+    """
+    Outcome of posting a thread. Posting stops at the first failed tweet.
+
+    Resume a partial thread with the tweets not yet posted:
+
+        result = client.send_thread(tweets)
+        if not result.complete:
+            result = client.send_thread(tweets[result.sent :], reply_to=result.last_id)
+    """
+
+    tweet_ids: list[str] = field(default_factory=list)
+    error: Exception | None = None
+
+    @property
+    def complete(self) -> bool:
+        """True if every tweet of the thread was posted."""
+        return self.error is None
+
+    @property
+    def sent(self) -> int:
+        """Number of tweets posted."""
+        return len(self.tweet_ids)
+
+    @property
+    def last_id(self) -> str | None:
+        """ID of the last posted tweet, None if none were posted."""
+        return self.tweet_ids[-1] if self.tweet_ids else None
+
+
+@dataclass(frozen=True)
+class DeleteResult:
+    """Outcome of deleting one tweet of a bulk delete."""
+
+    tweet_id: str
+    deleted: bool
+    error: Exception | None = None
+
+
+@dataclass(frozen=True)
+class LikeResult:
+    """Outcome of liking or unliking one tweet of a bulk request."""
+
+    tweet_id: str
+    liked: bool
+    error: Exception | None = None
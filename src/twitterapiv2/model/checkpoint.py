@@ -0,0 +1,44 @@
+"""Polling position of a search query, as persisted by checkpoint stores."""
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import asdict
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class Checkpoint:
+    """
+    Newest tweet id polled and in-progress pagination of a query.
+
+    `newest_id` is only advanced once all pages of a polling run are fetched,
+    the newest id of an unfinished run is held in `pending_newest_id`.
+    """
+
+    newest_id: str | None = None
+    next_token: str | None = None
+    pending_newest_id: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return checkpoint as a JSON serializable dictionary."""
+        return asdict(self)
+
+    def apply(self, fields: Mapping[str, Any]) -> dict[str, Any]:
+        """Return query fields with `since_id` and `next_token` of the checkpoint."""
+        params = dict(fields)
+        params.pop("next_token", None)
+        if self.newest_id:
+            params["since_id"] = self.newest_id
+        if self.next_token:
+            params["next_token"] = self.next_token
+        return params
+
+    def advance(self, page: Mapping[str, Any]) -> Checkpoint:
+        """Return the checkpoint after fetching `page` of the current run."""
+        meta = page.get("meta") or {}
+        pending = self.pending_newest_id or meta.get("newest_id")
+        next_token = meta.get("next_token")
+        if next_token:
+            return Checkpoint(self.newest_id, next_token, pending)
+        return Checkpoint(pending or self.newest_id)
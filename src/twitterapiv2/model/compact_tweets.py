@@ -0,0 +1,159 @@
+"""
+Opt-in compact, column-wise container for large in-memory windows of tweets.
+
+Tweets are held as typed arrays instead of one dictionary tree per tweet:
+
+- `id`, `author_id`: int64 arrays
+- `created_at`: int64 array of epoch seconds
+- `public_metrics`: one int64 array per metric
+- `lang`: codes into a table of interned values
+- `text`: list of strings (optional)
+
+Missing values are stored as -1. Indexing or iterating rebuilds tweets in the
+shape of the API response (`Data`) for the fields held.
+"""
+from __future__ import annotations
+
+import calendar
+import sys
+from array import array
+from collections.abc import Iterable
+from collections.abc import Iterator
+from datetime import datetime
+from typing import overload
+
+from twitterapiv2.model.recent import Data
+from twitterapiv2.model.recent import PublicMetrics
+from twitterapiv2.model.recent import Recent
+from twitterapiv2.util.rules import from_ISO8601
+
+MISSING = -1
+METRICS = ("retweet_count", "reply_count", "like_count", "quote_count")
+
+
+class CompactTweets:
+    """Column-wise container of tweets. Use `.append_page()` with search results."""
+
+    def __init__(self, *, keep_text: bool = True) -> None:
+        """
+        Create an empty container.
+
+        Keyword Args:
+            keep_text: Store tweet text, disable to hold only numeric columns
+        """
+        self.keep_text = keep_text
+        self.ids = array("q")
+        self.author_ids = array("q")
+        self.created_at = array("q")
+        self.metrics = {name: array("q") for name in METRICS}
+        self.lang_codes = array("h")
+        self.texts: list[str] = []
+        self._langs: list[str] = []
+        self._lang_index: dict[str, int] = {}
+
+    @classmethod
+    def from_pages(
+        cls,
+        pages: Iterable[Recent],
+        *,
+        keep_text: bool = True,
+    ) -> CompactTweets:
+        """Build from pages of search results, e.g. `SearchRecent.iter_pages()`."""
+        compact = cls(keep_text=keep_text)
+        for page in pages:
+            compact.append_page(page)
+        return compact
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @overload
+    def __getitem__(self, index: int) -> Data:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Data]:
+        ...
+
+    def __getitem__(self, index: int | slice) -> Data | list[Data]:
+        if isinstance(index, slice):
+            return [self._row(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("CompactTweets index out of range")
+        return self._row(index)
+
+    def __iter__(self) -> Iterator[Data]:
+        return (self._row(index) for index in range(len(self)))
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held by the columns, in bytes."""
+        columns = [self.ids, self.author_ids, self.created_at, self.lang_codes]
+        columns.extend(self.metrics.values())
+        size = sum(column.itemsize * len(column) for column in columns)
+        size += sys.getsizeof(self.texts) + sum(map(sys.getsizeof, self.texts))
+        return size
+
+    def append_page(self, page: Recent) -> None:
+        """Append the tweets of a page of search or lookup results."""
+        self.extend(page.get("data") or [])
+
+    def extend(self, tweets: Iterable[Data]) -> None:
+        """Append tweets."""
+        for tweet in tweets:
+            self.append(tweet)
+
+    def append(self, tweet: Data) -> None:
+        """Append a single tweet."""
+        self.ids.append(int(tweet["id"]))
+        self.author_ids.append(_to_int(tweet.get("author_id")))
+        created_at = tweet.get("created_at")
+        self.created_at.append(_to_epoch(created_at) if created_at else MISSING)
+        public_metrics = tweet.get("public_metrics") or {}
+        for name, column in self.metrics.items():
+            column.append(public_metrics.get(name, MISSING))  # type: ignore
+        self.lang_codes.append(self._lang_code(tweet.get("lang")))
+        if self.keep_text:
+            self.texts.append(tweet.get("text", ""))
+
+    def _lang_code(self, lang: str | None) -> int:
+        if lang is None:
+            return MISSING
+        code = self._lang_index.get(lang)
+        if code is None:
+            code = self._lang_index[lang] = len(self._langs)
+            self._langs.append(sys.intern(lang))
+        return code
+
+    def _row(self, index: int) -> Data:
+        tweet: Data = {"id": str(self.ids[index])}
+        if self.keep_text:
+            tweet["text"] = self.texts[index]
+        if self.author_ids[index] != MISSING:
+            tweet["author_id"] = str(self.author_ids[index])
+        if self.created_at[index] != MISSING:
+            tweet["created_at"] = _from_epoch(self.created_at[index])
+        if self.lang_codes[index] != MISSING:
+            tweet["lang"] = self._langs[self.lang_codes[index]]
+        metrics = {
+            name: column[index]
+            for name, column in self.metrics.items()
+            if column[index] != MISSING
+        }
+        if metrics:
+            tweet["public_metrics"] = PublicMetrics(**metrics)  # type: ignore
+        return tweet
+
+
+def _to_int(value: str | None) -> int:
+    return int(value) if value else MISSING
+
+
+def _to_epoch(created_at: str) -> int:
+    return calendar.timegm(from_ISO8601(created_at).utctimetuple())
+
+
+def _from_epoch(epoch: int) -> str:
+    return datetime.utcfromtimestamp(epoch).strftime("%Y-%m-%dT%H:%M:%S.000Z")
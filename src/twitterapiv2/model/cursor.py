@@ -0,0 +1,71 @@
+"""Pagination and response state of one query, independent of the client."""
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from dataclasses import field
+from datetime import datetime
+from typing import Any
+
+import httpx
+from twitterapiv2.model.query_spec import QuerySpec
+
+
+@dataclass
+class Cursor:
+    """
+    Position of a prepared query, advanced by `client.fetch_page(cursor)`.
+
+    One client serves any number of cursors concurrently, each cursor is
+    advanced by a single caller at a time:
+
+        cursor = Cursor(client.prepare())
+        while cursor.more:
+            page = client.fetch_page(cursor)
+    """
+
+    spec: QuerySpec
+    next_token: str | None = None
+    pages: int = 0
+    done: bool = False
+    last_response: httpx.Response | None = field(default=None, repr=False)
+
+    @property
+    def more(self) -> bool:
+        """True until a page without a `next_token` has been fetched."""
+        return not self.done
+
+    @property
+    def limit_remaining(self) -> int:
+        """Calls remaining before the limit reset as of the last response, or -1."""
+        if self.last_response is None:
+            return -1
+        return int(self.last_response.headers.get("x-rate-limit-remaining", -1))
+
+    @property
+    def limit_reset(self) -> datetime | None:
+        """UTC unaware datetime of the limit reset as of the last response."""
+        if self.last_response is None:
+            return None
+        reset = self.last_response.headers.get("x-rate-limit-reset")
+        return datetime.utcfromtimestamp(int(reset)) if reset else None
+
+    def advance(
+        self,
+        page: Mapping[str, Any],
+        resp: httpx.Response | None = None,
+    ) -> None:
+        """Move past a fetched page, `resp` is None when served from a cache."""
+        meta = page.get("meta") or {}
+        self.next_token = meta.get("next_token")
+        self.done = not self.next_token
+        self.pages += 1
+        if resp is not None:
+            self.last_response = resp
+
+    def reset(self) -> None:
+        """Restart the query from its first page."""
+        self.next_token = None
+        self.pages = 0
+        self.done = False
+        self.last_response = None
@@ -0,0 +1,128 @@
+"""
+Resolve `expansions` of a page of tweets through indexes of its `includes`.
+
+Indexes are built once per page, each accessor of a tweet is a dict lookup:
+
+    for page in client.iter_pages():
+        for tweet in ExpandedPage(page):
+            print(tweet.author, tweet.media, tweet.place)
+"""
+from __future__ import annotations
+
+from collections.abc import Iterator
+from collections.abc import Mapping
+from typing import Any
+
+from twitterapiv2.model.recent import Data
+from twitterapiv2.model.recent import Recent
+
+# Key each object of `includes` is referenced by, per includes list
+INDEX_KEYS = {
+    "users": "id",
+    "tweets": "id",
+    "media": "media_key",
+    "places": "id",
+    "polls": "id",
+}
+
+
+class ExpandedPage:
+    """Page of tweets (search, lookup, etc.) with indexed `includes`."""
+
+    def __init__(self, page: Recent) -> None:
+        """Index the `includes` of a page. The page is not copied or changed."""
+        self.page = page
+        self.users: dict[str, dict[str, Any]] = {}
+        self.tweets: dict[str, dict[str, Any]] = {}
+        self.media: dict[str, dict[str, Any]] = {}
+        self.places: dict[str, dict[str, Any]] = {}
+        self.polls: dict[str, dict[str, Any]] = {}
+
+        includes: Mapping[str, Any] = page.get("includes") or {}
+        for name, key in INDEX_KEYS.items():
+            index: dict[str, dict[str, Any]] = getattr(self, name)
+            for item in includes.get(name) or []:
+                index[item[key]] = item
+
+    def __len__(self) -> int:
+        return len(self.page.get("data") or [])
+
+    def __getitem__(self, index: int) -> ExpandedTweet:
+        return ExpandedTweet((self.page.get("data") or [])[index], self)
+
+    def __iter__(self) -> Iterator[ExpandedTweet]:
+        return (ExpandedTweet(tweet, self) for tweet in self.page.get("data") or [])
+
+    def tweet(self, tweet_id: str) -> ExpandedTweet | None:
+        """Included tweet (e.g. referenced tweet) by id, None if not included."""
+        tweet = self.tweets.get(tweet_id)
+        return None if tweet is None else ExpandedTweet(tweet, self)  # type: ignore
+
+
+class ExpandedTweet:
+    """Tweet of an `ExpandedPage`, resolving expansions on access."""
+
+    __slots__ = ("data", "_page")
+
+    def __init__(self, data: Data, page: ExpandedPage) -> None:
+        self.data = data
+        self._page = page
+
+    def __repr__(self) -> str:
+        return f"ExpandedTweet(id={self.id!r})"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ExpandedTweet):
+            return NotImplemented
+        return self.data == other.data
+
+    @property
+    def id(self) -> str:  # noqa: A003
+        return self.data["id"]
+
+    @property
+    def text(self) -> str:
+        return self.data.get("text", "")
+
+    @property
+    def author(self) -> dict[str, Any] | None:
+        """User object of `author_id`, requires the `author_id` expansion."""
+        author_id = self.data.get("author_id")
+        return self._page.users.get(author_id) if author_id else None
+
+    @property
+    def in_reply_to_user(self) -> dict[str, Any] | None:
+        """User object of `in_reply_to_user_id` expansion."""
+        user_id = self.data.get("in_reply_to_user_id")
+        return self._page.users.get(user_id) if user_id else None
+
+    @property
+    def media(self) -> list[dict[str, Any]]:
+        """Media objects of `attachments.media_keys` that were included."""
+        keys = self.data.get("attachments", {}).get("media_keys") or []
+        return [self._page.media[key] for key in keys if key in self._page.media]
+
+    @property
+    def place(self) -> dict[str, Any] | None:
+        """Place object of `geo.place_id`."""
+        place_id = self.data.get("geo", {}).get("place_id")
+        return self._page.places.get(place_id) if place_id else None
+
+    @property
+    def poll(self) -> dict[str, Any] | None:
+        """Poll object of `attachments.poll_ids`."""
+        poll_ids = self.data.get("attachments", {}).get("poll_ids") or []
+        for poll_id in poll_ids:
+            if poll_id in self._page.polls:
+                return self._page.polls[poll_id]
+        return None
+
+    @property
+    def referenced_tweets(self) -> list[tuple[str, ExpandedTweet]]:
+        """(type, tweet) of `referenced_tweets.id` that were included."""
+        referenced = []
+        for reference in self.data.get("referenced_tweets") or []:
+            tweet = self._page.tweet(reference["id"])
+            if tweet is not None:
+                referenced.append((reference["type"], tweet))
+        return referenced
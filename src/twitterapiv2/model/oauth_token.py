@@ -0,0 +1,41 @@
+"""OAuth access token with expiry, as persisted by token stores."""
+from __future__ import annotations
+
+import time
+from dataclasses import asdict
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class OAuthToken:
+    """OAuth access token with optional refresh token and expiry (epoch seconds)."""
+
+    access_token: str
+    refresh_token: str | None = None
+    expires_at: float | None = None
+    token_type: str = "bearer"
+
+    @classmethod
+    def from_oauth(cls, token: dict[str, Any]) -> OAuthToken:
+        """Build from an OAuth token response (`expires_at` or `expires_in`)."""
+        expires_at = token.get("expires_at")
+        if expires_at is None and token.get("expires_in") is not None:
+            expires_at = time.time() + float(token["expires_in"])
+        return cls(
+            access_token=token["access_token"],
+            refresh_token=token.get("refresh_token"),
+            expires_at=float(expires_at) if expires_at is not None else None,
+            token_type=token.get("token_type") or "bearer",
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return token as a JSON serializable dictionary."""
+        return asdict(self)
+
+    def expired(self, leeway: float = 60.0, now: float | None = None) -> bool:
+        """True if the token expires within `leeway` seconds. Never if no expiry."""
+        if self.expires_at is None:
+            return False
+        now = time.time() if now is None else now
+        return self.expires_at - leeway <= now
@@ -0,0 +1,76 @@
+"""Immutable, validated query of an endpoint, prepared once and shared freely."""
+from __future__ import annotations
+
+from collections.abc import Collection
+from collections.abc import Mapping
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Any
+from urllib.parse import urlencode
+
+from twitterapiv2.cache import UNORDERED_SUFFIXES
+
+
+@dataclass(frozen=True)
+class QuerySpec:
+    """
+    Prepared query of an endpoint. Hashable, safe to share between workers.
+
+    Parameters are sorted by name and comma separated field lists sorted and
+    deduplicated, so equal queries built in any order are equal. The query
+    string is encoded once, `.key` matches the key of the response cache and
+    can be used as a checkpoint key.
+    """
+
+    url: str
+    params: tuple[tuple[str, str], ...]
+    encoded: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "encoded", urlencode(self.params))
+
+    @classmethod
+    def build(
+        cls,
+        url: str,
+        fields: Mapping[str, Any],
+        *,
+        required: Collection[str] = (),
+    ) -> QuerySpec:
+        """
+        Validate and canonicalize fields. Empty values and `next_token` are dropped.
+
+        Raises:
+            ValueError: A field of `required` is not defined
+        """
+        for name in required:
+            if not fields.get(name):
+                raise ValueError(f".{name}() is a required field to be defined.")
+        params = []
+        for name in sorted(fields):
+            value = fields[name]
+            if not value or name == "next_token":
+                continue
+            if name.endswith(UNORDERED_SUFFIXES) and isinstance(value, str):
+                value = ",".join(sorted(set(value.split(","))))
+            params.append((name, str(value)))
+        return cls(url, tuple(params))
+
+    @property
+    def key(self) -> str:
+        """Canonical URL of the first page of the query."""
+        return f"{self.url}?{self.encoded}"
+
+    def get(self, name: str) -> str | None:
+        """Value of a parameter, None if not defined."""
+        return dict(self.params).get(name)
+
+    def to_params(self) -> dict[str, str]:
+        """Return parameters as a new dictionary."""
+        return dict(self.params)
+
+    def query_string(self, next_token: str | None = None) -> str:
+        """Encoded query string of the first page, or of the page of `next_token`."""
+        if not next_token:
+            return self.encoded
+        return urlencode(sorted(self.params + (("next_token", next_token),)))
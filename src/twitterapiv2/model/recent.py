@@ -9,6 +9,7 @@ from typing import TypedDict
 
 class Meta(TypedDict, total=False):
     count: int
+    result_count: int
     newest_id: int
     oldest_id: int
     next_token: str | None
@@ -19,7 +20,7 @@ class Includes(TypedDict, total=False):
     users: list[Any]
     places: list[Any]
     media: list[Any]
-    polls: str
+    polls: list[Any]
 
 
 class PromotedMetrics(TypedDict, total=False):
@@ -132,11 +133,12 @@ class Geo(TypedDict, total=False):
 class Attachments(TypedDict, total=False):
     media_keys: list[str]
     poll_id: list[str]
+    poll_ids: list[str]
 
 
 class ReferencedTweets(TypedDict, total=False):
     id: str  # noqa: A003
-    type: int  # noqa: A003
+    type: str  # noqa: A003
 
 
 class Data(TypedDict, total=False):
@@ -166,5 +168,6 @@ class Data(TypedDict, total=False):
 
 class Recent(TypedDict, total=False):
     data: list[Data]
+    includes: Includes
     meta: Meta
-    errors: dict[str, str]
+    errors: list[dict[str, Any]]
@@ -8,8 +8,15 @@ class Meta(TypedDict, total=False):
     next_token: str
 
 
+class Count(TypedDict, total=False):
+    start: str
+    end: str
+    tweet_count: int
+
+
 class TweetCount(TypedDict, total=False):
     start: str
     end: str
     tweet_count: int
+    data: list[Count]
     meta: Meta
@@ -0,0 +1,178 @@
+"""
+Track Twitter rate limit headers per endpoint and pace requests within the window.
+
+https://developer.twitter.com/en/docs/twitter-api/rate-limits
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import re
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from urllib.parse import urlsplit
+
+import httpx
+from twitterapiv2.retry import _retry_after
+
+# Seconds added to a reset time to absorb clock drift between client and Twitter
+RESET_MARGIN = 1.0
+# Seconds to wait on a 429 response that did not include rate limit headers
+DEFAULT_THROTTLE_WAIT = 60.0
+# 429 responses of one request waited out before raising ThrottledError
+MAX_THROTTLE_WAITS = 5
+
+# Numeric path segments after the leading API version segment (/2/)
+_ID_SEGMENT = re.compile(r"(?<=.)/\d+(?=/|$)")
+
+
+@dataclass
+class EndpointLimit:
+    """Last known rate limit state of an endpoint."""
+
+    limit: int
+    remaining: int
+    reset: float
+    next_request: float = 0.0
+
+
+class RateLimiter:
+    """
+    Per-endpoint rate limit tracker, shared by clients using the same credentials.
+
+    Each response updates the endpoint's state from the `x-rate-limit-*` headers.
+    Before each request `.wait()` sleeps as needed so the remaining requests are
+    spread evenly until the window resets. An exhausted endpoint waits until the
+    reset rather than being throttled. A 429 response waits at least its
+    `Retry-After`, or `DEFAULT_THROTTLE_WAIT` when it has no reset time, even if
+    the reported reset has already passed.
+    """
+
+    logger = logging.getLogger(__name__)
+
+    def __init__(
+        self,
+        *,
+        pace: bool = True,
+        max_throttle_waits: int = MAX_THROTTLE_WAITS,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Create a RateLimiter.
+
+        Keyword Args:
+            pace: Spread requests across the window, when False only wait when
+                the endpoint is exhausted
+            max_throttle_waits: 429 responses waited out for one request, the
+                next raises ThrottledError
+            clock: Source of the current epoch time, in seconds
+        """
+        self.pace = pace
+        self.max_throttle_waits = max_throttle_waits
+        self._clock = clock
+        self._limits: dict[str, EndpointLimit] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def endpoint(url: str, method: str = "GET") -> str:
+        """Rate limit key of a url, numeric path segments replaced with `:id`."""
+        path = _ID_SEGMENT.sub("/:id", urlsplit(url).path)
+        return f"{method.upper()} {path}"
+
+    def get(self, url: str, method: str = "GET") -> EndpointLimit | None:
+        """Return last known state of the endpoint, None if never seen."""
+        return self._limits.get(self.endpoint(url, method))
+
+    def budget(self, url: str, method: str = "GET") -> float:
+        """Requests remaining in the current window, infinite if never seen."""
+        state = self.get(url, method)
+        if state is None:
+            return float("inf")
+        if self._clock() >= state.reset:
+            return float(state.limit)
+        return float(state.remaining)
+
+    def delay(self, url: str, method: str = "GET") -> float:
+        """
+        Reserve the next request slot of an endpoint.
+
+        Returns:
+            Seconds to wait before sending the request
+        """
+        now = self._clock()
+        with self._lock:
+            state = self._limits.get(self.endpoint(url, method))
+            if state is None or now >= state.reset:
+                return 0.0
+
+            if state.remaining <= 0:
+                wait = state.reset + RESET_MARGIN - now
+            elif self.pace:
+                interval = (state.reset - now) / state.remaining
+                wait = max(0.0, state.next_request - now)
+                state.next_request = now + wait + interval
+            else:
+                wait = 0.0
+
+            # Count the reservation so concurrent callers queue behind it
+            state.remaining -= 1
+            return wait
+
+    def wait(self, url: str, method: str = "GET") -> None:
+        """Block until the endpoint can be requested."""
+        wait = self.delay(url, method)
+        if wait > 0:
+            self.logger.debug("Waiting %.2fs for %s", wait, self.endpoint(url, method))
+            time.sleep(wait)
+
+    async def async_wait(self, url: str, method: str = "GET") -> None:
+        """Sleep, without blocking the event loop, until the endpoint is ready."""
+        wait = self.delay(url, method)
+        if wait > 0:
+            self.logger.debug("Waiting %.2fs for %s", wait, self.endpoint(url, method))
+            await asyncio.sleep(wait)
+
+    def update(self, url: str, resp: httpx.Response, method: str = "GET") -> None:
+        """Record rate limit headers of a response for its endpoint."""
+        key = self.endpoint(url, method)
+        headers = resp.headers
+        if "x-rate-limit-remaining" not in headers:
+            if resp.status_code == 429:
+                reset = self._throttle_reset(resp)
+                with self._lock:
+                    self._limits[key] = EndpointLimit(0, 0, reset)
+            return
+
+        remaining = int(headers["x-rate-limit-remaining"])
+        if resp.status_code == 429:
+            reset = self._throttle_reset(resp)
+            remaining = 0
+        else:
+            reset = float(headers.get("x-rate-limit-reset", self._clock()))
+        state = EndpointLimit(
+            limit=int(headers.get("x-rate-limit-limit", remaining)),
+            remaining=remaining,
+            reset=reset,
+        )
+        with self._lock:
+            previous = self._limits.get(key)
+            if previous is not None and previous.reset == state.reset:
+                state.next_request = previous.next_request
+            self._limits[key] = state
+
+    def _throttle_reset(self, resp: httpx.Response) -> float:
+        """
+        Reset time of a 429 response, never in the past.
+
+        Waits at least `Retry-After` and `RESET_MARGIN`, so a reset already
+        passed (clock drift) is not resent at once. Without reset or
+        `Retry-After` waits `DEFAULT_THROTTLE_WAIT`.
+        """
+        now = self._clock()
+        retry_after = _retry_after(resp)
+        if "x-rate-limit-reset" not in resp.headers and retry_after is None:
+            return now + DEFAULT_THROTTLE_WAIT
+        reset = float(resp.headers.get("x-rate-limit-reset", 0))
+        return max(reset, now + max(retry_after or 0.0, RESET_MARGIN))
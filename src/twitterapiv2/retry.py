@@ -0,0 +1,159 @@
+"""
+Retry transient failures with exponential backoff and jitter.
+
+Assign a policy to a client's `.retry_policy`. Requests are resent on
+retryable status codes (5xx) and transport errors. Methods that are not
+idempotent, such as the POST of `ManageTweets.send_tweet()`, are only resent
+when the request could not have reached Twitter (connection failures).
+"""
+from __future__ import annotations
+
+import logging
+import random
+import threading
+from collections.abc import Callable
+from collections.abc import Collection
+from dataclasses import dataclass
+
+import httpx
+
+RETRY_STATUSES = frozenset({500, 502, 503, 504})
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+# Failures where the request was never sent, safe to retry for any method
+UNSENT_EXCEPTIONS: tuple[type[Exception], ...] = (
+    httpx.ConnectError,
+    httpx.ConnectTimeout,
+    httpx.PoolTimeout,
+)
+
+
+@dataclass
+class RetryStats:
+    """Counters of a retry policy."""
+
+    retries: int = 0
+    exhausted: int = 0
+
+
+class RetryPolicy:
+    """
+    Retry policy, safe to share between clients and threads.
+
+    The delay before retry `n` (starting at 1) is `backoff * multiplier**(n-1)`
+    capped at `max_backoff`, reduced by up to `jitter` (fraction) at random so
+    clients failing together do not retry together. A `Retry-After` header of
+    the response is honored up to `max_backoff`.
+    """
+
+    logger = logging.getLogger(__name__)
+
+    def __init__(
+        self,
+        *,
+        max_attempts: int = 5,
+        backoff: float = 0.5,
+        multiplier: float = 2.0,
+        max_backoff: float = 60.0,
+        jitter: float = 1.0,
+        retry_statuses: Collection[int] = RETRY_STATUSES,
+        retry_exceptions: tuple[type[Exception], ...] = (httpx.TransportError,),
+        retry_methods: Collection[str] = IDEMPOTENT_METHODS,
+        rand: Callable[[], float] = random.random,
+    ) -> None:
+        """
+        Create a RetryPolicy.
+
+        Keyword Args:
+            max_attempts: Total attempts of a request, including the first
+            backoff: Seconds before the first retry
+            multiplier: Growth factor of the delay per retry
+            max_backoff: Upper bound of a single delay in seconds
+            jitter: Fraction of the delay randomly removed, 0.0 (none) to 1.0 (full)
+            retry_statuses: Response status codes to retry
+            retry_exceptions: Exceptions raised by the http client to retry
+            retry_methods: Methods safe to resend after the request was sent
+            rand: Source of random numbers in [0.0, 1.0)
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.multiplier = multiplier
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_exceptions = retry_exceptions
+        self.retry_methods = frozenset(method.upper() for method in retry_methods)
+        self.stats = RetryStats()
+        self._rand = rand
+        self._lock = threading.Lock()
+
+    def delay(self, retry: int, resp: httpx.Response | None = None) -> float:
+        """Seconds to wait before retry number `retry`, starting at 1."""
+        delay = min(self.max_backoff, self.backoff * self.multiplier ** (retry - 1))
+        delay -= delay * self.jitter * self._rand()
+        retry_after = _retry_after(resp) if resp is not None else None
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.max_backoff))
+        return delay
+
+    def next_delay(
+        self,
+        method: str,
+        retries: int,
+        *,
+        resp: httpx.Response | None = None,
+        error: Exception | None = None,
+    ) -> float | None:
+        """
+        Decide on a failed attempt, counting the retry if one is made.
+
+        Args:
+            method: HTTP method of the request
+            retries: Retries already made of the request
+            resp: Response of the attempt, if one was received
+            error: Exception raised by the attempt, if any
+
+        Returns:
+            Seconds to wait before retrying, None if the failure is final
+        """
+        if not self._retryable(method.upper(), resp, error):
+            return None
+        with self._lock:
+            if retries + 1 >= self.max_attempts:
+                self.stats.exhausted += 1
+                return None
+            self.stats.retries += 1
+
+        delay = self.delay(retries + 1, resp)
+        reason = error if error is not None else resp.status_code  # type: ignore
+        self.logger.warning(
+            "Retry %d of %s in %.2fs: %s", retries + 1, method.upper(), delay, reason
+        )
+        return delay
+
+    def _retryable(
+        self,
+        method: str,
+        resp: httpx.Response | None,
+        error: Exception | None,
+    ) -> bool:
+        if error is not None:
+            if isinstance(error, UNSENT_EXCEPTIONS):
+                return isinstance(error, self.retry_exceptions)
+            return method in self.retry_methods and isinstance(
+                error, self.retry_exceptions
+            )
+        if resp is not None:
+            return method in self.retry_methods and (
+                resp.status_code in self.retry_statuses
+            )
+        return False
+
+
+def _retry_after(resp: httpx.Response) -> float | None:
+    """Seconds of a numeric `Retry-After` header, None if missing or a date."""
+    try:
+        return max(0.0, float(resp.headers["retry-after"]))
+    except (KeyError, ValueError):
+        return None
@@ -0,0 +1,210 @@
+"""
+Full-archive search, requires Academic Research access.
+
+https://developer.twitter.com/en/docs/twitter-api/tweets/search/api-reference/get-tweets-search-all
+"""
+from __future__ import annotations
+
+import asyncio
+import queue
+import threading
+from collections.abc import AsyncIterator
+from collections.abc import Iterable
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from datetime import timedelta
+from functools import partial
+from typing import Any
+from typing import TYPE_CHECKING
+from typing import Union
+
+from twitterapiv2._auth_client import AsyncAuthClient
+from twitterapiv2._auth_client import AuthClient
+from twitterapiv2.model.recent import Recent
+from twitterapiv2.search_recent import AsyncSearchRecent
+from twitterapiv2.search_recent import SearchRecent
+from twitterapiv2.util.rules import to_ISO8601
+
+URL = "https://api.twitter.com/2/tweets/search/all"
+MAX_RESULTS = 500
+
+if TYPE_CHECKING:
+    from twitterapiv2.dedup import TweetFilter
+
+    TimeWindow = tuple[datetime, datetime]
+    # Passed from backfill workers: a page, an error, or None when a window ends
+    _Item = Union[Recent, BaseException, None]
+
+
+def time_windows(start: datetime, end: datetime, count: int) -> list[TimeWindow]:
+    """
+    Split `start` to `end` into `count` contiguous windows of equal length.
+
+    Boundaries are whole seconds. Each window ends where the next starts, which
+    matches the inclusive `start_time` and exclusive `end_time` of the API.
+    """
+    if count < 1:
+        raise ValueError("count must be at least 1")
+    if end <= start:
+        raise ValueError("end must be after start")
+    start = start.replace(microsecond=0)
+    seconds = int((end - start).total_seconds())
+    cuts = sorted(
+        {start + timedelta(seconds=seconds * i // count) for i in range(count)}
+    )
+    return list(zip(cuts, cuts[1:] + [end]))
+
+
+class SearchAll(SearchRecent):
+    _url = URL
+
+    def __init__(self, auth_client: AuthClient) -> None:
+        """
+        Full-archive search client. Build query with methods, .fetch() to run.
+
+        Use `.backfill()` to paginate time windows of a long range in parallel.
+        """
+        super().__init__(auth_client)
+        self.max_results = partial(self.field_builder.max_results, maximum=MAX_RESULTS)
+
+    def backfill(
+        self,
+        windows: Iterable[TimeWindow],
+        *,
+        max_workers: int = 4,
+        dedup: TweetFilter | None = None,
+    ) -> Iterator[Recent]:
+        """
+        Paginate each (start, end) window in its own worker thread.
+
+        Pages are yielded as they arrive, in no particular order across windows.
+        All other fields of the query are shared by every window, any pending
+        `next_token` of the client is ignored and left unchanged. Workers share
+        the client's `.rate_limiter`, define one to pace requests.
+
+        Args:
+            windows: (start_time, end_time) pairs, e.g. from `time_windows()`
+            max_workers: Number of windows paginated at once
+            dedup: Filter removing tweets it has seen from `data` of each page
+        """
+        windows = list(windows)
+        params = _backfill_params(self.fields)
+        stop = threading.Event()
+        items: queue.Queue[_Item] = queue.Queue(maxsize=max_workers * 2)
+
+        def put(item: _Item) -> None:
+            while not stop.is_set():
+                try:
+                    items.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    continue
+
+        def worker(window: TimeWindow) -> None:
+            try:
+                window_params = _window_params(params, window)
+                depth = 0
+                while not stop.is_set():
+                    depth += 1
+                    _, page = self._get_response(self._url, window_params, depth)
+                    put(page)
+                    next_token = (page.get("meta") or {}).get("next_token")
+                    if not next_token:
+                        break
+                    window_params = {**window_params, "next_token": next_token}
+            except BaseException as err:
+                put(err)
+            put(None)
+
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        futures = [executor.submit(worker, window) for window in windows]
+        try:
+            remaining = len(windows)
+            while remaining:
+                item = items.get()
+                if item is None:
+                    remaining -= 1
+                elif isinstance(item, BaseException):
+                    raise item
+                else:
+                    yield item if dedup is None else dedup.filter_page(item)
+        finally:
+            stop.set()
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+
+class AsyncSearchAll(AsyncSearchRecent):
+    _url = URL
+
+    def __init__(self, auth_client: AsyncAuthClient) -> None:
+        """Async full-archive search client. Build query, await .fetch() to run."""
+        super().__init__(auth_client)
+        self.max_results = partial(self.field_builder.max_results, maximum=MAX_RESULTS)
+
+    async def backfill(
+        self,
+        windows: Iterable[TimeWindow],
+        *,
+        max_concurrency: int = 4,
+        dedup: TweetFilter | None = None,
+    ) -> AsyncIterator[Recent]:
+        """
+        Paginate each (start, end) window as a concurrent task.
+
+        See `SearchAll.backfill()`, at most `max_concurrency` windows are
+        paginated at once.
+        """
+        windows = list(windows)
+        params = _backfill_params(self.fields)
+        semaphore = asyncio.Semaphore(max_concurrency)
+        items: asyncio.Queue[_Item] = asyncio.Queue(maxsize=max_concurrency * 2)
+
+        async def worker(window: TimeWindow) -> None:
+            try:
+                async with semaphore:
+                    window_params = _window_params(params, window)
+                    depth = 0
+                    while True:
+                        depth += 1
+                        _, page = await self._get_response(
+                            self._url, window_params, depth
+                        )
+                        await items.put(page)
+                        next_token = (page.get("meta") or {}).get("next_token")
+                        if not next_token:
+                            break
+                        window_params = {**window_params, "next_token": next_token}
+            except Exception as err:
+                await items.put(err)
+            await items.put(None)
+
+        tasks = [asyncio.ensure_future(worker(window)) for window in windows]
+        try:
+            remaining = len(windows)
+            while remaining:
+                item = await items.get()
+                if item is None:
+                    remaining -= 1
+                elif isinstance(item, BaseException):
+                    raise item
+                else:
+                    yield item if dedup is None else dedup.filter_page(item)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def _backfill_params(fields: dict[str, Any]) -> dict[str, Any]:
+    """Query fields shared by all windows of a backfill."""
+    if not fields.get("query"):
+        raise ValueError(".query() is a required field to be defined.")
+    return {key: value for key, value in fields.items() if key != "next_token"}
+
+
+def _window_params(params: dict[str, Any], window: TimeWindow) -> dict[str, Any]:
+    start, end = window
+    return {**params, "start_time": to_ISO8601(start), "end_time": to_ISO8601(end)}
@@ -1,15 +1,30 @@
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
+from collections.abc import Iterator
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from twitterapiv2._auth_client import AsyncAuthClient
 from twitterapiv2._auth_client import AuthClient
+from twitterapiv2.client_core import AsyncClientCore
 from twitterapiv2.client_core import ClientCore
+from twitterapiv2.model.checkpoint import Checkpoint
+from twitterapiv2.model.query_spec import QuerySpec
+from twitterapiv2.model.recent import Data
 from twitterapiv2.model.recent import Recent
+from twitterapiv2.util.pagination import PageLimits
 
+if TYPE_CHECKING:
+    from twitterapiv2.checkpoint_store import CheckpointStore
+    from twitterapiv2.dedup import TweetFilter
 
 URL = "https://api.twitter.com/2/tweets/search/recent"
 
 
 class SearchRecent(ClientCore):
     scopes = ["tweet.read", "offline.access"]
+    _url = URL
 
     def __init__(self, auth_client: AuthClient) -> None:
         """Search Recent client. Use methods to build query and .fetch() to run."""
@@ -29,14 +44,216 @@ class SearchRecent(ClientCore):
         self.max_results = self.field_builder.max_results
         self.query = self.field_builder.query
 
-    def fetch(self) -> Recent:
+        # Optional persistent polling position, keyed by query unless defined
+        self.checkpoint_store: CheckpointStore | None = None
+        self.checkpoint_key: str | None = None
+
+    def prepare(self) -> QuerySpec:
+        """Return the defined fields as an immutable query for `.fetch(spec)`."""
+        return QuerySpec.build(self._url, self.field_builder.fields, required=["query"])
+
+    def fetch(self, spec: QuerySpec | None = None) -> Recent:
         """
         Search tweets from up to the last seven days. max size of results is 100
 
         Pagination is handled internally with the `next_token` being applied
         to the query fields after successful fetch. The property `.next_token`
         can be used to determine when no further results remain (is None)
+
+        With a `.checkpoint_store` defined, only tweets newer than the last
+        completed run are requested and an interrupted run resumes from its
+        saved `next_token`.
+
+        Args:
+            spec: Prepared query (see `.prepare()`) to run in place of the fields
         """
-        if not self.fields.get("query"):
+        if spec is not None and self.checkpoint_store is None:
+            return self.get_prepared(spec)
+        fields = self.fields if spec is None else spec.to_params()
+        if not fields.get("query"):
             raise ValueError(".query() is a required field to be defined.")
-        return self.get(URL)
+        url = self._url if spec is None else spec.url
+        if self.checkpoint_store is None:
+            return self.get(url, fields)
+
+        key = self.checkpoint_key or fields["query"]
+        checkpoint = self.checkpoint_store.load(key) or Checkpoint()
+        page: Recent = self.get(url, checkpoint.apply(fields))
+        self.checkpoint_store.save(key, checkpoint.advance(page))
+        return page
+
+    def iter_pages(
+        self,
+        *,
+        max_pages: int | None = None,
+        max_tweets: int | None = None,
+        oldest: datetime | None = None,
+        spec: QuerySpec | None = None,
+        dedup: TweetFilter | None = None,
+    ) -> Iterator[Recent]:
+        """
+        Lazily fetch pages, following `meta.next_token` until none remain.
+
+        Continues from the current pagination state of the client. Stops early
+        once `max_pages` or `max_tweets` are reached, or once a page reaches
+        tweets created before `oldest` (requires `created_at` tweet field).
+        A prepared `spec` is run in place of the defined fields.
+
+        With a `dedup` filter, tweets whose id it has seen are removed from
+        `data` of each page and do not count toward `max_tweets`.
+        """
+        limits = PageLimits(max_pages, max_tweets, oldest)
+        pages = tweets = 0
+        while True:
+            page = self.fetch(spec)
+            unique = page if dedup is None else dedup.filter_page(page)
+            pages += 1
+            tweets += len(unique.get("data") or [])
+            yield unique
+            if not self.more or limits.reached(pages, tweets, page):
+                return
+
+    def iter_tweets(
+        self,
+        *,
+        max_pages: int | None = None,
+        max_tweets: int | None = None,
+        oldest: datetime | None = None,
+        spec: QuerySpec | None = None,
+        dedup: TweetFilter | None = None,
+    ) -> Iterator[Data]:
+        """
+        Lazily yield tweets of each page. See `.iter_pages()` for stop conditions.
+
+        Tweets created before `oldest` or seen by the `dedup` filter are not
+        yielded.
+        """
+        limits = PageLimits(max_pages, max_tweets, oldest)
+        count = 0
+        for page in self.iter_pages(
+            max_pages=max_pages,
+            max_tweets=max_tweets,
+            oldest=oldest,
+            spec=spec,
+            dedup=dedup,
+        ):
+            for tweet in page.get("data") or []:
+                if limits.too_old(tweet):
+                    return
+                yield tweet
+                count += 1
+                if max_tweets is not None and count >= max_tweets:
+                    return
+
+
+class AsyncSearchRecent(AsyncClientCore):
+    scopes = ["tweet.read", "offline.access"]
+    _url = URL
+
+    def __init__(self, auth_client: AsyncAuthClient) -> None:
+        """Async Search Recent client. Build query with methods, await .fetch()."""
+        super().__init__(auth_client)
+
+        # Define field builder methods
+        self.start_time = self.field_builder.start_time
+        self.end_time = self.field_builder.end_time
+        self.since_id = self.field_builder.since_id
+        self.until_id = self.field_builder.until_id
+        self.expansions = self.field_builder.expansions
+        self.media_fields = self.field_builder.media_fields
+        self.place_fields = self.field_builder.place_fields
+        self.poll_fields = self.field_builder.poll_fields
+        self.tweet_fields = self.field_builder.tweet_fields
+        self.user_fields = self.field_builder.user_fields
+        self.max_results = self.field_builder.max_results
+        self.query = self.field_builder.query
+
+        # Optional persistent polling position, keyed by query unless defined
+        self.checkpoint_store: CheckpointStore | None = None
+        self.checkpoint_key: str | None = None
+
+    def prepare(self) -> QuerySpec:
+        """Return the defined fields as an immutable query for `.fetch(spec)`."""
+        return QuerySpec.build(self._url, self.field_builder.fields, required=["query"])
+
+    async def fetch(self, spec: QuerySpec | None = None) -> Recent:
+        """
+        Search tweets from up to the last seven days. max size of results is 100
+
+        See `SearchRecent.fetch()` for pagination, checkpoint and spec behavior.
+        """
+        if spec is not None and self.checkpoint_store is None:
+            return await self.get_prepared(spec)
+        fields = self.fields if spec is None else spec.to_params()
+        if not fields.get("query"):
+            raise ValueError(".query() is a required field to be defined.")
+        url = self._url if spec is None else spec.url
+        if self.checkpoint_store is None:
+            return await self.get(url, fields)
+
+        key = self.checkpoint_key or fields["query"]
+        checkpoint = self.checkpoint_store.load(key) or Checkpoint()
+        page: Recent = await self.get(url, checkpoint.apply(fields))
+        self.checkpoint_store.save(key, checkpoint.advance(page))
+        return page
+
+    async def iter_pages(
+        self,
+        *,
+        max_pages: int | None = None,
+        max_tweets: int | None = None,
+        oldest: datetime | None = None,
+        spec: QuerySpec | None = None,
+        dedup: TweetFilter | None = None,
+    ) -> AsyncIterator[Recent]:
+        """
+        Lazily fetch pages, following `meta.next_token` until none remain.
+
+        Continues from the current pagination state of the client. Stops early
+        once `max_pages` or `max_tweets` are reached, or once a page reaches
+        tweets created before `oldest` (requires `created_at` tweet field).
+        A prepared `spec` is run in place of the defined fields. Tweets seen by
+        a `dedup` filter are dropped, see `SearchRecent.iter_pages()`.
+        """
+        limits = PageLimits(max_pages, max_tweets, oldest)
+        pages = tweets = 0
+        while True:
+            page = await self.fetch(spec)
+            unique = page if dedup is None else dedup.filter_page(page)
+            pages += 1
+            tweets += len(unique.get("data") or [])
+            yield unique
+            if not self.more or limits.reached(pages, tweets, page):
+                return
+
+    async def iter_tweets(
+        self,
+        *,
+        max_pages: int | None = None,
+        max_tweets: int | None = None,
+        oldest: datetime | None = None,
+        spec: QuerySpec | None = None,
+        dedup: TweetFilter | None = None,
+    ) -> AsyncIterator[Data]:
+        """
+        Lazily yield tweets of each page. See `.iter_pages()` for stop conditions.
+
+        Tweets created before `oldest` or seen by the `dedup` filter are not
+        yielded.
+        """
+        limits = PageLimits(max_pages, max_tweets, oldest)
+        count = 0
+        async for page in self.iter_pages(
+            max_pages=max_pages,
+            max_tweets=max_tweets,
+            oldest=oldest,
+            spec=spec,
+            dedup=dedup,
+        ):
+            for tweet in page.get("data") or []:
+                if limits.too_old(tweet):
+                    return
+                yield tweet
+                count += 1
+                if max_tweets is not None and count >= max_tweets:
+                    return
@@ -0,0 +1,168 @@
+"""
+Plan backfill shards of roughly equal tweet volume from tweet counts.
+
+    counts = TweetsCounts(auth_client, end_point="all")
+    counts.query("hello")
+    shards = plan_shards(counts, start, end, granularity="hour")
+
+    search = SearchAll(auth_client)
+    search.query("hello")
+    search.max_results(500)
+    for page in search.backfill(shards):
+        ...
+"""
+from __future__ import annotations
+
+import math
+from collections.abc import Iterable
+from datetime import datetime
+from datetime import timezone
+from typing import TYPE_CHECKING
+
+from twitterapiv2.model.cursor import Cursor
+from twitterapiv2.model.query_spec import QuerySpec
+from twitterapiv2.model.tweet_count import Count
+from twitterapiv2.search_all import MAX_RESULTS
+from twitterapiv2.search_all import time_windows
+from twitterapiv2.tweets_counts import AsyncTweetsCounts
+from twitterapiv2.tweets_counts import TweetsCounts
+from twitterapiv2.util.rules import from_ISO8601
+from twitterapiv2.util.rules import to_ISO8601
+
+if TYPE_CHECKING:
+    from typing import Literal
+
+    from twitterapiv2.search_all import TimeWindow
+
+    Granularity = Literal["minute", "hour", "day"]
+
+
+def plan_shards(
+    counts: TweetsCounts,
+    start: datetime,
+    end: datetime,
+    *,
+    granularity: Granularity = "hour",
+    pages_per_shard: int = 10,
+    page_size: int = MAX_RESULTS,
+) -> list[TimeWindow]:
+    """
+    Count tweets of the query between start and end, then cut into shards.
+
+    The query must be defined on the counts client. Its time range and
+    granularity are replaced for the count requests only, the fields and
+    pagination of the client are left unchanged. Finer granularity costs more
+    count requests and gives more even shards.
+
+    Aware datetimes are converted to UTC, shards are UTC unaware datetimes.
+
+    Args:
+        counts: Tweets Counts client with `.query()` defined
+        start: Start of the range, inclusive
+        end: End of the range, exclusive
+        granularity: Size of the count buckets: minute, hour, or day
+        pages_per_shard: Target number of search pages per shard
+        page_size: `max_results` of the search, tweets per page
+    """
+    start, end = _naive_utc(start), _naive_utc(end)
+    cursor = Cursor(_counts_spec(counts.prepare(), start, end, granularity))
+    buckets: list[Count] = []
+    while cursor.more:
+        page = counts.fetch_page(cursor)
+        buckets.extend(page.get("data") or [])
+    return balance_shards(buckets, start, end, pages_per_shard * page_size)
+
+
+async def async_plan_shards(
+    counts: AsyncTweetsCounts,
+    start: datetime,
+    end: datetime,
+    *,
+    granularity: Granularity = "hour",
+    pages_per_shard: int = 10,
+    page_size: int = MAX_RESULTS,
+) -> list[TimeWindow]:
+    """Async `plan_shards()`, counts with an AsyncTweetsCounts client."""
+    start, end = _naive_utc(start), _naive_utc(end)
+    cursor = Cursor(_counts_spec(counts.prepare(), start, end, granularity))
+    buckets: list[Count] = []
+    while cursor.more:
+        page = await counts.fetch_page(cursor)
+        buckets.extend(page.get("data") or [])
+    return balance_shards(buckets, start, end, pages_per_shard * page_size)
+
+
+def balance_shards(
+    buckets: Iterable[Count],
+    start: datetime,
+    end: datetime,
+    tweets_per_shard: int,
+) -> list[TimeWindow]:
+    """
+    Cut start to end into contiguous shards of up to `tweets_per_shard` tweets.
+
+    Consecutive buckets are merged until the next would overflow the shard. A
+    single bucket holding more than a shard is split into equal time slices,
+    assuming tweets are spread evenly within the bucket. Aware datetimes are
+    converted to UTC, shards are UTC unaware datetimes.
+
+    Args:
+        buckets: Count buckets (`start`, `end`, `tweet_count`) of the range
+        start: Start of the range, start of the first shard
+        end: End of the range, end of the last shard
+        tweets_per_shard: Target tweets of each shard
+    """
+    if tweets_per_shard < 1:
+        raise ValueError("tweets_per_shard must be at least 1")
+    start, end = _naive_utc(start), _naive_utc(end)
+    shards: list[TimeWindow] = []
+    shard_start = start
+    shard_count = 0
+    for bucket in sorted(buckets, key=lambda bucket: bucket["start"]):
+        bucket_start = max(from_ISO8601(bucket["start"]), start)
+        bucket_end = min(from_ISO8601(bucket["end"]), end)
+        count = bucket.get("tweet_count", 0)
+        if bucket_end <= bucket_start:
+            continue
+
+        if shard_count and shard_count + count > tweets_per_shard:
+            shards.append((shard_start, bucket_start))
+            shard_start, shard_count = bucket_start, 0
+
+        if count > tweets_per_shard:
+            slices = math.ceil(count / tweets_per_shard)
+            shards.extend(time_windows(shard_start, bucket_end, slices))
+            shard_start = bucket_end
+        else:
+            shard_count += count
+
+    if shard_start < end:
+        if shards and not shard_count:
+            # Nothing left to search after the last shard, stretch it to the end
+            shards[-1] = (shards[-1][0], end)
+        else:
+            shards.append((shard_start, end))
+    return shards
+
+
+def _counts_spec(
+    spec: QuerySpec,
+    start: datetime,
+    end: datetime,
+    granularity: Granularity,
+) -> QuerySpec:
+    """Prepared counts query with the time range and granularity replaced."""
+    fields = {
+        **spec.to_params(),
+        "start_time": to_ISO8601(start),
+        "end_time": to_ISO8601(end),
+        "granularity": granularity,
+    }
+    return QuerySpec.build(spec.url, fields)
+
+
+def _naive_utc(value: datetime) -> datetime:
+    """Convert an aware datetime to a UTC unaware datetime, as counts are."""
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
@@ -0,0 +1,215 @@
+"""
+Streaming sinks writing pages of results to NDJSON files, one page per line.
+
+Pass the raw body of the response along with the page to skip re-encoding:
+
+    with GzipNDJSONSink("recent.ndjson.gz") as sink:
+        for page in client.iter_pages():
+            sink.write(page, client.last_content)
+"""
+from __future__ import annotations
+
+import abc
+import gzip
+import io
+import json
+import os
+from collections.abc import Mapping
+from types import TracebackType
+from typing import Any
+from typing import BinaryIO
+from typing import TypeVar
+
+DEFAULT_BUFFER_SIZE = 1024 * 1024
+
+SinkT = TypeVar("SinkT", bound="Sink")
+
+
+class Sink(abc.ABC):
+    """Abstract for all sinks. Each page is written as one line of JSON."""
+
+    def __init__(self) -> None:
+        self.pages = 0
+        self.bytes_written = 0
+
+    def __enter__(self: SinkT) -> SinkT:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def write(self, page: Mapping[str, Any], raw: bytes | None = None) -> None:
+        """
+        Write a page as a line of JSON.
+
+        Args:
+            page: Decoded page of results
+            raw: Raw response body of the page, written as-is when provided
+        """
+        line = _as_line(raw) if raw else None
+        if line is None:
+            line = json.dumps(page, separators=(",", ":"), ensure_ascii=False).encode()
+        self._append(line)
+
+    def write_raw(self, raw: bytes) -> None:
+        """Write a raw response body as a line, without decoding it."""
+        line = _as_line(raw)
+        if line is None:
+            line = json.dumps(json.loads(raw), separators=(",", ":")).encode()
+        self._append(line)
+
+    def _append(self, line: bytes) -> None:
+        """Write a line and count it."""
+        self._write_line(line)
+        self.pages += 1
+        self.bytes_written += len(line) + 1
+
+    @abc.abstractmethod
+    def _write_line(self, line: bytes) -> None:
+        """Write a line of JSON, the newline is added by the sink."""
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def flush(self) -> None:
+        """Flush buffered lines to the file."""
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def close(self) -> None:
+        """Flush and close the file."""
+        raise NotImplementedError()
+
+
+class NDJSONSink(Sink):
+    """Append pages to a newline delimited JSON file."""
+
+    def __init__(self, path: str, *, buffer_size: int = DEFAULT_BUFFER_SIZE) -> None:
+        """
+        Open path for appending, created if missing.
+
+        Args:
+            path: Path of the NDJSON file
+            buffer_size: Bytes buffered in memory between writes to the file
+        """
+        super().__init__()
+        self.path = path
+        self._file: BinaryIO = self._open(path, buffer_size)
+
+    def _open(self, path: str, buffer_size: int) -> BinaryIO:
+        return open(path, "ab", buffering=buffer_size)
+
+    def _write_line(self, line: bytes) -> None:
+        self._file.write(line + b"\n")
+
+    def flush(self) -> None:
+        """Flush buffered lines to the file."""
+        self._file.flush()
+
+    def close(self) -> None:
+        """Flush and close the file."""
+        self._file.close()
+
+
+class GzipNDJSONSink(NDJSONSink):
+    """Append pages to a gzip compressed NDJSON file."""
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        compresslevel: int = 6,
+    ) -> None:
+        """
+        Open path for appending, created if missing. Appends add a gzip member.
+
+        Args:
+            path: Path of the gzip file
+            buffer_size: Bytes buffered in memory between writes to the compressor
+            compresslevel: Compression level, 1 (fastest) to 9 (smallest)
+        """
+        self.compresslevel = compresslevel
+        super().__init__(path, buffer_size=buffer_size)
+
+    def _open(self, path: str, buffer_size: int) -> BinaryIO:
+        compressed = gzip.open(path, "ab", compresslevel=self.compresslevel)
+        return io.BufferedWriter(compressed, buffer_size)  # type: ignore
+
+
+class RotatingSink(Sink):
+    """Write pages across numbered NDJSON files of bounded size."""
+
+    def __init__(
+        self,
+        pattern: str,
+        *,
+        max_bytes: int = 256 * 1024 * 1024,
+        max_pages: int | None = None,
+        compress: bool = False,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+    ) -> None:
+        """
+        Rotate to the next file once a limit is reached. Files are opened lazily.
+
+        Args:
+            pattern: Path with an `{index}` field, e.g. "tweets-{index:05d}.ndjson"
+            max_bytes: Uncompressed bytes written to a file before rotating
+            max_pages: Pages written to a file before rotating (None: no limit)
+            compress: Write gzip compressed files
+            buffer_size: Bytes buffered in memory between writes to the file
+        """
+        super().__init__()
+        self.pattern = pattern
+        self.max_bytes = max_bytes
+        self.max_pages = max_pages
+        self.compress = compress
+        self.buffer_size = buffer_size
+        self.paths: list[str] = []
+        self._sink: NDJSONSink | None = None
+
+    def _write_line(self, line: bytes) -> None:
+        sink = self._sink
+        if sink is None or self._full(sink, len(line) + 1):
+            sink = self._rotate()
+        sink._append(line)
+
+    def _full(self, sink: NDJSONSink, size: int) -> bool:
+        """True if a line of size bytes does not fit in the file of sink."""
+        if self.max_pages is not None and sink.pages >= self.max_pages:
+            return True
+        return 0 < sink.bytes_written and sink.bytes_written + size > self.max_bytes
+
+    def _rotate(self) -> NDJSONSink:
+        """Close the current file and open the next one."""
+        if self._sink is not None:
+            self._sink.close()
+        path = self.pattern.format(index=len(self.paths))
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        sink_type = GzipNDJSONSink if self.compress else NDJSONSink
+        self._sink = sink_type(path, buffer_size=self.buffer_size)
+        self.paths.append(path)
+        return self._sink
+
+    def flush(self) -> None:
+        """Flush buffered lines to the current file."""
+        if self._sink is not None:
+            self._sink.flush()
+
+    def close(self) -> None:
+        """Flush and close the current file."""
+        if self._sink is not None:
+            self._sink.close()
+            self._sink = None
+
+
+def _as_line(raw: bytes) -> bytes | None:
+    """Raw JSON body as a single line, None if it spans lines."""
+    line = raw.strip()
+    return None if b"\n" in line or b"\r" in line else line
@@ -0,0 +1,136 @@
+"""
+Persistent token stores, letting auth clients start without re-authenticating.
+
+Provide a store to `AppAuthClient` or `UserAuthClient` as `token_store`. Tokens
+are saved as they are granted or refreshed and loaded on first use.
+"""
+from __future__ import annotations
+
+import abc
+import json
+import os
+import sqlite3
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from twitterapiv2.model.oauth_token import OAuthToken
+
+
+class TokenStore(abc.ABC):
+    """Abstract for all token stores. Tokens are saved by a key per credential."""
+
+    @abc.abstractmethod
+    def load(self, key: str) -> OAuthToken | None:
+        """Return stored token of key, None if not stored."""
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def save(self, key: str, token: OAuthToken) -> None:
+        """Store token under key, replacing any existing token."""
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove token of key, if stored."""
+        raise NotImplementedError()
+
+
+class FileTokenStore(TokenStore):
+    """Store tokens in a JSON file readable only by the current user."""
+
+    def __init__(self, path: str) -> None:
+        """Provide path of the JSON file. Created on first save."""
+        self.path = path
+        self._lock = threading.Lock()
+
+    def load(self, key: str) -> OAuthToken | None:
+        """Return stored token of key, None if not stored."""
+        with self._lock:
+            token = self._read().get(key)
+        return OAuthToken(**token) if token else None
+
+    def save(self, key: str, token: OAuthToken) -> None:
+        """Store token under key, replacing any existing token."""
+        with self._lock:
+            tokens = self._read()
+            tokens[key] = token.to_dict()
+            self._write(tokens)
+
+    def delete(self, key: str) -> None:
+        """Remove token of key, if stored."""
+        with self._lock:
+            tokens = self._read()
+            if tokens.pop(key, None) is not None:
+                self._write(tokens)
+
+    def _read(self) -> dict[str, dict[str, Any]]:
+        try:
+            with open(self.path, encoding="utf-8") as infile:
+                return json.load(infile)
+        except FileNotFoundError:
+            return {}
+
+    def _write(self, tokens: dict[str, dict[str, Any]]) -> None:
+        temp_path = f"{self.path}.tmp"
+        fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with open(fd, "w", encoding="utf-8") as outfile:
+            json.dump(tokens, outfile)
+        os.replace(temp_path, self.path)
+
+
+class SQLiteTokenStore(TokenStore):
+    """Store tokens in a SQLite database, safe to share between processes."""
+
+    def __init__(self, path: str) -> None:
+        """Provide path of the SQLite database. Created if missing."""
+        self.path = path
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS tokens ("
+                "key TEXT PRIMARY KEY, "
+                "access_token TEXT NOT NULL, "
+                "refresh_token TEXT, "
+                "expires_at REAL, "
+                "token_type TEXT NOT NULL)"
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection for one transaction, committed and closed on exit."""
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def load(self, key: str) -> OAuthToken | None:
+        """Return stored token of key, None if not stored."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT access_token, refresh_token, expires_at, token_type "
+                "FROM tokens WHERE key = ?",
+                (key,),
+            ).fetchone()
+        return OAuthToken(*row) if row else None
+
+    def save(self, key: str, token: OAuthToken) -> None:
+        """Store token under key, replacing any existing token."""
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO tokens VALUES (?, ?, ?, ?, ?)",
+                (
+                    key,
+                    token.access_token,
+                    token.refresh_token,
+                    token.expires_at,
+                    token.token_type,
+                ),
+            )
+
+    def delete(self, key: str) -> None:
+        """Remove token of key, if stored."""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM tokens WHERE key = ?", (key,))
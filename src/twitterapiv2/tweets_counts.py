@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
+from collections.abc import Iterator
 from typing import TYPE_CHECKING
 
+from twitterapiv2._auth_client import AsyncAuthClient
 from twitterapiv2._auth_client import AuthClient
+from twitterapiv2.client_core import AsyncClientCore
 from twitterapiv2.client_core import ClientCore
+from twitterapiv2.model.query_spec import QuerySpec
 from twitterapiv2.model.tweet_count import TweetCount
 
 if TYPE_CHECKING:
@@ -38,15 +43,111 @@ class TweetsCounts(ClientCore):
         self.granularity = self.field_builder.granularity
         self.query = self.field_builder.query
 
-    def fetch(self) -> TweetCount:
+    def prepare(self) -> QuerySpec:
+        """Return the defined fields as an immutable query for `.fetch(spec)`."""
+        return QuerySpec.build(self._url, self.field_builder.fields, required=["query"])
+
+    def fetch(self, spec: QuerySpec | None = None) -> TweetCount:
         """
         Fetches the count of Tweets from the last seven days that match a query
 
         Time-range can be controlled with start_time and end_time. Pagination
         only available with Acedemic research applications. `.next_token()` will
         be populated with the needed page_token on each call.
+
+        Args:
+            spec: Prepared query (see `.prepare()`) to run in place of the fields
         """
-        if not self.fields.get("query"):
+        if spec is not None:
+            return self.get_prepared(spec)
+        fields = self.fields
+        if not fields.get("query"):
             raise ValueError(".query() is a required field to be defined.")
 
-        return self.get(self._url)
+        return self.get(self._url, fields)
+
+    def iter_pages(
+        self,
+        *,
+        max_pages: int | None = None,
+        spec: QuerySpec | None = None,
+    ) -> Iterator[TweetCount]:
+        """
+        Lazily fetch pages, following `meta.next_token` until none remain.
+
+        Continues from the current pagination state of the client. Stops early
+        once `max_pages` have been fetched. A prepared `spec` is run in place
+        of the defined fields.
+        """
+        pages = 0
+        while True:
+            page = self.fetch(spec)
+            pages += 1
+            yield page
+            if not self.more or (max_pages is not None and pages >= max_pages):
+                return
+
+
+class AsyncTweetsCounts(AsyncClientCore):
+    scopes = ["tweet.read", "offline.access"]
+
+    def __init__(
+        self,
+        auth_client: AsyncAuthClient,
+        *,
+        end_point: Literal["recent", "all"] = "recent",
+    ) -> None:
+        """
+        Create async Tweets Counts client. Build query with methods, await .fetch()
+
+        end_point allows use of `/counts/all` endpoint for Academic Research access
+        """
+        super().__init__(auth_client)
+        self._url = URL_ALL if end_point == "all" else URL_RECENT
+
+        # Define builder methods
+        self.start_time = self.field_builder.start_time
+        self.end_time = self.field_builder.end_time
+        self.since_id = self.field_builder.since_id
+        self.until_id = self.field_builder.until_id
+        self.granularity = self.field_builder.granularity
+        self.query = self.field_builder.query
+
+    def prepare(self) -> QuerySpec:
+        """Return the defined fields as an immutable query for `.fetch(spec)`."""
+        return QuerySpec.build(self._url, self.field_builder.fields, required=["query"])
+
+    async def fetch(self, spec: QuerySpec | None = None) -> TweetCount:
+        """
+        Fetches the count of Tweets from the last seven days that match a query
+
+        See `TweetsCounts.fetch()` for pagination and spec behavior.
+        """
+        if spec is not None:
+            return await self.get_prepared(spec)
+        fields = self.fields
+        if not fields.get("query"):
+            raise ValueError(".query() is a required field to be defined.")
+
+        return await self.get(self._url, fields)
+
+    async def iter_pages(
+        self,
+        *,
+        max_pages: int | None = None,
+        spec: QuerySpec | None = None,
+    ) -> AsyncIterator[TweetCount]:
+        """
+        Lazily fetch pages, following `meta.next_token` until none remain.
+
+        Continues from the current pagination state of the client. Stops early
+        once `max_pages` have been fetched. A prepared `spec` is run in place
+        of the defined fields.
+        """
+        pages = 0
+        while True:
+            page = await self.fetch(spec)
+            pages += 1
+            yield page
+            if not self.more or (max_pages is not None and pages >= max_pages):
+                return
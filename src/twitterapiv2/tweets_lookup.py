@@ -1,10 +1,55 @@
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
+from collections.abc import Iterable
+from collections.abc import Iterator
+from typing import Any
+
+from twitterapiv2._auth_client import AsyncAuthClient
 from twitterapiv2._auth_client import AuthClient
+from twitterapiv2.client_core import AsyncClientCore
 from twitterapiv2.client_core import ClientCore
+from twitterapiv2.model.query_spec import QuerySpec
 from twitterapiv2.model.recent import Data
+from twitterapiv2.model.recent import Recent
+from twitterapiv2.rate_limit import RateLimiter
+from twitterapiv2.util.concurrency import async_bounded_map
+from twitterapiv2.util.concurrency import bounded_map
+from twitterapiv2.util.concurrency import chunked
 
 URL = "https://api.twitter.com/2/tweets"
+MAX_IDS = 100
+# Key identifying each object type of `includes`, used to drop duplicates on merge
+INCLUDES_KEYS = {"media": "media_key"}
+
+
+def merge_results(results: Iterable[Recent]) -> Recent:
+    """Merge `data`, `includes`, and `errors` of many lookup responses into one."""
+    merged: Recent = {"data": [], "includes": {}, "errors": []}
+    seen: dict[str, set[str]] = {}
+    for result in results:
+        merged["data"].extend(result.get("data") or [])
+        merged["errors"].extend(result.get("errors") or [])
+        includes: dict[str, Any] = result.get("includes") or {}  # type: ignore
+        for name, objects in includes.items():
+            key = INCLUDES_KEYS.get(name, "id")
+            known = seen.setdefault(name, set())
+            merged_objects = merged["includes"].setdefault(name, [])  # type: ignore
+            for obj in objects:
+                if obj.get(key) not in known:
+                    known.add(obj.get(key))
+                    merged_objects.append(obj)
+    return merged
+
+
+def _lookup_params(fields: dict[str, Any], chunk: list[str]) -> dict[str, Any]:
+    """Fields of a single lookup request for a chunk of IDs."""
+    return {**fields, "ids": ",".join(chunk)}
+
+
+def _clean_ids(ids: Iterable[str | int]) -> Iterator[str]:
+    """Normalize IDs to stripped strings, skipping empty values."""
+    return (str(tweet_id).strip() for tweet_id in ids if str(tweet_id).strip())
 
 
 class TweetsLookup(ClientCore):
@@ -23,14 +68,135 @@ class TweetsLookup(ClientCore):
         self.user_fields = self.field_builder.user_fields
         self.ids = self.field_builder.ids
 
-    def fetch(self) -> list[Data]:
+    def prepare(self) -> QuerySpec:
+        """Return the defined fields as an immutable query for `.fetch(spec)`."""
+        return QuerySpec.build(URL, self.field_builder.fields, required=["ids"])
+
+    def fetch(self, spec: QuerySpec | None = None) -> list[Data]:
         """
         Return information about Tweet(s) specified by requested ID(s).
 
         TweetsLookup.ids("") is a required field. A maximum of 100 IDs can
         be provided. There is no pagination for this client.
+
+        Args:
+            spec: Prepared query (see `.prepare()`) to run in place of the fields
+        """
+        if spec is not None:
+            return self.get_prepared(spec).get("data") or []
+        fields = self.fields
+        if not fields.get("ids"):
+            raise ValueError(".ids() is a required field to be defined.")
+        results = self.get(URL, fields)
+        return results.get("data") or []
+
+    def fetch_many(
+        self,
+        ids: Iterable[str | int],
+        *,
+        ordered: bool = True,
+        max_workers: int = 4,
+    ) -> Iterator[Recent]:
+        """
+        Lookup any number of Tweet IDs, yielding one response per 100 IDs.
+
+        IDs are consumed lazily and chunked into requests of up to 100 IDs that
+        run concurrently. Requests wait on the client's `.rate_limiter`, a
+        RateLimiter is assigned if none is defined, so a throttled chunk is
+        waited out and resent. The `.ids()` field is ignored, the pagination and
+        response state of the client are left unchanged.
+
+        Args:
+            ids: Iterable of Tweet IDs of any length
+            ordered: Yield responses in input order, otherwise as they complete
+            max_workers: Number of concurrent requests
+        """
+        if self.rate_limiter is None:
+            self.rate_limiter = RateLimiter()
+        fields = {k: v for k, v in self.fields.items() if k != "ids"}
+
+        def lookup(chunk: list[str]) -> Recent:
+            _, result = self._get_response(URL, _lookup_params(fields, chunk))
+            return result
+
+        chunks = chunked(_clean_ids(ids), MAX_IDS)
+        yield from bounded_map(lookup, chunks, max_workers=max_workers, ordered=ordered)
+
+    def fetch_bulk(self, ids: Iterable[str | int], *, max_workers: int = 4) -> Recent:
+        """Lookup any number of Tweet IDs, returns merged result. See `.fetch_many()`"""
+        return merge_results(self.fetch_many(ids, max_workers=max_workers))
+
+
+class AsyncTweetsLookup(AsyncClientCore):
+    scopes = ["tweet.read", "offline.access"]
+
+    def __init__(self, auth_client: AsyncAuthClient) -> None:
+        """Async lookup of information about Tweet(s) specified by ID(s)."""
+        super().__init__(auth_client)
+
+        # Define field builder methods
+        self.expansions = self.field_builder.expansions
+        self.media_fields = self.field_builder.media_fields
+        self.place_fields = self.field_builder.place_fields
+        self.poll_fields = self.field_builder.poll_fields
+        self.tweet_fields = self.field_builder.tweet_fields
+        self.user_fields = self.field_builder.user_fields
+        self.ids = self.field_builder.ids
+
+    def prepare(self) -> QuerySpec:
+        """Return the defined fields as an immutable query for `.fetch(spec)`."""
+        return QuerySpec.build(URL, self.field_builder.fields, required=["ids"])
+
+    async def fetch(self, spec: QuerySpec | None = None) -> list[Data]:
+        """
+        Return information about Tweet(s) specified by requested ID(s).
+
+        AsyncTweetsLookup.ids("") is a required field. A maximum of 100 IDs can
+        be provided. There is no pagination for this client. See
+        `TweetsLookup.fetch()` for spec behavior.
         """
-        if not self.fields.get("ids"):
+        if spec is not None:
+            return (await self.get_prepared(spec)).get("data") or []
+        fields = self.fields
+        if not fields.get("ids"):
             raise ValueError(".ids() is a required field to be defined.")
-        results = self.get(URL)
+        results = await self.get(URL, fields)
         return results.get("data") or []
+
+    async def fetch_many(
+        self,
+        ids: Iterable[str | int],
+        *,
+        ordered: bool = True,
+        max_concurrency: int = 4,
+    ) -> AsyncIterator[Recent]:
+        """
+        Lookup any number of Tweet IDs, yielding one response per 100 IDs.
+
+        See `TweetsLookup.fetch_many()`.
+        """
+        if self.rate_limiter is None:
+            self.rate_limiter = RateLimiter()
+        fields = {k: v for k, v in self.fields.items() if k != "ids"}
+
+        async def lookup(chunk: list[str]) -> Recent:
+            _, result = await self._get_response(URL, _lookup_params(fields, chunk))
+            return result
+
+        async for result in async_bounded_map(
+            lookup,
+            chunked(_clean_ids(ids), MAX_IDS),
+            max_concurrency=max_concurrency,
+            ordered=ordered,
+        ):
+            yield result
+
+    async def fetch_bulk(
+        self,
+        ids: Iterable[str | int],
+        *,
+        max_concurrency: int = 4,
+    ) -> Recent:
+        """Lookup any number of Tweet IDs, returns merged result. See `.fetch_many()`"""
+        results = self.fetch_many(ids, max_concurrency=max_concurrency)
+        return merge_results([result async for result in results])
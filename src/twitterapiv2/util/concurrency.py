@@ -0,0 +1,113 @@
+"""Bounded concurrent map over lazy iterables, used by bulk client methods."""
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator
+from collections.abc import Awaitable
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Iterator
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+from itertools import islice
+from typing import TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def chunked(items: Iterable[T], size: int) -> Iterator[list[T]]:
+    """Lazily split items into lists of up to `size` items."""
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def bounded_map(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    *,
+    max_workers: int,
+    ordered: bool = True,
+) -> Iterator[R]:
+    """
+    Run func over items in a thread pool, yielding results as a stream.
+
+    Items are consumed lazily and at most `max_workers * 2` results are held
+    in flight, so memory stays flat regardless of the number of items.
+
+    Args:
+        func: Callable applied to each item
+        items: Any iterable of items
+        max_workers: Number of worker threads
+        ordered: Yield results in input order, otherwise as they complete
+    """
+    window = max_workers * 2
+    iterator = iter(items)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending: deque[Future[R]] = deque(
+            executor.submit(func, item) for item in islice(iterator, window)
+        )
+        try:
+            while pending:
+                if ordered:
+                    done = [pending.popleft()]
+                else:
+                    finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    done = [future for future in pending if future in finished]
+                    for future in done:
+                        pending.remove(future)
+
+                for future in done:
+                    yield future.result()
+                    for item in islice(iterator, 1):
+                        pending.append(executor.submit(func, item))
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+async def async_bounded_map(
+    func: Callable[[T], Awaitable[R]],
+    items: Iterable[T],
+    *,
+    max_concurrency: int,
+    ordered: bool = True,
+) -> AsyncIterator[R]:
+    """
+    Run func over items as concurrent tasks, yielding results as a stream.
+
+    Async counterpart of `bounded_map()`, at most `max_concurrency` tasks run
+    at once.
+    """
+    iterator = iter(items)
+    pending: deque[asyncio.Task[R]] = deque(
+        asyncio.ensure_future(func(item)) for item in islice(iterator, max_concurrency)
+    )
+    try:
+        while pending:
+            if ordered:
+                done = [pending.popleft()]
+                await asyncio.wait(done)
+            else:
+                finished, _ = await asyncio.wait(
+                    pending,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                done = [task for task in pending if task in finished]
+                for task in done:
+                    pending.remove(task)
+
+            for task in done:
+                yield task.result()
+                for item in islice(iterator, 1):
+                    pending.append(asyncio.ensure_future(func(item)))
+    finally:
+        for task in pending:
+            task.cancel()
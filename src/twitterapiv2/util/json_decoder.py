@@ -0,0 +1,31 @@
+"""
+JSON decoders for response bodies.
+
+`orjson` is used when installed (`pip install twitterapiv2[orjson]`), otherwise
+the standard library `json` module.
+"""
+from __future__ import annotations
+
+import functools
+import json
+from collections.abc import Callable
+from typing import Any
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    JSONDecoder = Callable[[bytes], Any]
+
+
+def stdlib_decoder(content: bytes) -> Any:
+    """Decode with the standard library `json` module."""
+    return json.loads(content)
+
+
+@functools.lru_cache(maxsize=None)
+def default_decoder() -> JSONDecoder:
+    """Return `orjson.loads` if orjson is installed, else `stdlib_decoder`."""
+    try:
+        import orjson  # type: ignore  # optional dependency
+    except ImportError:
+        return stdlib_decoder
+    return orjson.loads
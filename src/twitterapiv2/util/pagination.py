@@ -0,0 +1,44 @@
+"""Stop conditions shared by the lazy pagination iterators of client classes."""
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import datetime
+from datetime import timezone
+from typing import Any
+
+from twitterapiv2.util.rules import from_ISO8601
+
+
+@dataclass(frozen=True)
+class PageLimits:
+    """Optional limits that end pagination early. `None` means unlimited."""
+
+    max_pages: int | None = None
+    max_tweets: int | None = None
+    oldest: datetime | None = None
+
+    def __post_init__(self) -> None:
+        """Normalize an aware `oldest` to a UTC unaware datetime."""
+        if self.oldest is not None and self.oldest.tzinfo is not None:
+            oldest = self.oldest.astimezone(timezone.utc).replace(tzinfo=None)
+            object.__setattr__(self, "oldest", oldest)
+
+    def reached(self, pages: int, tweets: int, page: Mapping[str, Any]) -> bool:
+        """True if no further page should be requested after `page`."""
+        if self.max_pages is not None and pages >= self.max_pages:
+            return True
+        if self.max_tweets is not None and tweets >= self.max_tweets:
+            return True
+        data = page.get("data") or []
+        return bool(data) and self.too_old(data[-1])
+
+    def too_old(self, tweet: Mapping[str, Any]) -> bool:
+        """
+        True if the tweet was created before `oldest`.
+
+        Requires `created_at` in `.tweet_fields()`, tweets without it never match.
+        """
+        if self.oldest is None or not tweet.get("created_at"):
+            return False
+        return from_ISO8601(tweet["created_at"]) < self.oldest
@@ -14,3 +14,8 @@ def is_ISO8601(dt_string: str | None) -> bool:
 def to_ISO8601(dt: datetime) -> str:
     """Convert datetime object to ISO 8601 standard UTC string"""
     return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def from_ISO8601(dt_string: str) -> datetime:
+    """Convert ISO 8601 UTC string, with or without milliseconds, to datetime"""
+    return datetime.strptime(dt_string[:19], "%Y-%m-%dT%H:%M:%S")
@@ -1,11 +1,17 @@
 from __future__ import annotations
 
+import asyncio
+from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 from twitterapiv2._appauth_client import AppAuthClient
+from twitterapiv2._appauth_client import AsyncAppAuthClient
 from twitterapiv2.model.application_auth import ApplicationAuth
+from twitterapiv2.model.oauth_token import OAuthToken
+from twitterapiv2.token_store import FileTokenStore
 
+from tests.fixtures.httpmocker import AsyncHttpMocker
 from tests.fixtures.httpmocker import HttpMocker
 
 MOCK_KEY = "xvz1evFS4wEEPTGEFPHBog"
@@ -23,6 +29,11 @@ def client() -> AppAuthClient:
     return AppAuthClient(ApplicationAuth(MOCK_KEY, MOCK_SECRET), [])
 
 
+@pytest.fixture
+def async_client() -> AsyncAppAuthClient:
+    return AsyncAppAuthClient(ApplicationAuth(MOCK_KEY, MOCK_SECRET), [])
+
+
 def test_encoded_credentials(client: AppAuthClient) -> None:
     result = client._encoded_credentials()
     assert result == MOCK_CRED
@@ -75,3 +86,58 @@ def test_get_consumer_bearer_when_exists(client: AppAuthClient) -> None:
     result = client.get_bearer()
 
     assert result == "mock"
+
+
+def test_async_get_consumer_bearer(async_client: AsyncAppAuthClient) -> None:
+    with patch.object(async_client, "http", AsyncHttpMocker()) as mock_http:
+        url = async_client.twitter_api + "/oauth2/token"
+        mock_http.add_response(MOCK_RESP, {}, 200, url)
+
+        result = asyncio.run(async_client.get_bearer())
+
+        assert result == MOCK_BEARER
+
+
+def test_async_invalid_bearer_request(async_client: AsyncAppAuthClient) -> None:
+    with patch.object(async_client, "http", AsyncHttpMocker()) as mock_http:
+        url = async_client.twitter_api + "/oauth2/token"
+        mock_http.add_response(BAD_REQUEST, {}, 403, url)
+
+        with pytest.raises(ValueError):
+            asyncio.run(async_client._get_bearer_token())
+
+
+def test_async_get_consumer_bearer_when_exists(
+    async_client: AsyncAppAuthClient,
+) -> None:
+    async_client._keys.consumer_bearer = "mock"
+
+    result = asyncio.run(async_client.get_bearer())
+
+    assert result == "mock"
+
+
+def test_get_bearer_from_token_store(tmp_path: Path) -> None:
+    store = FileTokenStore(str(tmp_path / "tokens.json"))
+    store.save(f"app:{MOCK_KEY}", OAuthToken("stored"))
+    auth = ApplicationAuth(MOCK_KEY, MOCK_SECRET)
+    client = AppAuthClient(auth, [], token_store=store)
+
+    with patch.object(client, "_get_bearer_token") as mock_get_token:
+        result = client.get_bearer()
+
+    assert result == "stored"
+    mock_get_token.assert_not_called()
+
+
+def test_get_bearer_saves_to_token_store(tmp_path: Path) -> None:
+    store = FileTokenStore(str(tmp_path / "tokens.json"))
+    auth = ApplicationAuth(MOCK_KEY, MOCK_SECRET)
+    client = AppAuthClient(auth, [], token_store=store)
+
+    with patch.object(client, "http", HttpMocker()) as mock_http:
+        mock_http.add_response(MOCK_RESP, {}, 200, client.twitter_api + "/oauth2/token")
+
+        client.get_bearer()
+
+    assert store.load(f"app:{MOCK_KEY}") == OAuthToken(MOCK_BEARER)
@@ -1,13 +1,21 @@
 from __future__ import annotations
 
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import AsyncMock
 from unittest.mock import MagicMock
 from unittest.mock import patch
 
 import pytest
+from twitterapiv2._userauth_client import AsyncUserAuthClient
 from twitterapiv2._userauth_client import TWITTER_AUTH
 from twitterapiv2._userauth_client import TWITTER_TOKEN
 from twitterapiv2._userauth_client import UserAuthClient
 from twitterapiv2.model.client_auth import ClientAuth
+from twitterapiv2.model.oauth_token import OAuthToken
+from twitterapiv2.token_store import FileTokenStore
 
 
 @pytest.fixture
@@ -87,3 +95,176 @@ def test__get_authorization_response(client: UserAuthClient) -> None:
         mock_input.return_value = "groovy"
 
         assert client._get_authorization_response("Some String") == "groovy"
+
+
+def test_async_get_bearer_token() -> None:
+    client = AsyncUserAuthClient(MagicMock(), [])
+
+    with patch.object(client, "_oauth2_client") as mock_oauth2:
+        mock_oauth2.return_value.create_authorization_url.return_value = (
+            "https://mock.auth.url",
+            None,
+        )
+        mock_oauth2.return_value.fetch_token = AsyncMock(
+            return_value={"access_token": "mock"}
+        )
+
+        with patch.object(
+            UserAuthClient,
+            "_get_authorization_response",
+            return_value="mock_response",
+        ):
+            result = asyncio.run(client.get_bearer())
+
+        assert result == "mock"
+        mock_oauth2().fetch_token.assert_awaited_once()
+
+
+def test_async_get_bearer_token_exists() -> None:
+    client = AsyncUserAuthClient(MagicMock(), [])
+    client._bearer = "mock_bearer"
+
+    with patch.object(client, "_oauth2_client") as mock_oauth2:
+        result = asyncio.run(client.get_bearer())
+
+        assert result == "mock_bearer"
+        mock_oauth2().create_authorization_url.assert_not_called()
+
+
+def test_async_oauth2_client() -> None:
+    client = AsyncUserAuthClient(ClientAuth("mock_id", "mock_secret", "127.0.0.1"), [])
+
+    result = client._oauth2_client()
+
+    assert result.client_id == "mock_id"
+    assert result.redirect_uri == "127.0.0.1"
+
+
+def test_get_bearer_from_token_store(tmp_path: Path) -> None:
+    store = FileTokenStore(str(tmp_path / "tokens.json"))
+    store.save("user:mock_id", OAuthToken("stored", expires_at=time.time() + 3600))
+    client = UserAuthClient(ClientAuth("mock_id"), [], token_store=store)
+
+    with patch.object(client, "_get_bearer_token") as mock_get_token:
+        result = client.get_bearer()
+
+    assert result == "stored"
+    mock_get_token.assert_not_called()
+
+
+def test_get_bearer_refreshes_expired_token(tmp_path: Path) -> None:
+    store = FileTokenStore(str(tmp_path / "tokens.json"))
+    store.save("user:mock_id", OAuthToken("old", "refresh", time.time() - 10))
+    client = UserAuthClient(ClientAuth("mock_id"), [], token_store=store)
+    refreshed = {"access_token": "new", "refresh_token": "refresh2", "expires_in": 60}
+
+    with patch.object(client, "_oauth2_client") as mock_oauth2:
+        mock_oauth2.return_value.refresh_token.return_value = refreshed
+
+        result = client.get_bearer()
+
+    assert result == "new"
+    mock_oauth2().refresh_token.assert_called_once_with(
+        url=TWITTER_TOKEN,
+        refresh_token="refresh",
+    )
+    stored = store.load("user:mock_id")
+    assert stored is not None
+    assert stored.refresh_token == "refresh2"
+
+
+def test_get_bearer_refreshes_once_across_threads() -> None:
+    client = UserAuthClient(ClientAuth("mock_id"), [])
+    client._token = OAuthToken("old", "refresh", time.time() - 10)
+    client._bearer = "old"
+    refreshed = {"access_token": "new", "refresh_token": "refresh2", "expires_in": 7200}
+
+    def refresh(**kwargs: str) -> dict[str, object]:
+        time.sleep(0.05)
+        return refreshed
+
+    with patch.object(client, "_oauth2_client") as mock_oauth2:
+        mock_oauth2.return_value.refresh_token.side_effect = refresh
+        with patch.object(client, "_get_bearer_token") as mock_get_token:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                results = list(executor.map(lambda _: client.get_bearer(), range(8)))
+
+    assert results == ["new"] * 8
+    mock_oauth2().refresh_token.assert_called_once()
+    mock_get_token.assert_not_called()
+
+
+def test_get_bearer_reauthorizes_when_refresh_fails() -> None:
+    client = UserAuthClient(ClientAuth("mock_id"), [])
+    client._token = OAuthToken("old", "refresh", time.time() - 10)
+    client._bearer = "old"
+
+    with patch.object(client, "_oauth2_client") as mock_oauth2:
+        mock_oauth2.return_value.refresh_token.side_effect = ValueError("revoked")
+        with patch.object(client, "_get_bearer_token") as mock_get_token:
+            client.get_bearer()
+
+    mock_get_token.assert_called_once()
+
+
+def test_get_bearer_saves_granted_token(tmp_path: Path) -> None:
+    store = FileTokenStore(str(tmp_path / "tokens.json"))
+    client = UserAuthClient(ClientAuth("mock_id"), [], token_store=store)
+
+    with patch.object(client, "_oauth2_client") as mock_oauth2:
+        mock_oauth2.return_value.create_authorization_url.return_value = ("url", None)
+        mock_oauth2.return_value.fetch_token.return_value = {"access_token": "mock"}
+        with patch.object(client, "_get_authorization_response"):
+            client.get_bearer()
+
+    assert store.load("user:mock_id") == OAuthToken("mock")
+
+
+def test_users_of_one_app_share_a_token_store(tmp_path: Path) -> None:
+    store = FileTokenStore(str(tmp_path / "tokens.json"))
+    app = ClientAuth("mock_id")
+    store.save("user:alice", OAuthToken("alice", expires_at=time.time() + 3600))
+    store.save("user:bob", OAuthToken("bob", expires_at=time.time() + 3600))
+    alice = UserAuthClient(app, [], token_store=store, store_key="user:alice")
+    bob = AsyncUserAuthClient(app, [], token_store=store, store_key="user:bob")
+
+    assert alice.get_bearer() == "alice"
+    assert asyncio.run(bob.get_bearer()) == "bob"
+    assert store.load("user:mock_id") is None
+
+
+def test_async_get_bearer_refreshes_expired_token() -> None:
+    client = AsyncUserAuthClient(ClientAuth("mock_id"), [])
+    client._token = OAuthToken("old", "refresh", time.time() - 10)
+    client._bearer = "old"
+
+    with patch.object(client, "_oauth2_client") as mock_oauth2:
+        mock_oauth2.return_value.refresh_token = AsyncMock(
+            return_value={"access_token": "new"}
+        )
+
+        result = asyncio.run(client.get_bearer())
+
+    assert result == "new"
+
+
+def test_async_get_bearer_refreshes_once_across_tasks() -> None:
+    client = AsyncUserAuthClient(ClientAuth("mock_id"), [])
+    client._token = OAuthToken("old", "refresh", time.time() - 10)
+    client._bearer = "old"
+
+    async def refresh(**kwargs: str) -> dict[str, object]:
+        await asyncio.sleep(0.01)
+        return {"access_token": "new", "expires_in": 7200}
+
+    async def run() -> list[str | None]:
+        return list(await asyncio.gather(*(client.get_bearer() for _ in range(5))))
+
+    with patch.object(client, "_oauth2_client") as mock_oauth2:
+        mock_oauth2.return_value.refresh_token = AsyncMock(side_effect=refresh)
+        with patch.object(client, "_get_bearer_token") as mock_get_token:
+            results = asyncio.run(run())
+
+    assert results == ["new"] * 5
+    mock_oauth2.return_value.refresh_token.assert_awaited_once()
+    mock_get_token.assert_not_called()
@@ -0,0 +1,249 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from typing import TypeVar
+
+import httpx
+import pytest
+from twitterapiv2._appauth_client import AppAuthClient
+from twitterapiv2._appauth_client import AsyncAppAuthClient
+from twitterapiv2._userauth_client import AsyncUserAuthClient
+from twitterapiv2._userauth_client import UserAuthClient
+from twitterapiv2.auth_pool import AsyncAuthPool
+from twitterapiv2.auth_pool import AuthPool
+from twitterapiv2.auth_pool import requires_user_context
+from twitterapiv2.http_pool import HttpPool
+from twitterapiv2.manage_tweets import ManageTweets
+from twitterapiv2.model.application_auth import ApplicationAuth
+from twitterapiv2.model.client_auth import ClientAuth
+from twitterapiv2.search_recent import AsyncSearchRecent
+from twitterapiv2.search_recent import SearchRecent
+from twitterapiv2.token_store import FileTokenStore
+
+URL = "https://api.twitter.com/2/tweets/search/recent"
+RESET = "4102444800"
+HEADERS = {
+    "x-rate-limit-limit": "450",
+    "x-rate-limit-remaining": "400",
+    "x-rate-limit-reset": RESET,
+}
+
+PoolT = TypeVar("PoolT", AuthPool, AsyncAuthPool)
+
+
+def _app(bearer: str) -> AppAuthClient:
+    return AppAuthClient(ApplicationAuth("key", "secret", bearer), [])
+
+
+def _user(bearer: str) -> UserAuthClient:
+    client = UserAuthClient(ClientAuth("id", "secret", "https://mock"), [])
+    client._bearer = bearer
+    return client
+
+
+def _limited(remaining: int) -> httpx.Response:
+    headers = {**HEADERS, "x-rate-limit-remaining": str(remaining)}
+    return httpx.Response(200, headers=headers)
+
+
+def _unpaced(pool: PoolT) -> PoolT:
+    # Limiters pace requests until RESET, far in the future, only wait on 0 here
+    for credential in pool.credentials:
+        credential.rate_limiter.pace = False
+    return pool
+
+
+@pytest.mark.parametrize(
+    ("url", "method", "expected"),
+    (
+        (URL, "get", False),
+        ("https://api.twitter.com/2/users/me", "GET", True),
+        ("https://api.twitter.com/2/tweets", "POST", True),
+        ("https://api.twitter.com/2/users/123/likes/456", "DELETE", True),
+    ),
+)
+def test_requires_user_context(url: str, method: str, expected: bool) -> None:
+    assert requires_user_context(url, method) is expected
+
+
+def test_acquire_picks_most_remaining_budget() -> None:
+    pool = AuthPool([_app("one"), _app("two"), _user("three")])
+    for credential, remaining in zip(pool.credentials, (10, 300, 50)):
+        credential.rate_limiter.update(URL, _limited(remaining))
+
+    credential, _ = pool.acquire(URL)
+
+    assert credential is pool.credentials[1]
+    assert credential.budget(URL) == 299
+
+
+def test_acquire_rotates_on_ties_and_pins_user_context() -> None:
+    pool = AuthPool([_app("one"), _user("two"), _app("three"), _user("four")])
+
+    picked = [pool.acquire(URL)[0].auth_client.get_bearer() for _ in range(5)]
+    writes = {
+        pool.acquire(url, method)[0].auth_client.get_bearer()
+        for url, method in (
+            ("https://api.twitter.com/2/tweets", "POST"),
+            ("https://api.twitter.com/2/users/me", "GET"),
+            ("https://api.twitter.com/2/users/123/likes", "POST"),
+            ("https://api.twitter.com/2/users/123/likes/456", "DELETE"),
+        )
+    }
+
+    assert picked == ["one", "two", "three", "four", "one"]
+    assert writes == {"two"}
+    assert pool.user is pool.credentials[1]
+
+
+def test_acquire_pins_given_user() -> None:
+    four = _user("four")
+    pool = AuthPool([_app("one"), _user("two"), four], user=four)
+
+    credential, _ = pool.acquire("https://api.twitter.com/2/tweets", "POST")
+
+    assert credential.auth_client is four
+    with pytest.raises(ValueError):
+        AuthPool([_app("one"), _user("two")], user=_user("three"))
+
+
+def test_acquire_without_user_context_raises() -> None:
+    pool = AuthPool([_app("one")])
+
+    with pytest.raises(ValueError, match="POST /2/tweets"):
+        pool.acquire("https://api.twitter.com/2/tweets", "POST")
+    with pytest.raises(ValueError):
+        pool.user
+
+
+def test_from_models() -> None:
+    models: list[ApplicationAuth | ClientAuth] = [
+        ApplicationAuth("key", "secret"),
+        ClientAuth("id", "secret", "uri"),
+    ]
+
+    pool = AuthPool.from_models(models, ["tweet.read"])
+    async_pool = AsyncAuthPool.from_models(models, ["tweet.read"])
+
+    assert [type(c.auth_client) for c in pool.credentials] == [
+        AppAuthClient,
+        UserAuthClient,
+    ]
+    assert [type(c.auth_client) for c in async_pool.credentials] == [
+        AsyncAppAuthClient,
+        AsyncUserAuthClient,
+    ]
+    with pytest.raises(ValueError):
+        AuthPool.from_models([object()], [])  # type: ignore[list-item]
+    with pytest.raises(ValueError):
+        AuthPool([])
+
+
+def test_from_models_store_keys(tmp_path: Path) -> None:
+    store = FileTokenStore(str(tmp_path / "tokens.json"))
+    models: list[ApplicationAuth | ClientAuth] = [
+        ApplicationAuth("key", "secret"),
+        ClientAuth("id"),
+        ClientAuth("id"),
+    ]
+
+    pool = AsyncAuthPool.from_models(
+        models, [], token_store=store, store_keys=[None, "user:alice", "user:bob"]
+    )
+
+    keys = [c.auth_client._store_key for c in pool.credentials[1:]]  # type: ignore
+    assert keys == ["user:alice", "user:bob"]
+    with pytest.raises(ValueError, match="user:id"):
+        AuthPool.from_models(models, [], token_store=store)
+    with pytest.raises(ValueError):
+        AuthPool.from_models(models, [], store_keys=["user:alice"])
+    # Without a shared store the default keys never collide
+    assert len(AuthPool.from_models(models, []).credentials) == 3
+
+
+def test_client_spreads_requests_by_remaining_budget() -> None:
+    remaining = {"Bearer one": 100, "Bearer two": 100}
+    sent: list[str] = []
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        bearer = request.headers["authorization"]
+        sent.append(bearer)
+        remaining[bearer] -= 1 if bearer == "Bearer one" else 3
+        resp = _limited(remaining[bearer])
+        return httpx.Response(200, json={"data": []}, headers=resp.headers)
+
+    client = SearchRecent(_unpaced(AuthPool([_app("one"), _app("two")])))
+    client.use_pool(HttpPool(transport=httpx.MockTransport(handle)))
+    client.query("hello")
+
+    for _ in range(6):
+        client.fetch()
+
+    assert sent[:2] == ["Bearer one", "Bearer two"]
+    assert sent.count("Bearer one") > sent.count("Bearer two")
+
+
+def test_client_avoids_throttled_credential() -> None:
+    sent: list[str] = []
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        bearer = request.headers["authorization"]
+        sent.append(bearer)
+        if bearer == "Bearer one":
+            return httpx.Response(429, headers=_limited(0).headers)
+        return httpx.Response(200, json={"data": []}, headers=HEADERS)
+
+    client = SearchRecent(_unpaced(AuthPool([_app("one"), _user("two")])))
+    client.use_pool(HttpPool(transport=httpx.MockTransport(handle)))
+    client.query("hello")
+
+    client.fetch()
+    client.fetch()
+
+    assert sent == ["Bearer one", "Bearer two", "Bearer two"]
+
+
+def test_client_sends_user_requests_with_pool_user() -> None:
+    sent: list[str] = []
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        sent.append(request.headers["authorization"])
+        user = {"id": "123", "name": "name", "username": "username"}
+        return httpx.Response(200, json={"data": user}, headers=HEADERS)
+
+    pool = _unpaced(AuthPool([_app("app"), _user("one"), _user("two")]))
+    client = ManageTweets(pool)
+    client.use_pool(HttpPool(transport=httpx.MockTransport(handle)))
+
+    user_id = client.get_user().id
+    for _ in range(3):
+        client.send_tweet(client.new_tweet().text("hello"))
+
+    assert user_id == "123"
+    assert sent == ["Bearer one"] * 4
+
+
+def test_async_client_with_pool() -> None:
+    sent: list[str] = []
+
+    async def handle(request: httpx.Request) -> httpx.Response:
+        sent.append(request.headers["authorization"])
+        return httpx.Response(200, json={"data": []}, headers=HEADERS)
+
+    app = AsyncAppAuthClient(ApplicationAuth("key", "secret", "one"), [])
+    user = AsyncUserAuthClient(ClientAuth("id", "secret", "uri"), [])
+    user._bearer = "two"
+
+    client = AsyncSearchRecent(_unpaced(AsyncAuthPool([app, user])))
+    client.use_pool(HttpPool(async_transport=httpx.MockTransport(handle)))
+    client.query("hello")
+
+    async def run() -> None:
+        for _ in range(2):
+            await client.fetch()
+
+    asyncio.run(run())
+
+    assert sent == ["Bearer one", "Bearer two"]
+    assert app.http is client.http
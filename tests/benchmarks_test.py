@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import httpx
+import pytest
+
+from benchmarks.import_time import CLIENT_MODULES
+from benchmarks.import_time import IMPORT_BUDGET
+from benchmarks.import_time import import_profile
+from benchmarks.import_time import import_time
+from benchmarks.import_time import LAZY_MODULES
+from benchmarks.suite import compare
+from benchmarks.suite import load
+from benchmarks.suite import main
+from benchmarks.suite import Result
+from benchmarks.suite import save
+from benchmarks.transport import MockTwitter
+
+
+@pytest.mark.parametrize(
+    ("value", "higher_is_better", "expected"),
+    (
+        (90.0, True, False),
+        (80.0, True, True),
+        (110.0, False, False),
+        (120.0, False, True),
+    ),
+)
+def test_regressed(value: float, higher_is_better: bool, expected: bool) -> None:
+    baseline = Result("bench", 100.0, "unit", higher_is_better)
+    result = Result("bench", value, "unit", higher_is_better)
+
+    assert result.regressed(baseline, tolerance=0.15) is expected
+
+
+def test_save_load_compare(tmp_path: Path) -> None:
+    path = str(tmp_path / "baseline.json")
+    save(path, [Result("fast", 100.0, "pages/s", True)])
+
+    baseline = load(path)
+    regressed = compare(
+        [Result("fast", 50.0, "pages/s", True), Result("new", 1.0, "ms", False)],
+        baseline,
+        tolerance=0.15,
+    )
+
+    assert regressed == ["fast"]
+
+
+def test_mock_twitter_paginates() -> None:
+    mock = MockTwitter(pages=2, page_size=10)
+    client = httpx.Client(transport=mock.transport())
+    url = "https://api.twitter.com/2/tweets/search/recent"
+
+    first = client.get(url, params={"query": "hello"}).json()
+    last = client.get(url, params={"next_token": first["meta"]["next_token"]}).json()
+    lookup = client.get("https://api.twitter.com/2/tweets", params={"ids": "1,2"})
+
+    assert len(first["data"]) == 10
+    assert "next_token" not in last["meta"]
+    assert [tweet["id"] for tweet in lookup.json()["data"]] == ["1", "2"]
+    assert mock.requests == 3
+
+
+def test_quick_suite_against_own_baseline(tmp_path: Path) -> None:
+    path = str(tmp_path / "baseline.json")
+
+    assert main(["--quick", "--save", path]) == 0
+    assert main(["--quick", "--compare", path, "--tolerance", "1000"]) == 0
+
+
+def test_client_imports_are_lazy() -> None:
+    profile = import_profile(", ".join(CLIENT_MODULES))
+
+    assert [name for name in LAZY_MODULES if name in profile] == []
+
+
+def test_import_time_budget() -> None:
+    assert import_time(repeat=3) < IMPORT_BUDGET
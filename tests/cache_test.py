@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+import pytest
+from httpx import Response
+from twitterapiv2.cache import cache_key
+from twitterapiv2.cache import FileCache
+from twitterapiv2.cache import MemoryCache
+from twitterapiv2.cache import ResponseCache
+from twitterapiv2.tweets_lookup import TweetsLookup
+from twitterapiv2.tweets_lookup import URL
+
+from tests.fixtures.mock_headers import HEADERS
+
+BODY = b'{"data":[{"id":"1461880347478528007","text":"MOCK"}]}'
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture(params=["memory", "file"])
+def cache(
+    request: pytest.FixtureRequest,
+    tmp_path: Path,
+    clock: FakeClock,
+) -> ResponseCache:
+    if request.param == "memory":
+        return MemoryCache(ttl=60, clock=clock)
+    return FileCache(str(tmp_path / "cache"), ttl=60, clock=clock)
+
+
+def test_cache_key_is_canonical() -> None:
+    first = cache_key(URL, {"ids": "2,1", "tweet.fields": "lang,author_id"})
+    second = cache_key(URL, {"tweet.fields": "author_id,lang", "ids": "2,1"})
+
+    assert first == second
+    assert first != cache_key(URL, {"ids": "1,2", "tweet.fields": "lang,author_id"})
+
+
+def test_get_set_and_stats(cache: ResponseCache) -> None:
+    assert cache.get("key") is None
+
+    cache.set("key", {"data": []})
+
+    assert cache.get("key") == {"data": []}
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 1
+    assert cache.stats.hit_rate == 0.5
+
+
+def test_entries_expire(cache: ResponseCache, clock: FakeClock) -> None:
+    cache.set("key", {"data": []})
+
+    clock.now += 61
+
+    assert cache.get("key") is None
+
+
+def test_clear(cache: ResponseCache) -> None:
+    cache.set("key", {"data": []})
+
+    cache.clear()
+
+    assert cache.get("key") is None
+
+
+def test_memory_cache_evicts_least_recently_used() -> None:
+    cache = MemoryCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+
+    cache.set("c", 3)
+
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+
+
+def test_file_cache_survives_new_instance(tmp_path: Path) -> None:
+    FileCache(str(tmp_path)).set("key", {"data": []})
+
+    assert FileCache(str(tmp_path)).get("key") == {"data": []}
+
+
+def test_stats_hit_rate_without_lookups() -> None:
+    assert MemoryCache().stats.hit_rate == 0.0
+
+
+def test_client_serves_repeat_lookup_from_cache() -> None:
+    client = TweetsLookup(MagicMock())
+    client.cache = MemoryCache()
+    client.ids("1461880347478528007")
+    response = Response(200, content=BODY, headers=HEADERS)
+
+    with patch.object(client.http, "get", return_value=response) as mock_get:
+        first = client.fetch()
+        second = client.fetch()
+
+    assert first == second
+    mock_get.assert_called_once()
+    assert client.cache.stats.hits == 1
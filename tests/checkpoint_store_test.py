@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from twitterapiv2.checkpoint_store import CheckpointStore
+from twitterapiv2.checkpoint_store import FileCheckpointStore
+from twitterapiv2.checkpoint_store import SQLiteCheckpointStore
+from twitterapiv2.model.checkpoint import Checkpoint
+
+CHECKPOINT = Checkpoint(
+    "1461880347478528007", "b26v89c19zqg8o3f", "1461880347478529999"
+)
+
+
+@pytest.fixture(params=["file", "sqlite"])
+def store(request: pytest.FixtureRequest, tmp_path: Path) -> CheckpointStore:
+    if request.param == "file":
+        return FileCheckpointStore(str(tmp_path / "checkpoints.json"))
+    return SQLiteCheckpointStore(str(tmp_path / "checkpoints.db"))
+
+
+def test_load_missing(store: CheckpointStore) -> None:
+    assert store.load("missing") is None
+
+
+def test_save_and_load(store: CheckpointStore) -> None:
+    store.save("hello", CHECKPOINT)
+
+    assert store.load("hello") == CHECKPOINT
+
+
+def test_save_replaces(store: CheckpointStore) -> None:
+    store.save("hello", CHECKPOINT)
+
+    store.save("hello", Checkpoint("1"))
+
+    assert store.load("hello") == Checkpoint("1")
+
+
+def test_delete(store: CheckpointStore) -> None:
+    store.save("hello", CHECKPOINT)
+    store.save("world", CHECKPOINT)
+
+    store.delete("hello")
+    store.delete("hello")
+
+    assert store.load("hello") is None
+    assert store.load("world") == CHECKPOINT
+
+
+def test_persists_across_instances(store: CheckpointStore) -> None:
+    store.save("hello", CHECKPOINT)
+
+    reopened = type(store)(store.path)  # type: ignore
+
+    assert reopened.load("hello") == CHECKPOINT
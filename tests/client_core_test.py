@@ -1,17 +1,26 @@
 from __future__ import annotations
 
+import asyncio
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from unittest.mock import AsyncMock
 from unittest.mock import MagicMock
 from unittest.mock import patch
 
+import httpx
 import pytest
 from httpx import Response
+from twitterapiv2.cache import MemoryCache
+from twitterapiv2.client_core import AsyncClientCore
 from twitterapiv2.client_core import ClientCore
 from twitterapiv2.exceptions import InvalidResponseError
 from twitterapiv2.exceptions import ThrottledError
+from twitterapiv2.http_pool import HttpPool
 from twitterapiv2.model.application_auth import ApplicationAuth
 from twitterapiv2.model.client_auth import ClientAuth
+from twitterapiv2.model.cursor import Cursor
+from twitterapiv2.model.query_spec import QuerySpec
 
 BODY = b'{"data":[{"id":"1461880347478528007","text":"MOCK"}]}'
 HEADERS = {
@@ -40,10 +49,16 @@ MOCK_RESPONSE = Response(200, content=BODY, headers=HEADERS)
 
 @pytest.fixture
 def client() -> ClientCore:
-    auth_mock = MagicMock(get_consumer_bearer=MagicMock(return_value="mock_bearer"))
+    auth_mock = MagicMock(get_bearer=MagicMock(return_value="mock_bearer"))
     return ClientCore(auth_mock)
 
 
+@pytest.fixture
+def async_client() -> AsyncClientCore:
+    auth_mock = MagicMock(get_bearer=AsyncMock(return_value="mock_bearer"))
+    return AsyncClientCore(auth_mock)
+
+
 def test_factory_client_auth() -> None:
     model = ClientAuth("mock", "mock", "https://mock")
 
@@ -52,6 +67,16 @@ def test_factory_client_auth() -> None:
     assert result
 
 
+def test_factory_client_auth_store_key() -> None:
+    model = ClientAuth("mock", "mock", "https://mock")
+
+    result = ClientCore.from_model(model, store_key="user:alice")
+    default = AsyncClientCore.from_model(model)
+
+    assert result.auth_client._store_key == "user:alice"  # type: ignore
+    assert default.auth_client._store_key == "user:mock"  # type: ignore
+
+
 def test_factory_app_auth() -> None:
     model = ApplicationAuth("mock", "mock", "mock")
 
@@ -179,9 +204,194 @@ def test_get_user(client: ClientCore) -> None:
     }
     mock_resp = Response(200, content=json.dumps(mock_resp_body), headers=HEADERS)
 
-    with patch.object(client, "get", return_value=mock_resp):
+    with patch.object(client.http, "get", return_value=mock_resp) as mock_get:
         result = client.get_user()
 
+        assert mock_get.call_args.kwargs["params"] == {}
+
         assert result.id == "mock_id"
         assert result.name == "mock_name"
         assert result.username == "mock_username"
+
+
+def test_get_user_cache_keyed_by_credential() -> None:
+    cache = MemoryCache(ttl=60)
+    clients = [
+        ClientCore.from_model(ApplicationAuth("key", "secret", bearer))
+        for bearer in ("one", "two", "one")
+    ]
+    sent: list[str] = []
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        bearer = request.headers["authorization"]
+        sent.append(bearer)
+        user = {"id": bearer[-3:], "name": "name", "username": "username"}
+        return httpx.Response(200, json={"data": user}, headers=HEADERS)
+
+    pool = HttpPool(transport=httpx.MockTransport(handle))
+    for client_ in clients:
+        client_.cache = cache
+        client_.use_pool(pool)
+
+    users = [client_.get_user().id for client_ in clients]
+
+    assert users == ["one", "two", "one"]
+    assert sent == ["Bearer one", "Bearer two"]
+
+
+def test_async_factory_models() -> None:
+    app_client = AsyncClientCore.from_model(ApplicationAuth("mock", "mock", "mock"))
+    user_client = AsyncClientCore.from_model(ClientAuth("mock", "mock", "https://mock"))
+
+    assert isinstance(app_client, AsyncClientCore)
+    assert isinstance(user_client, AsyncClientCore)
+
+
+def test_async_factory_raises_on_unknown() -> None:
+    with pytest.raises(ValueError):
+        AsyncClientCore.from_model("Something")  # type: ignore
+
+
+def test_async_headers(async_client: AsyncClientCore) -> None:
+    result = asyncio.run(async_client.headers())
+
+    assert result == {"Authorization": "Bearer mock_bearer"}
+
+
+def test_async_get(async_client: AsyncClientCore) -> None:
+    async_client.field_builder._fields = {"fields": "mock"}
+    mock_get = AsyncMock(return_value=MOCK_RESPONSE)
+
+    with patch.object(async_client.http, "get", mock_get):
+        result = asyncio.run(async_client.get("https://mock"))
+
+    assert result["data"]
+    assert async_client._next_token is None
+    assert async_client._last_response == MOCK_RESPONSE
+    mock_get.assert_awaited_once_with(
+        url="https://mock",
+        params={"fields": "mock"},
+        headers={"Authorization": "Bearer mock_bearer"},
+    )
+
+
+def test_async_post(async_client: AsyncClientCore) -> None:
+    mock_post = AsyncMock(return_value=MOCK_RESPONSE)
+
+    with patch.object(async_client.http, "post", mock_post):
+        result = asyncio.run(async_client.post("https://mock", {"payload": "mock"}))
+
+    assert result["data"]
+    mock_post.assert_awaited_once_with(
+        url="https://mock",
+        headers={"Authorization": "Bearer mock_bearer"},
+        json={"payload": "mock"},
+    )
+
+
+def test_async_delete(async_client: AsyncClientCore) -> None:
+    mock_delete = AsyncMock(return_value=MOCK_RESPONSE)
+
+    with patch.object(async_client.http, "delete", mock_delete):
+        result = asyncio.run(async_client.delete("https://mock"))
+
+    assert result["data"]
+    mock_delete.assert_awaited_once_with(
+        url="https://mock",
+        headers={"Authorization": "Bearer mock_bearer"},
+    )
+
+
+def test_async_raises_on_response(async_client: AsyncClientCore) -> None:
+    mock_get = AsyncMock(return_value=Response(429, headers=HEADERS))
+
+    with patch.object(async_client.http, "get", mock_get):
+        with pytest.raises(ThrottledError):
+            asyncio.run(async_client.get("https://mock"))
+
+
+def test_async_get_user(async_client: AsyncClientCore) -> None:
+    body = {"data": {"id": "mock_id", "name": "mock_name", "username": "mock_un"}}
+    mock_get = AsyncMock(return_value=Response(200, json=body, headers=HEADERS))
+
+    with patch.object(async_client.http, "get", mock_get):
+        result = asyncio.run(async_client.get_user())
+
+    assert result.id == "mock_id"
+    assert result.username == "mock_un"
+
+
+def test_custom_decoder(client: ClientCore) -> None:
+    calls: list[bytes] = []
+
+    def decoder(content: bytes) -> dict[str, str]:
+        calls.append(content)
+        return {"decoded": "mock"}
+
+    client.decoder = decoder
+
+    with patch.object(client.http, "get", return_value=MOCK_RESPONSE):
+        result = client.get("https://mock")
+
+    assert result == {"decoded": "mock"}
+    assert calls == [BODY]
+
+
+def _query_pages(request: httpx.Request) -> httpx.Response:
+    """Two pages per query, tweet IDs are prefixed with the query."""
+    query = request.url.params["query"]
+    token = request.url.params.get("next_token")
+    meta = {} if token else {"next_token": "page2"}
+    body = {"data": [{"id": f"{query}-{token or 'page1'}"}], "meta": meta}
+    return httpx.Response(200, json=body, headers=HEADERS)
+
+
+def test_fetch_page_cursors_are_independent(client: ClientCore) -> None:
+    client.use_pool(HttpPool(transport=httpx.MockTransport(_query_pages)))
+    cursors = [
+        Cursor(QuerySpec.build("https://api.twitter.com/2/search", {"query": str(i)}))
+        for i in range(8)
+    ]
+
+    def drain(cursor: Cursor) -> list[str]:
+        ids: list[str] = []
+        while cursor.more:
+            ids.extend(tweet["id"] for tweet in client.fetch_page(cursor)["data"])
+        return ids
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(drain, cursors))
+
+    assert results == [[f"{i}-page1", f"{i}-page2"] for i in range(8)]
+    assert all(cursor.pages == 2 for cursor in cursors)
+    assert all(cursor.limit_remaining == 297 for cursor in cursors)
+    assert not client.more
+    assert client.limit_remaining == -1
+    with pytest.raises(ValueError):
+        client.fetch_page(cursors[0])
+
+
+def test_async_fetch_page(async_client: AsyncClientCore) -> None:
+    async def handle(request: httpx.Request) -> httpx.Response:
+        return _query_pages(request)
+
+    async_client.use_pool(HttpPool(async_transport=httpx.MockTransport(handle)))
+    cursors = [
+        Cursor(QuerySpec.build("https://api.twitter.com/2/search", {"query": str(i)}))
+        for i in range(3)
+    ]
+
+    async def drain(cursor: Cursor) -> list[str]:
+        ids: list[str] = []
+        while cursor.more:
+            page = await async_client.fetch_page(cursor)
+            ids.extend(tweet["id"] for tweet in page["data"])
+        return ids
+
+    async def run() -> list[list[str]]:
+        return list(await asyncio.gather(*(drain(cursor) for cursor in cursors)))
+
+    results = asyncio.run(run())
+
+    assert results == [[f"{i}-page1", f"{i}-page2"] for i in range(3)]
+    assert async_client.limit_remaining == -1
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import random
+from pathlib import Path
+
+import pytest
+from twitterapiv2.dedup import BloomFilter
+from twitterapiv2.dedup import ExactFilter
+from twitterapiv2.dedup import load_filter
+from twitterapiv2.dedup import TweetFilter
+
+# Tweet ids are 64 bit snowflakes, below 2**63
+IDS = random.Random(25).sample(range(1 << 62), 5000)
+
+
+@pytest.fixture(params=["exact", "bloom"])
+def seen(request: pytest.FixtureRequest) -> TweetFilter:
+    if request.param == "exact":
+        return ExactFilter(capacity=16)
+    return BloomFilter(capacity=len(IDS), error_rate=0.001)
+
+
+def test_add_reports_new_ids(seen: TweetFilter) -> None:
+    added = [seen.add(tweet_id) for tweet_id in IDS]
+
+    # A Bloom filter may take a few new ids for seen ids
+    assert sum(added) > len(IDS) * 0.99
+    assert not any(seen.add(str(tweet_id)) for tweet_id in IDS)
+    assert all(tweet_id in seen for tweet_id in IDS)
+    assert len(seen) == sum(added)
+
+
+def test_filter_and_filter_page(seen: TweetFilter) -> None:
+    tweets = [{"id": "3"}, {"id": "1"}, {"id": "3"}, {"id": "2"}]
+
+    unique = seen.filter(tweets)  # type: ignore
+    page = seen.filter_page({"data": [{"id": "2"}, {"id": "4"}]})  # type: ignore
+
+    assert [tweet["id"] for tweet in unique] == ["3", "1", "2"]
+    assert page == {"data": [{"id": "4"}]}
+    assert seen.filter_page({"meta": {}}) == {"meta": {}}
+
+
+def test_save_and_load(seen: TweetFilter, tmp_path: Path) -> None:
+    path = str(tmp_path / "seen.bin")
+    for tweet_id in IDS[:1000]:
+        seen.add(tweet_id)
+    seen.add(0)
+
+    seen.save(path)
+    loaded = load_filter(path)
+
+    assert type(loaded) is type(seen)
+    assert len(loaded) == len(seen)
+    assert all(tweet_id in loaded for tweet_id in IDS[:1000])
+    assert 0 in loaded
+    assert loaded.add(IDS[1000])
+    assert IDS[1000] not in seen
+
+
+def test_exact_filter_has_no_false_positives() -> None:
+    seen = ExactFilter()
+    added = [seen.add(tweet_id) for tweet_id in range(1, 20001)]
+
+    assert all(added)
+    assert not any(tweet_id in seen for tweet_id in range(20001, 40001))
+    assert 0 not in seen
+    assert "not-an-id" not in seen
+
+
+def test_bloom_filter_error_rate() -> None:
+    seen = BloomFilter(capacity=len(IDS), error_rate=0.01)
+    for tweet_id in IDS:
+        seen.add(tweet_id)
+
+    false_positives = sum(tweet_id + 1 in seen for tweet_id in IDS)
+
+    assert false_positives < len(IDS) * 0.03
+    assert seen.size < len(IDS) * 8 * 1.3
+
+
+@pytest.mark.parametrize(
+    ("kwargs"),
+    (
+        {"capacity": 0},
+        {"capacity": 10, "error_rate": 0},
+        {"capacity": 10, "error_rate": 1},
+    ),
+)
+def test_bloom_filter_invalid(kwargs: dict[str, float]) -> None:
+    with pytest.raises(ValueError):
+        BloomFilter(**kwargs)  # type: ignore
+
+
+def test_load_filter_default_and_invalid(tmp_path: Path) -> None:
+    default = ExactFilter()
+    path = tmp_path / "seen.bin"
+
+    assert load_filter(str(path), default=default) is default
+    with pytest.raises(FileNotFoundError):
+        load_filter(str(path))
+    path.write_bytes(b"not a filter")
+    with pytest.raises(ValueError):
+        load_filter(str(path))
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+
+import httpx
+from twitterapiv2.dedup import ExactFilter
+from twitterapiv2.fan_out import AsyncFanOut
+from twitterapiv2.fan_out import FanOut
+from twitterapiv2.http_pool import HttpPool
+from twitterapiv2.search_recent import AsyncSearchRecent
+from twitterapiv2.search_recent import SearchRecent
+
+HEADERS = {"x-rate-limit-remaining": "100", "x-rate-limit-reset": "4102444800"}
+# Pages served per query, a query of "fail" errors
+PAGES = 3
+
+
+class Twitter:
+    def __init__(self) -> None:
+        self.requests: list[tuple[str, str | None]] = []
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        query = request.url.params["query"]
+        token = request.url.params.get("next_token")
+        self.requests.append((query, token))
+        if query == "fail":
+            return httpx.Response(400, content=b"bad query", headers=HEADERS)
+        index = int(token) if token else 0
+        meta = {"next_token": str(index + 1)} if index + 1 < PAGES else {}
+        data = [{"id": f"{query}-{index}-{i}"} for i in range(2)]
+        return httpx.Response(200, json={"data": data, "meta": meta}, headers=HEADERS)
+
+
+def _client(twitter: Twitter) -> SearchRecent:
+    client = SearchRecent(MagicMock())
+    client.use_pool(HttpPool(transport=httpx.MockTransport(twitter.handle)))
+    client.rate_limiter = MagicMock()
+    return client
+
+
+def test_run_merges_all_queries() -> None:
+    twitter = Twitter()
+    client = _client(twitter)
+    client.max_results(10)
+    runner = FanOut(client, ["a", "b", "c", "a"], max_workers=2)
+
+    results = list(runner.run())
+
+    assert len(results) == 3 * PAGES * 2
+    assert {query for query, _ in results} == {"a", "b", "c"}
+    assert all(tweet["id"].startswith(query) for query, tweet in results)
+    assert runner.done
+    assert [p.pages for p in runner.progress.values()] == [PAGES] * 3
+    assert runner.progress["a"].tweets == PAGES * 2
+    assert client.rate_limiter.wait.call_count == 3 * PAGES  # type: ignore
+
+
+def test_same_query_text_with_other_fields_runs_apart() -> None:
+    twitter = Twitter()
+    client = _client(twitter)
+    client.query("a")
+    first = client.prepare()
+    client.start_time("2021-01-01T00:00:00Z")
+    second = client.prepare()
+    runner = FanOut(client, [first, second, first, "a"], max_workers=1)
+
+    results = list(runner.run())
+
+    assert list(runner.cursors) == ["a", second.key]
+    assert runner.cursors[second.key].spec is second
+    assert len(results) == 2 * PAGES * 2
+    assert len(twitter.requests) == 2 * PAGES
+
+
+def test_run_is_round_robin() -> None:
+    twitter = Twitter()
+    runner = FanOut(_client(twitter), ["a", "b", "c"], max_workers=1)
+
+    list(runner.run())
+
+    assert [query for query, _ in twitter.requests] == ["a", "b", "c"] * PAGES
+
+
+def test_failed_query_does_not_stop_others_and_max_pages() -> None:
+    twitter = Twitter()
+    runner = FanOut(_client(twitter), ["a", "fail"], max_pages=2)
+
+    results = list(runner.run())
+
+    assert len(results) == 4
+    assert runner.progress["fail"].done
+    assert runner.progress["fail"].error is not None
+    assert runner.progress["a"].pages == 2
+    assert runner.cursors["a"].more
+
+
+def test_break_then_resume_loses_no_tweets() -> None:
+    twitter = Twitter()
+    runner = FanOut(_client(twitter), ["a", "b", "c"], max_workers=2)
+    results: list[str] = []
+
+    while not runner.done:
+        for _, tweet in runner.run():
+            results.append(tweet["id"])
+            if len(results) % 4 == 1:
+                break
+
+    assert len(results) == 3 * PAGES * 2
+    assert len(set(results)) == len(results)
+    assert len(twitter.requests) == 3 * PAGES
+
+
+def test_run_dedup_across_queries() -> None:
+    def handle(request: httpx.Request) -> httpx.Response:
+        # Both queries match tweets 2 and 3
+        first = 1 if request.url.params["query"] == "a" else 2
+        data = [{"id": str(i)} for i in range(first, first + 3)]
+        return httpx.Response(200, json={"data": data, "meta": {}}, headers=HEADERS)
+
+    client = SearchRecent(MagicMock())
+    client.use_pool(HttpPool(transport=httpx.MockTransport(handle)))
+    client.rate_limiter = MagicMock()
+    runner = FanOut(client, ["a", "b"], max_workers=1, dedup=ExactFilter())
+
+    results = [(query, tweet["id"]) for query, tweet in runner.run()]
+
+    assert results == [("a", "1"), ("a", "2"), ("a", "3"), ("b", "4")]
+    assert runner.progress["b"].tweets == 1
+    assert runner.progress["b"].duplicates == 2
+
+
+def test_assigns_rate_limiter() -> None:
+    client = SearchRecent(MagicMock())
+
+    FanOut(client, ["a"])
+
+    assert client.rate_limiter is not None
+
+
+def test_async_run() -> None:
+    twitter = Twitter()
+
+    async def handle(request: httpx.Request) -> httpx.Response:
+        return twitter.handle(request)
+
+    client = AsyncSearchRecent(MagicMock(get_bearer=AsyncMock(return_value="mock")))
+    client.use_pool(HttpPool(async_transport=httpx.MockTransport(handle)))
+    client.rate_limiter = MagicMock(async_wait=AsyncMock())
+    runner = AsyncFanOut(client, ["a", "b"], max_concurrency=1)
+
+    async def collect() -> list[tuple[str, str]]:
+        return [(query, tweet["id"]) async for query, tweet in runner.run()]
+
+    results = asyncio.run(collect())
+
+    assert len(results) == 2 * PAGES * 2
+    assert [query for query, _ in twitter.requests] == ["a", "b"] * PAGES
+    assert runner.done
+
+
+def test_async_break_then_resume_loses_no_tweets() -> None:
+    twitter = Twitter()
+
+    async def handle(request: httpx.Request) -> httpx.Response:
+        return twitter.handle(request)
+
+    client = AsyncSearchRecent(MagicMock(get_bearer=AsyncMock(return_value="mock")))
+    client.use_pool(HttpPool(async_transport=httpx.MockTransport(handle)))
+    client.rate_limiter = MagicMock(async_wait=AsyncMock())
+    runner = AsyncFanOut(client, ["a", "b", "c"], max_concurrency=3)
+
+    async def collect() -> list[str]:
+        results: list[str] = []
+        while not runner.done:
+            stream = runner.run()
+            async for _, tweet in stream:
+                results.append(tweet["id"])
+                if len(results) % 4 == 1:
+                    break
+            await stream.aclose()
+        return results
+
+    results = asyncio.run(collect())
+
+    assert len(results) == 3 * PAGES * 2
+    assert len(set(results)) == len(results)
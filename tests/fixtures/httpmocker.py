@@ -28,3 +28,23 @@ class HttpMocker:
         return resp
 
     post = get
+
+
+class AsyncHttpMocker:
+    def __init__(self) -> None:
+        self._mocker = HttpMocker()
+
+    def add_response(
+        self,
+        content: str | bytes,
+        headers: dict[str, str],
+        status_code: int,
+        url: str,
+    ) -> None:
+        self._mocker.add_response(content, headers, status_code, url)
+
+    async def get(self, *args: Any, **kwargs: Any) -> Response:
+        return self._mocker.get(*args, **kwargs)
+
+    post = get
+    delete = get
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+from twitterapiv2._appauth_client import AppAuthClient
+from twitterapiv2.client_core import AsyncClientCore
+from twitterapiv2.client_core import ClientCore
+from twitterapiv2.http_pool import HttpPool
+from twitterapiv2.model.application_auth import ApplicationAuth
+from twitterapiv2.search_recent import SearchRecent
+
+BODY = b'{"data":[{"id":"1","text":"mock"}],"meta":{"result_count":1}}'
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, content=BODY)
+
+
+async def _async_handler(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, content=BODY)
+
+
+@pytest.fixture
+def pool() -> HttpPool:
+    return HttpPool(transport=httpx.MockTransport(_handler))
+
+
+def test_client_is_lazy_and_shared(pool: HttpPool) -> None:
+    assert pool._client is None
+
+    assert pool.client is pool.client
+    assert pool._client is not None
+
+
+def test_limits_and_timeout() -> None:
+    pool = HttpPool(max_connections=5, keepalive_expiry=2.0, timeout=3.0)
+
+    assert pool.limits.max_connections == 5
+    assert pool.limits.keepalive_expiry == 2.0
+    assert pool.client.timeout.read == 3.0
+    assert pool.client.timeout.connect == 5.0
+
+
+def test_close_recreates_client(pool: HttpPool) -> None:
+    first = pool.client
+
+    pool.close()
+
+    assert first.is_closed
+    assert pool.client is not first
+
+
+def test_from_model_shares_pool(pool: HttpPool) -> None:
+    auth = ApplicationAuth("mock", "mock", "mock")
+
+    first = ClientCore.from_model(auth, pool=pool)
+    second = ClientCore.from_model(auth, pool=pool)
+
+    assert first.http is second.http is pool.client
+    assert isinstance(first.auth_client, AppAuthClient)
+    assert first.auth_client.http is pool.client
+
+
+def test_default_http_is_lazy() -> None:
+    client = ClientCore(AppAuthClient(ApplicationAuth("mock", "mock", "mock"), []))
+
+    assert "_http" not in client.__dict__
+    assert isinstance(client.http, httpx.Client)
+    assert client.http is client.http
+
+    del client.http
+
+    assert "_http" not in client.__dict__
+
+
+def test_request_through_pool(pool: HttpPool) -> None:
+    client = SearchRecent(AppAuthClient(ApplicationAuth("mock", "mock", "mock"), []))
+    client.use_pool(pool)
+    client.query("hello")
+
+    result = client.fetch()
+
+    assert result["data"][0]["id"] == "1"
+
+
+def test_async_request_through_pool() -> None:
+    pool = HttpPool(async_transport=httpx.MockTransport(_async_handler))
+    client = AsyncClientCore.from_model(ApplicationAuth("a", "b", "c"), pool=pool)
+
+    async def run() -> None:
+        result = await client.get("https://mock")
+        await pool.aclose()
+        assert result["data"]
+
+    asyncio.run(run())
+
+    assert client.http.is_closed
+    assert client.auth_client.http is client.http  # type: ignore
@@ -1,10 +1,17 @@
 from __future__ import annotations
 
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock
 from unittest.mock import MagicMock
 from unittest.mock import patch
 
+import httpx
 import pytest
+from twitterapiv2.http_pool import HttpPool
+from twitterapiv2.likes import AsyncLikes
 from twitterapiv2.likes import Likes
+from twitterapiv2.model.batch_result import LikeResult
 
 MOCK_USERID = "12345"
 
@@ -16,6 +23,13 @@ def client() -> Likes:
     return client_
 
 
+@pytest.fixture
+def async_client() -> AsyncLikes:
+    client_ = AsyncLikes(MagicMock())
+    client_.get_user = AsyncMock(return_value=MagicMock(id=MOCK_USERID))  # type: ignore
+    return client_
+
+
 def test_user_id(client: Likes) -> None:
     result = client.user_id
 
@@ -28,7 +42,7 @@ def test_get_likes(client: Likes) -> None:
         client.get_likes()
 
         mock_get.assert_called_once_with(
-            f"https://api.twitter.com/2/users/{MOCK_USERID}/liked_tweets"
+            f"https://api.twitter.com/2/users/{MOCK_USERID}/liked_tweets", {}
         )
 
 
@@ -56,5 +70,166 @@ def test_get_liking_users(client: Likes) -> None:
         client.get_liking_users("12345")
 
         mock_get.assert_called_once_with(
-            "https://api.twitter.com/2/tweets/12345/liking_users"
+            "https://api.twitter.com/2/tweets/12345/liking_users", {}
+        )
+
+
+def test_async_user_id(async_client: AsyncLikes) -> None:
+    result = asyncio.run(async_client.user_id())
+
+    assert result == MOCK_USERID
+    assert asyncio.run(async_client.user_id()) is result
+    async_client.get_user.assert_awaited_once()  # type: ignore
+
+
+def test_async_get_likes(async_client: AsyncLikes) -> None:
+    with patch.object(async_client, "get", AsyncMock()) as mock_get:
+        asyncio.run(async_client.get_likes())
+
+        mock_get.assert_awaited_once_with(
+            f"https://api.twitter.com/2/users/{MOCK_USERID}/liked_tweets", {}
         )
+
+
+def test_async_unlike(async_client: AsyncLikes) -> None:
+    with patch.object(async_client, "delete", AsyncMock()) as mock_delete:
+        asyncio.run(async_client.unlike("12345"))
+
+        mock_delete.assert_awaited_once_with(
+            f"https://api.twitter.com/2/users/{MOCK_USERID}/likes/12345"
+        )
+
+
+def test_async_like(async_client: AsyncLikes) -> None:
+    with patch.object(async_client, "post", AsyncMock()) as mock_post:
+        asyncio.run(async_client.like("12345"))
+
+        mock_post.assert_awaited_once_with(
+            f"https://api.twitter.com/2/users/{MOCK_USERID}/likes",
+            {"tweet_id": "12345"},
+        )
+
+
+def test_async_get_liking_users(async_client: AsyncLikes) -> None:
+    with patch.object(async_client, "get", AsyncMock()) as mock_get:
+        asyncio.run(async_client.get_liking_users("12345"))
+
+        mock_get.assert_awaited_once_with(
+            "https://api.twitter.com/2/tweets/12345/liking_users", {}
+        )
+
+
+def _pages(request: httpx.Request) -> httpx.Response:
+    """Three pages of two items, linked by `next_token`."""
+    token = request.url.params.get("pagination_token")
+    index = int(token[4:]) if token else 0
+    body: dict[str, Any] = {"data": [{"id": f"{index}-{i}"} for i in range(2)]}
+    body["meta"] = {"next_token": f"page{index + 1}"} if index < 2 else {}
+    return httpx.Response(200, json=body, request=request)
+
+
+def test_get_likes_with_fields_and_pagination(client: Likes) -> None:
+    client.tweet_fields("created_at")
+    client.max_results(50)
+    client._next_token = "abc"
+
+    with patch.object(client, "get") as mock_get:
+        client.get_likes()
+
+    mock_get.assert_called_once_with(
+        f"https://api.twitter.com/2/users/{MOCK_USERID}/liked_tweets",
+        {"tweet.fields": "created_at", "max_results": 50},
+    )
+
+    client._page_url = f"https://api.twitter.com/2/users/{MOCK_USERID}/liked_tweets"
+    client._next_token = "abc"
+    with patch.object(client, "get") as mock_get:
+        client.get_likes()
+
+    assert mock_get.call_args.args[1]["pagination_token"] == "abc"
+
+
+def test_get_liking_users_drops_fields_of_other_endpoint(client: Likes) -> None:
+    client.media_fields("url")
+    client.user_fields("username")
+
+    with patch.object(client, "get") as mock_get:
+        client.get_liking_users("12345")
+
+    mock_get.assert_called_once_with(
+        "https://api.twitter.com/2/tweets/12345/liking_users",
+        {"user.fields": "username"},
+    )
+
+
+def test_iter_likes(client: Likes) -> None:
+    client.use_pool(HttpPool(transport=httpx.MockTransport(_pages)))
+    client.auth_client.get_bearer.return_value = "bearer"  # type: ignore
+
+    tweets = [tweet["id"] for tweet in client.iter_likes()]
+
+    assert tweets == ["0-0", "0-1", "1-0", "1-1", "2-0", "2-1"]
+    assert not client.more
+
+
+def test_iter_liking_users_limits(client: Likes) -> None:
+    client.use_pool(HttpPool(transport=httpx.MockTransport(_pages)))
+    client.auth_client.get_bearer.return_value = "bearer"  # type: ignore
+
+    assert len(list(client.iter_liking_users("1", max_users=3))) == 3
+    assert len(list(client.iter_liking_users("2", max_pages=2))) == 4
+
+
+def test_like_many(client: Likes) -> None:
+    def like(url: str, payload: dict[str, Any]) -> dict[str, Any]:
+        if payload["tweet_id"] == "2":
+            raise ValueError("boom")
+        return {"data": {"liked": True}}
+
+    with patch.object(client, "post", side_effect=like):
+        results = {r.tweet_id: r for r in client.like_many(["1", "2", "3"])}
+
+    assert results["1"].liked and results["3"].liked
+    assert not results["2"].liked and isinstance(results["2"].error, ValueError)
+    assert client.rate_limiter is not None
+
+
+def test_unlike_many(client: Likes) -> None:
+    with patch.object(client, "delete", return_value={"data": {"liked": False}}):
+        results = list(client.unlike_many(["1", "2"]))
+
+    assert sorted(result.tweet_id for result in results) == ["1", "2"]
+    assert all(not result.liked and result.error is None for result in results)
+
+
+def test_async_iter_likes(async_client: AsyncLikes) -> None:
+    async def handle(request: httpx.Request) -> httpx.Response:
+        return _pages(request)
+
+    async_client.use_pool(HttpPool(async_transport=httpx.MockTransport(handle)))
+    async_client.auth_client.get_bearer = AsyncMock(  # type: ignore
+        return_value="bearer"
+    )
+
+    async def collect() -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+        tweets = [tweet async for tweet in async_client.iter_likes(max_tweets=5)]
+        users = [user async for user in async_client.iter_liking_users("1")]
+        return tweets, users
+
+    tweets, users = asyncio.run(collect())
+
+    assert len(tweets) == 5
+    assert len(users) == 6
+
+
+def test_async_like_many(async_client: AsyncLikes) -> None:
+    mock_post = AsyncMock(return_value={"data": {"liked": True}})
+
+    async def collect() -> list[LikeResult]:
+        return [result async for result in async_client.like_many(["1", "2"])]
+
+    with patch.object(async_client, "post", mock_post):
+        results = asyncio.run(collect())
+
+    assert sorted(result.tweet_id for result in results) == ["1", "2"]
+    assert all(result.liked for result in results)
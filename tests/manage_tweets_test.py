@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock
 from unittest.mock import MagicMock
 from unittest.mock import patch
 
 import pytest
+from twitterapiv2.manage_tweets import AsyncManageTweets
 from twitterapiv2.manage_tweets import ManageTweets
+from twitterapiv2.model.batch_result import DeleteResult
 from twitterapiv2.model.tweet import Tweet
 
 
@@ -46,3 +51,104 @@ def test_delete_tweet(client: ManageTweets) -> None:
         client.delete_tweet("12345")
 
         mock_delete.assert_called_once_with("https://api.twitter.com/2/tweets/12345")
+
+
+def test_async_send_tweet() -> None:
+    client = AsyncManageTweets(MagicMock())
+    tweet = client.new_tweet().text("Hello, world!")
+
+    with patch.object(client, "post", AsyncMock()) as mock_post:
+        asyncio.run(client.send_tweet(tweet))
+
+        mock_post.assert_awaited_once_with(
+            "https://api.twitter.com/2/tweets", json={"text": "Hello, world!"}
+        )
+
+
+def test_async_delete_tweet() -> None:
+    client = AsyncManageTweets(MagicMock())
+
+    with patch.object(client, "delete", AsyncMock()) as mock_delete:
+        asyncio.run(client.delete_tweet("12345"))
+
+        mock_delete.assert_awaited_once_with("https://api.twitter.com/2/tweets/12345")
+
+
+def test_send_thread(client: ManageTweets) -> None:
+    tweets = [client.new_tweet().text(f"Part {index}") for index in range(3)]
+    responses = [{"data": {"id": str(index)}} for index in range(3)]
+
+    with patch.object(client, "post", side_effect=responses) as mock_post:
+        result = client.send_thread(tweets)
+
+    assert result.complete
+    assert result.tweet_ids == ["0", "1", "2"]
+    assert "reply" not in mock_post.call_args_list[0].kwargs["json"]
+    assert mock_post.call_args_list[2].kwargs["json"]["reply"] == {
+        "in_reply_to_tweet_id": "1"
+    }
+    assert client.rate_limiter is not None
+
+
+def test_send_thread_stops_at_failure_and_resumes(client: ManageTweets) -> None:
+    tweets = [client.new_tweet().text(f"Part {index}") for index in range(3)]
+    error = ValueError("boom")
+
+    with patch.object(client, "post", side_effect=[{"data": {"id": "0"}}, error]):
+        result = client.send_thread(tweets)
+
+    assert not result.complete
+    assert result.error is error
+    assert result.sent == 1
+    assert result.last_id == "0"
+
+    responses = [{"data": {"id": "1"}}, {"data": {"id": "2"}}]
+    with patch.object(client, "post", side_effect=responses) as mock_post:
+        resumed = client.send_thread(tweets[result.sent :], reply_to=result.last_id)
+
+    assert resumed.tweet_ids == ["1", "2"]
+    assert mock_post.call_args_list[0].kwargs["json"]["reply"] == {
+        "in_reply_to_tweet_id": "0"
+    }
+
+
+def test_delete_tweets(client: ManageTweets) -> None:
+    def delete(url: str) -> dict[str, Any]:
+        if url.endswith("/2"):
+            raise ValueError("boom")
+        return {"data": {"deleted": not url.endswith("/3")}}
+
+    with patch.object(client, "delete", side_effect=delete):
+        results = {r.tweet_id: r for r in client.delete_tweets(["1", "2", "3"])}
+
+    assert results["1"].deleted and results["1"].error is None
+    assert not results["2"].deleted and isinstance(results["2"].error, ValueError)
+    assert not results["3"].deleted and results["3"].error is None
+    assert client.rate_limiter is not None
+
+
+def test_async_send_thread() -> None:
+    client = AsyncManageTweets(MagicMock())
+    tweets = [client.new_tweet().text(f"Part {index}") for index in range(2)]
+    responses = [{"data": {"id": "10"}}, {"data": {"id": "11"}}]
+
+    with patch.object(client, "post", AsyncMock(side_effect=responses)) as mock_post:
+        result = asyncio.run(client.send_thread(tweets, reply_to="9"))
+
+    assert result.tweet_ids == ["10", "11"]
+    replies = [call.kwargs["json"]["reply"] for call in mock_post.await_args_list]
+    assert replies == [{"in_reply_to_tweet_id": "9"}, {"in_reply_to_tweet_id": "10"}]
+
+
+def test_async_delete_tweets() -> None:
+    client = AsyncManageTweets(MagicMock())
+    mock_delete = AsyncMock(return_value={"data": {"deleted": True}})
+
+    async def collect() -> list[DeleteResult]:
+        return [result async for result in client.delete_tweets(["1", "2"])]
+
+    with patch.object(client, "delete", mock_delete):
+        results = asyncio.run(collect())
+
+    assert sorted(result.tweet_id for result in results) == ["1", "2"]
+    assert all(result.deleted for result in results)
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+import httpx
+import pytest
+from twitterapiv2.client_core import AsyncClientCore
+from twitterapiv2.client_core import ClientCore
+from twitterapiv2.exceptions import InvalidResponseError
+from twitterapiv2.metrics import PrometheusCollector
+from twitterapiv2.metrics import RequestMetrics
+from twitterapiv2.rate_limit import RateLimiter
+from twitterapiv2.retry import RetryPolicy
+
+from tests.fixtures.mock_headers import HEADERS
+
+URL = "https://api.twitter.com/2/tweets/search/recent"
+ENDPOINT = "GET /2/tweets/search/recent"
+POST = "POST /2/tweets"
+
+
+def _page(next_token: str | None = None) -> httpx.Response:
+    body = {"data": [{"id": "1"}], "meta": {"next_token": next_token}}
+    return httpx.Response(200, content=json.dumps(body), headers=HEADERS)
+
+
+def _metrics(**kwargs: object) -> RequestMetrics:
+    values: dict[str, object] = {
+        "endpoint": ENDPOINT,
+        "status": 200,
+        "latency": 0.2,
+        "response_bytes": 100,
+        "decode_time": 0.001,
+        "limit_remaining": 297,
+        "page_depth": 1,
+        "retries": 0,
+    }
+    values.update(kwargs)
+    return RequestMetrics(**values)  # type: ignore
+
+
+@pytest.fixture
+def client() -> ClientCore:
+    return ClientCore(MagicMock())
+
+
+def test_hooks_receive_metrics_per_request(client: ClientCore) -> None:
+    reported: list[RequestMetrics] = []
+    client.hooks.append(reported.append)
+    responses = [_page("p2"), _page("p3"), _page()]
+
+    with patch.object(client.http, "get", side_effect=responses):
+        client.get(URL, {"query": "hello"})
+        client.get(URL, {"query": "hello", "next_token": "p2"})
+        client.get(URL, {"query": "hello", "next_token": "p3"})
+
+    assert [metrics.page_depth for metrics in reported] == [1, 2, 3]
+    first = reported[0]
+    assert first.endpoint == ENDPOINT
+    assert first.status == 200
+    assert first.response_bytes == len(responses[0].content)
+    assert first.limit_remaining == int(HEADERS["x-rate-limit-remaining"])
+    assert first.latency >= 0.0
+    assert first.decode_time > 0.0
+    assert first.retries == 0
+
+
+def test_hooks_report_error_responses(client: ClientCore) -> None:
+    reported: list[RequestMetrics] = []
+    client.hooks.append(reported.append)
+    resp = httpx.Response(400, content=b"bad", headers=HEADERS)
+
+    with patch.object(client.http, "post", return_value=resp):
+        with pytest.raises(InvalidResponseError):
+            client.post("https://api.twitter.com/2/tweets", json={})
+
+    assert reported[0].endpoint == "POST /2/tweets"
+    assert reported[0].status == 400
+    assert reported[0].page_depth == 0
+
+
+def test_hooks_report_each_attempt(client: ClientCore) -> None:
+    reported: list[RequestMetrics] = []
+    client.hooks.append(reported.append)
+    client.retry_policy = RetryPolicy(backoff=0.0, jitter=0.0)
+    client.rate_limiter = RateLimiter(pace=False)
+    throttled = httpx.Response(429, headers={"retry-after": "0"})
+    responses = [
+        httpx.ConnectError("down"),
+        httpx.Response(503, content=b"busy", headers=HEADERS),
+        throttled,
+        _page(),
+    ]
+
+    with patch.object(client.http, "get", side_effect=responses):
+        with patch("twitterapiv2.rate_limit.time.sleep"):
+            client.get(URL, {"query": "hello"})
+
+    assert [metrics.status for metrics in reported] == [0, 503, 429, 200]
+    assert [metrics.retries for metrics in reported] == [0, 1, 2, 2]
+    assert [metrics.retried for metrics in reported] == [True, True, False, False]
+    assert reported[0].error == "ConnectError"
+    assert reported[0].response_bytes == 0
+    assert reported[1].error is None
+
+
+def test_hooks_report_failed_attempt_not_retried(client: ClientCore) -> None:
+    reported: list[RequestMetrics] = []
+    client.hooks.append(reported.append)
+
+    with patch.object(client.http, "get", side_effect=httpx.ReadTimeout("slow")):
+        with pytest.raises(httpx.ReadTimeout):
+            client.get(URL, {"query": "hello"})
+
+    assert len(reported) == 1
+    assert reported[0].status == 0
+    assert reported[0].error == "ReadTimeout"
+    assert not reported[0].retried
+
+
+def test_failing_hook_does_not_fail_request(client: ClientCore) -> None:
+    client.hooks.append(MagicMock(side_effect=RuntimeError("broken")))
+
+    with patch.object(client.http, "get", return_value=_page()):
+        assert client.get(URL, {"query": "hello"})["data"]
+
+
+def test_async_hooks() -> None:
+    client = AsyncClientCore(MagicMock(get_bearer=AsyncMock(return_value="mock")))
+    reported: list[RequestMetrics] = []
+    client.hooks.append(reported.append)
+
+    with patch.object(client.http, "get", AsyncMock(return_value=_page())):
+        asyncio.run(client.get(URL, {"query": "hello"}))
+
+    assert reported[0].endpoint == ENDPOINT
+
+
+def test_collector_render() -> None:
+    collector = PrometheusCollector()
+    collector(_metrics())
+    collector(_metrics(status=503, latency=3.0, retried=True, limit_remaining=296))
+    collector(_metrics(endpoint=POST, status=0, retried=True, error="ConnectError"))
+    collector(_metrics(endpoint='GET /2/"odd"', limit_remaining=None))
+
+    text = collector.render()
+
+    assert "# TYPE twitterapiv2_requests_total counter" in text
+    assert f'requests_total{{endpoint="{ENDPOINT}",status="200"}} 1' in text
+    assert f'requests_total{{endpoint="{ENDPOINT}",status="503"}} 1' in text
+    assert f'response_bytes_total{{endpoint="{ENDPOINT}"}} 200' in text
+    assert f'requests_total{{endpoint="{POST}",status="0"}} 1' in text
+    assert f'retries_total{{endpoint="{ENDPOINT}"}} 1' in text
+    assert f'rate_limit_remaining{{endpoint="{ENDPOINT}"}} 296' in text
+    assert 'endpoint="GET /2/\\"odd\\""' in text
+    assert "# TYPE twitterapiv2_request_duration_seconds histogram" in text
+    labels = f'endpoint="{ENDPOINT}"'
+    assert f'request_duration_seconds_bucket{{{labels},le="0.25"}} 1' in text
+    assert f'request_duration_seconds_bucket{{{labels},le="+Inf"}} 2' in text
+    assert f"request_duration_seconds_sum{{{labels}}} 3.2" in text
+    assert f'page_depth_bucket{{{labels},le="1"}} 2' in text
+    assert text.endswith("\n")
+
+
+def test_collector_as_client_hook(client: ClientCore) -> None:
+    collector = PrometheusCollector(namespace="app")
+    client.hooks.append(collector)
+
+    with patch.object(client.http, "get", return_value=_page()):
+        client.get(URL, {"query": "hello"})
+
+    assert f'app_requests_total{{endpoint="{ENDPOINT}",status="200"}} 1' in (
+        collector.render()
+    )
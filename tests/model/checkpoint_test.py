@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from twitterapiv2.model.checkpoint import Checkpoint
+
+
+def test_apply_sets_since_id_and_next_token() -> None:
+    checkpoint = Checkpoint("100", "token")
+
+    params = checkpoint.apply({"query": "hello", "next_token": "stale"})
+
+    assert params == {"query": "hello", "since_id": "100", "next_token": "token"}
+
+
+def test_apply_empty_checkpoint_keeps_fields() -> None:
+    params = Checkpoint().apply({"query": "hello", "since_id": "5"})
+
+    assert params == {"query": "hello", "since_id": "5"}
+
+
+def test_advance_holds_newest_id_until_run_completes() -> None:
+    first = {"meta": {"newest_id": "300", "next_token": "page2"}}
+    second = {"meta": {"newest_id": "200", "next_token": "page3"}}
+    last = {"meta": {"newest_id": "150"}}
+
+    checkpoint = Checkpoint("100").advance(first)
+    assert checkpoint == Checkpoint("100", "page2", "300")
+
+    checkpoint = checkpoint.advance(second)
+    assert checkpoint == Checkpoint("100", "page3", "300")
+
+    assert checkpoint.advance(last) == Checkpoint("300")
+
+
+def test_advance_without_results_keeps_newest_id() -> None:
+    assert Checkpoint("100").advance({"meta": {"result_count": 0}}) == Checkpoint("100")
+
+
+def test_to_dict() -> None:
+    assert Checkpoint("1", "t").to_dict() == {
+        "newest_id": "1",
+        "next_token": "t",
+        "pending_newest_id": None,
+    }
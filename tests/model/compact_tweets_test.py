@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import pytest
+from twitterapiv2.model.compact_tweets import CompactTweets
+from twitterapiv2.model.recent import Recent
+
+PAGE: Recent = {
+    "data": [
+        {
+            "id": "1461880347478528007",
+            "text": "hello",
+            "author_id": "2244994945",
+            "created_at": "2021-11-20T02:05:01.000Z",
+            "lang": "en",
+            "public_metrics": {
+                "retweet_count": 1,
+                "reply_count": 2,
+                "like_count": 3,
+                "quote_count": 4,
+            },
+        },
+        {"id": "1461880346580979715", "text": "hola", "lang": "es"},
+        {"id": "1461880346165788678", "text": "hi", "lang": "en"},
+    ],
+    "meta": {"result_count": 3},
+}
+
+
+@pytest.fixture
+def compact() -> CompactTweets:
+    return CompactTweets.from_pages([PAGE])
+
+
+def test_columns(compact: CompactTweets) -> None:
+    assert len(compact) == 3
+    assert compact.ids.typecode == "q"
+    assert list(compact.ids) == [int(tweet["id"]) for tweet in PAGE["data"]]
+    assert list(compact.author_ids) == [2244994945, -1, -1]
+    assert compact.created_at[0] == 1637373901
+    assert list(compact.metrics["like_count"]) == [3, -1, -1]
+    assert list(compact.lang_codes) == [0, 1, 0]
+
+
+def test_row_view_round_trips(compact: CompactTweets) -> None:
+    assert list(compact) == PAGE["data"]
+    assert compact[-1] == PAGE["data"][-1]
+    assert compact[1:] == PAGE["data"][1:]
+
+
+def test_index_out_of_range(compact: CompactTweets) -> None:
+    with pytest.raises(IndexError):
+        compact[3]
+
+
+def test_lang_values_are_interned(compact: CompactTweets) -> None:
+    assert compact[0]["lang"] is compact[2]["lang"]
+
+
+def test_without_text() -> None:
+    compact = CompactTweets.from_pages([PAGE], keep_text=False)
+
+    assert compact.texts == []
+    assert "text" not in compact[0]
+
+
+def test_nbytes(compact: CompactTweets) -> None:
+    assert compact.nbytes > 3 * 8 * 8
+
+
+def test_append_page_without_data() -> None:
+    compact = CompactTweets()
+
+    compact.append_page({"meta": {"result_count": 0}})
+
+    assert len(compact) == 0
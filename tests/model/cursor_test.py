@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from httpx import Response
+from twitterapiv2.model.cursor import Cursor
+from twitterapiv2.model.query_spec import QuerySpec
+
+SPEC = QuerySpec.build("https://api.twitter.com/2/tweets/search/recent", {"query": "a"})
+HEADERS = {"x-rate-limit-remaining": "42", "x-rate-limit-reset": "1637917876"}
+
+
+def test_new_cursor() -> None:
+    cursor = Cursor(SPEC)
+
+    assert cursor.more
+    assert cursor.limit_remaining == -1
+    assert cursor.limit_reset is None
+
+
+def test_advance_and_reset() -> None:
+    cursor = Cursor(SPEC)
+    resp = Response(200, headers=HEADERS)
+
+    cursor.advance({"meta": {"next_token": "page2"}}, resp)
+
+    assert cursor.next_token == "page2"
+    assert cursor.pages == 1
+    assert cursor.more
+    assert cursor.limit_remaining == 42
+    assert cursor.limit_reset == datetime(2021, 11, 26, 9, 11, 16)
+
+    cursor.advance({"meta": {}})  # served from cache, snapshot is kept
+
+    assert not cursor.more
+    assert cursor.last_response is resp
+
+    cursor.reset()
+
+    assert cursor == Cursor(SPEC)
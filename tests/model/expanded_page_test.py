@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import pytest
+from twitterapiv2.model.expanded_page import ExpandedPage
+from twitterapiv2.model.recent import Recent
+
+PAGE: Recent = {
+    "data": [
+        {
+            "id": "1461880347478528007",
+            "text": "RT with media",
+            "author_id": "2244994945",
+            "attachments": {
+                "media_keys": ["3_1", "3_missing", "3_2"],
+                "poll_ids": ["9"],
+            },
+            "geo": {"place_id": "01a9a39529b27f36"},
+            "referenced_tweets": [
+                {"type": "retweeted", "id": "1461880000000000000"},
+                {"type": "quoted", "id": "1461880000000000001"},
+            ],
+        },
+        {"id": "1461880346580979715", "text": "no expansions"},
+    ],
+    "includes": {
+        "users": [
+            {"id": "2244994945", "username": "TwitterDev"},
+            {"id": "783214", "username": "Twitter"},
+        ],
+        "media": [
+            {"media_key": "3_1", "type": "photo"},
+            {"media_key": "3_2", "type": "video"},
+        ],
+        "places": [{"id": "01a9a39529b27f36", "full_name": "Manhattan, NY"}],
+        "polls": [{"id": "9", "voting_status": "closed"}],
+        "tweets": [
+            {"id": "1461880000000000000", "text": "original", "author_id": "783214"}
+        ],
+    },
+    "meta": {"result_count": 2},
+}
+
+
+@pytest.fixture
+def page() -> ExpandedPage:
+    return ExpandedPage(PAGE)
+
+
+def test_iterates_data(page: ExpandedPage) -> None:
+    assert len(page) == 2
+    assert [tweet.id for tweet in page] == [
+        "1461880347478528007",
+        "1461880346580979715",
+    ]
+    assert page[1].text == "no expansions"
+    assert page[0] == next(iter(page))
+
+
+def test_resolves_expansions(page: ExpandedPage) -> None:
+    tweet = page[0]
+
+    assert tweet.author == {"id": "2244994945", "username": "TwitterDev"}
+    assert [media["media_key"] for media in tweet.media] == ["3_1", "3_2"]
+    assert tweet.place == {"id": "01a9a39529b27f36", "full_name": "Manhattan, NY"}
+    assert tweet.poll == {"id": "9", "voting_status": "closed"}
+
+
+def test_resolves_included_referenced_tweets(page: ExpandedPage) -> None:
+    referenced = page[0].referenced_tweets
+
+    assert len(referenced) == 1
+    kind, original = referenced[0]
+    assert kind == "retweeted"
+    assert original.text == "original"
+    assert original.author == {"id": "783214", "username": "Twitter"}
+
+
+def test_missing_expansions(page: ExpandedPage) -> None:
+    tweet = page[1]
+
+    assert tweet.author is None
+    assert tweet.in_reply_to_user is None
+    assert tweet.media == []
+    assert tweet.place is None
+    assert tweet.poll is None
+    assert tweet.referenced_tweets == []
+
+
+def test_page_without_includes() -> None:
+    page = ExpandedPage({"data": [{"id": "1", "author_id": "2"}]})
+
+    assert page[0].author is None
+    assert page.tweet("1") is None
+    assert not page.users
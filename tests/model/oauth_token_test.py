@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import time
+
+from twitterapiv2.model.oauth_token import OAuthToken
+
+
+def test_from_oauth_expires_in() -> None:
+    token = OAuthToken.from_oauth({"access_token": "mock", "expires_in": 7200})
+
+    assert token.access_token == "mock"
+    assert token.refresh_token is None
+    assert token.expires_at is not None
+    assert token.expires_at > time.time() + 7000
+
+
+def test_from_oauth_expires_at() -> None:
+    token = OAuthToken.from_oauth(
+        {"access_token": "mock", "refresh_token": "r", "expires_at": 100}
+    )
+
+    assert token.expires_at == 100.0
+    assert token.refresh_token == "r"
+
+
+def test_expired() -> None:
+    token = OAuthToken("mock", expires_at=1000.0)
+
+    assert not token.expired(now=900.0)
+    assert token.expired(now=950.0)
+    assert token.expired(leeway=0, now=1000.0)
+    assert not OAuthToken("mock").expired()
+
+
+def test_to_dict_round_trip() -> None:
+    token = OAuthToken("mock", "refresh", 1000.0)
+
+    assert OAuthToken(**token.to_dict()) == token
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from urllib.parse import parse_qsl
+
+import pytest
+from twitterapiv2.cache import cache_key
+from twitterapiv2.model.query_spec import QuerySpec
+
+URL = "https://api.twitter.com/2/tweets/search/recent"
+
+
+def test_build_canonicalizes_fields() -> None:
+    first = QuerySpec.build(
+        URL,
+        {"query": "hello", "tweet.fields": "lang,id,lang", "max_results": 50},
+    )
+    second = QuerySpec.build(
+        URL,
+        {"max_results": 50, "tweet.fields": "id,lang", "query": "hello", "x": None},
+    )
+
+    assert first == second
+    assert hash(first) == hash(second)
+    assert first.params == (
+        ("max_results", "50"),
+        ("query", "hello"),
+        ("tweet.fields", "id,lang"),
+    )
+    assert {first: "shared"}[second] == "shared"
+
+
+def test_build_drops_next_token_and_requires_fields() -> None:
+    spec = QuerySpec.build(URL, {"query": "hello", "next_token": "abc"})
+
+    assert spec.get("next_token") is None
+    assert spec.get("query") == "hello"
+    with pytest.raises(ValueError, match="query"):
+        QuerySpec.build(URL, {"query": None}, required=["query"])
+
+
+def test_key_matches_cache_key() -> None:
+    fields = {"query": "hello world", "expansions": "author_id,geo.place_id"}
+    spec = QuerySpec.build(URL, fields)
+
+    assert spec.key == cache_key(URL, fields)
+    assert f"{URL}?{spec.query_string('tok')}" == cache_key(
+        URL, {**fields, "next_token": "tok"}
+    )
+
+
+def test_query_string() -> None:
+    spec = QuerySpec.build(URL, {"query": "a b", "user.fields": "id"})
+
+    assert spec.query_string() == spec.encoded == "query=a+b&user.fields=id"
+    assert parse_qsl(spec.query_string("tok")) == [
+        ("next_token", "tok"),
+        ("query", "a b"),
+        ("user.fields", "id"),
+    ]
+    assert spec.to_params() == {"query": "a b", "user.fields": "id"}
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+import pytest
+from httpx import Response
+from twitterapiv2.client_core import ClientCore
+from twitterapiv2.exceptions import ThrottledError
+from twitterapiv2.rate_limit import DEFAULT_THROTTLE_WAIT
+from twitterapiv2.rate_limit import RateLimiter
+from twitterapiv2.rate_limit import RESET_MARGIN
+
+BASE = "https://api.twitter.com/2"
+URL = f"{BASE}/tweets/search/recent"
+NOW = 1_000_000.0
+
+
+def _headers(remaining: int, reset: float, limit: int = 450) -> dict[str, str]:
+    return {
+        "x-rate-limit-limit": str(limit),
+        "x-rate-limit-remaining": str(remaining),
+        "x-rate-limit-reset": str(int(reset)),
+    }
+
+
+@pytest.fixture
+def limiter() -> RateLimiter:
+    return RateLimiter(clock=lambda: NOW)
+
+
+@pytest.mark.parametrize(
+    ("url", "method", "expected"),
+    (
+        (URL, "get", "GET /2/tweets/search/recent"),
+        (f"{BASE}/users/12345/likes", "post", "POST /2/users/:id/likes"),
+        (f"{BASE}/users/1/likes/2", "delete", "DELETE /2/users/:id/likes/:id"),
+    ),
+)
+def test_endpoint(url: str, method: str, expected: str) -> None:
+    assert RateLimiter.endpoint(url, method) == expected
+
+
+def test_delay_unknown_endpoint(limiter: RateLimiter) -> None:
+    assert limiter.delay(URL) == 0.0
+
+
+def test_delay_paces_across_window(limiter: RateLimiter) -> None:
+    limiter.update(URL, Response(200, headers=_headers(10, NOW + 100)))
+
+    delays = [limiter.delay(URL) for _ in range(3)]
+
+    assert delays[0] == 0.0
+    assert delays[1] == pytest.approx(10.0)
+    assert delays[2] == pytest.approx(10.0 + 100 / 9)
+
+
+def test_delay_without_pacing(limiter: RateLimiter) -> None:
+    limiter.pace = False
+    limiter.update(URL, Response(200, headers=_headers(2, NOW + 100)))
+
+    assert [limiter.delay(URL) for _ in range(2)] == [0.0, 0.0]
+    assert limiter.delay(URL) == pytest.approx(100 + RESET_MARGIN)
+
+
+def test_delay_exhausted_waits_for_reset(limiter: RateLimiter) -> None:
+    limiter.update(URL, Response(200, headers=_headers(0, NOW + 30)))
+
+    assert limiter.delay(URL) == pytest.approx(30 + RESET_MARGIN)
+
+
+def test_delay_after_reset_passed(limiter: RateLimiter) -> None:
+    limiter.update(URL, Response(200, headers=_headers(0, NOW - 1)))
+
+    assert limiter.delay(URL) == 0.0
+
+
+def test_update_429_exhausts_endpoint(limiter: RateLimiter) -> None:
+    limiter.update(URL, Response(429, headers=_headers(5, NOW + 60)))
+
+    state = limiter.get(URL)
+    assert state is not None
+    assert state.remaining == 0
+
+
+def test_update_429_without_headers(limiter: RateLimiter) -> None:
+    limiter.update(URL, Response(429))
+
+    assert limiter.delay(URL) == pytest.approx(DEFAULT_THROTTLE_WAIT + RESET_MARGIN)
+
+
+@pytest.mark.parametrize(
+    ("headers", "expected"),
+    (
+        ({"x-rate-limit-remaining": "0"}, DEFAULT_THROTTLE_WAIT),
+        ({"x-rate-limit-remaining": "0", "retry-after": "7"}, 7.0),
+        (_headers(0, NOW - 30), RESET_MARGIN),
+        ({**_headers(0, NOW - 30), "retry-after": "7"}, 7.0),
+    ),
+)
+def test_update_429_missing_or_past_reset_still_waits(
+    limiter: RateLimiter,
+    headers: dict[str, str],
+    expected: float,
+) -> None:
+    limiter.update(URL, Response(429, headers=headers))
+
+    assert limiter.delay(URL) == pytest.approx(expected + RESET_MARGIN)
+
+
+def test_update_ignores_responses_without_headers(limiter: RateLimiter) -> None:
+    limiter.update(URL, Response(200))
+
+    assert limiter.get(URL) is None
+
+
+def test_client_waits_out_throttle(limiter: RateLimiter) -> None:
+    client = ClientCore(MagicMock())
+    client.rate_limiter = limiter
+    responses = [
+        Response(429, headers=_headers(0, NOW + 5)),
+        Response(200, content=b'{"data": []}', headers=_headers(449, NOW + 900)),
+    ]
+
+    with patch.object(client.http, "get", side_effect=responses) as mock_get:
+        with patch("twitterapiv2.rate_limit.time.sleep") as mock_sleep:
+            result = client.get(URL)
+
+    assert result == {"data": []}
+    assert mock_get.call_count == 2
+    mock_sleep.assert_called_once_with(pytest.approx(5 + RESET_MARGIN))
+    assert client.limit_remaining == 449
+
+
+def test_async_client_waits_out_throttle(limiter: RateLimiter) -> None:
+    from twitterapiv2.client_core import AsyncClientCore
+
+    client = AsyncClientCore(MagicMock(get_bearer=AsyncMock(return_value="mock")))
+    client.rate_limiter = limiter
+    responses = [
+        Response(429, headers=_headers(0, NOW + 5)),
+        Response(200, content=b'{"data": []}', headers=_headers(449, NOW + 900)),
+    ]
+
+    with patch.object(client.http, "get", AsyncMock(side_effect=responses)):
+        with patch("twitterapiv2.rate_limit.asyncio.sleep") as mock_sleep:
+            result = asyncio.run(client.get(URL))
+
+    assert result == {"data": []}
+    mock_sleep.assert_awaited_once_with(pytest.approx(5 + RESET_MARGIN))
+
+
+def test_client_raises_after_max_throttle_waits() -> None:
+    limiter = RateLimiter(max_throttle_waits=2, clock=lambda: NOW)
+    client = ClientCore(MagicMock())
+    client.rate_limiter = limiter
+    throttled = Response(429, headers={"x-rate-limit-remaining": "0"})
+
+    with patch.object(client.http, "get", return_value=throttled) as mock_get:
+        with patch("twitterapiv2.rate_limit.time.sleep") as mock_sleep:
+            with pytest.raises(ThrottledError):
+                client.get(URL)
+
+    assert mock_get.call_count == 3
+    assert mock_sleep.call_count == 2
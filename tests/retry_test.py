@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+import httpx
+import pytest
+from twitterapiv2.client_core import AsyncClientCore
+from twitterapiv2.client_core import ClientCore
+from twitterapiv2.exceptions import InvalidResponseError
+from twitterapiv2.manage_tweets import ManageTweets
+from twitterapiv2.retry import RetryPolicy
+
+from tests.fixtures.mock_headers import HEADERS
+
+BODY = b'{"data":{"id":"1","text":"mock"}}'
+URL = "https://api.twitter.com/2/tweets"
+
+
+def _response(status_code: int, **headers: str) -> httpx.Response:
+    return httpx.Response(status_code, content=BODY, headers={**HEADERS, **headers})
+
+
+def _policy(**kwargs: float) -> RetryPolicy:
+    return RetryPolicy(rand=lambda: 0.5, **kwargs)  # type: ignore
+
+
+def test_delay_backoff_curve() -> None:
+    policy = RetryPolicy(backoff=1.0, multiplier=2.0, max_backoff=5.0, jitter=0.0)
+
+    assert [policy.delay(retry) for retry in range(1, 5)] == [1.0, 2.0, 4.0, 5.0]
+
+
+def test_delay_jitter() -> None:
+    policy = _policy(backoff=2.0, jitter=0.5)
+
+    assert policy.delay(1) == 1.5
+
+
+def test_delay_honors_retry_after() -> None:
+    policy = _policy(backoff=1.0, max_backoff=10.0)
+
+    assert policy.delay(1, _response(503, **{"retry-after": "7"})) == 7.0
+    assert policy.delay(1, _response(503, **{"retry-after": "70"})) == 10.0
+    assert policy.delay(1, _response(503, **{"retry-after": "soon"})) == 0.5
+
+
+@pytest.mark.parametrize(
+    ("method", "resp", "error", "expected"),
+    (
+        ("GET", _response(503), None, True),
+        ("get", _response(500), None, True),
+        ("GET", _response(400), None, False),
+        ("GET", _response(200), None, False),
+        ("DELETE", _response(502), None, True),
+        ("POST", _response(503), None, False),
+        ("GET", None, httpx.ReadTimeout("timeout"), True),
+        ("POST", None, httpx.ReadTimeout("timeout"), False),
+        ("POST", None, httpx.ConnectError("refused"), True),
+        ("GET", None, ValueError("bug"), False),
+    ),
+)
+def test_next_delay_retryable(
+    method: str,
+    resp: httpx.Response | None,
+    error: Exception | None,
+    expected: bool,
+) -> None:
+    policy = _policy()
+
+    delay = policy.next_delay(method, 0, resp=resp, error=error)
+
+    assert (delay is not None) is expected
+    assert policy.stats.retries == int(expected)
+
+
+def test_next_delay_max_attempts() -> None:
+    policy = _policy(max_attempts=3)
+    resp = _response(503)
+
+    delays = [policy.next_delay("GET", retries, resp=resp) for retries in range(3)]
+
+    assert delays == [0.25, 0.5, None]
+    assert policy.stats.retries == 2
+    assert policy.stats.exhausted == 1
+
+
+def test_invalid_max_attempts() -> None:
+    with pytest.raises(ValueError):
+        RetryPolicy(max_attempts=0)
+
+
+@pytest.fixture
+def client() -> ClientCore:
+    client = ClientCore(MagicMock(get_bearer=MagicMock(return_value="mock")))
+    client.retry_policy = _policy()
+    return client
+
+
+def test_client_retries_transient_failures(client: ClientCore) -> None:
+    outcomes = [httpx.ReadTimeout("timeout"), _response(503), _response(200)]
+
+    with patch.object(client.http, "get", side_effect=outcomes) as mock_get:
+        with patch("time.sleep") as mock_sleep:
+            result = client.get(URL, {})
+
+    assert result["data"]["id"] == "1"
+    assert mock_get.call_count == 3
+    assert [call.args[0] for call in mock_sleep.call_args_list] == [0.25, 0.5]
+    assert client.retries == 2
+
+
+def test_client_gives_up_after_max_attempts(client: ClientCore) -> None:
+    with patch.object(client.http, "get", return_value=_response(503)) as mock_get:
+        with patch("time.sleep"):
+            with pytest.raises(InvalidResponseError):
+                client.get(URL, {})
+
+    assert mock_get.call_count == 5
+    assert client.retries == 4
+
+
+def test_client_without_policy_fails_fast() -> None:
+    client = ClientCore(MagicMock())
+
+    with patch.object(client.http, "get", side_effect=httpx.ReadTimeout("timeout")):
+        with pytest.raises(httpx.ReadTimeout):
+            client.get(URL, {})
+
+    assert client.retries == 0
+
+
+def test_send_tweet_is_not_replayed_after_sending() -> None:
+    client = ManageTweets(MagicMock())
+    client.retry_policy = _policy()
+    tweet = client.new_tweet().text("hello")
+
+    with patch.object(client.http, "post", return_value=_response(503)) as mock_post:
+        with pytest.raises(InvalidResponseError):
+            client.send_tweet(tweet)
+
+    assert mock_post.call_count == 1
+
+
+def test_send_tweet_retries_connection_failures() -> None:
+    client = ManageTweets(MagicMock())
+    client.retry_policy = _policy()
+    tweet = client.new_tweet().text("hello")
+    outcomes = [httpx.ConnectError("refused"), _response(201)]
+
+    with patch.object(client.http, "post", side_effect=outcomes) as mock_post:
+        with patch("time.sleep"):
+            result = client.send_tweet(tweet)
+
+    assert result["data"]["id"] == "1"
+    assert mock_post.call_count == 2
+
+
+def test_async_client_retries() -> None:
+    client = AsyncClientCore(MagicMock(get_bearer=AsyncMock(return_value="mock")))
+    client.retry_policy = _policy()
+    outcomes = [_response(502), _response(200)]
+
+    with patch.object(client.http, "get", AsyncMock(side_effect=outcomes)):
+        with patch("asyncio.sleep", AsyncMock()) as mock_sleep:
+            result = asyncio.run(client.get(URL, {}))
+
+    assert result["data"]["id"] == "1"
+    mock_sleep.assert_awaited_once_with(0.25)
+    assert client.retries == 1
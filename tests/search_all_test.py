@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from datetime import datetime
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+from twitterapiv2.dedup import BloomFilter
+from twitterapiv2.http_pool import HttpPool
+from twitterapiv2.search_all import AsyncSearchAll
+from twitterapiv2.search_all import SearchAll
+from twitterapiv2.search_all import time_windows
+from twitterapiv2.search_all import URL
+
+from tests.fixtures.mock_headers import HEADERS
+
+START = datetime(2021, 1, 1)
+END = datetime(2021, 1, 4)
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    """Two pages per window, tweet ids are derived from the window start."""
+    assert str(request.url).startswith(URL)
+    params = request.url.params
+    if params["start_time"] == "2021-01-03T00:00:00Z":
+        return httpx.Response(503, headers=HEADERS, content=b"unavailable")
+    day = int(params["start_time"][8:10])
+    page = 2 if params.get("next_token") else 1
+    meta: dict[str, str | int] = {"result_count": 1}
+    if page == 1:
+        meta["next_token"] = f"day{day}"
+    body = {"data": [{"id": f"{day}{page}", "text": params["query"]}], "meta": meta}
+    return httpx.Response(200, headers=HEADERS, content=json.dumps(body))
+
+
+async def _async_handler(request: httpx.Request) -> httpx.Response:
+    return _handler(request)
+
+
+@pytest.fixture
+def client() -> SearchAll:
+    client = SearchAll(MagicMock())
+    client.use_pool(HttpPool(transport=httpx.MockTransport(_handler)))
+    client.query("hello")
+    return client
+
+
+def test_time_windows() -> None:
+    windows = time_windows(START, END, 3)
+
+    assert windows == [
+        (datetime(2021, 1, 1), datetime(2021, 1, 2)),
+        (datetime(2021, 1, 2), datetime(2021, 1, 3)),
+        (datetime(2021, 1, 3), datetime(2021, 1, 4)),
+    ]
+
+
+def test_time_windows_drops_empty_windows() -> None:
+    windows = time_windows(START, datetime(2021, 1, 1, 0, 0, 2), 5)
+
+    assert len(windows) == 2
+    assert windows[-1][1] == datetime(2021, 1, 1, 0, 0, 2)
+
+
+@pytest.mark.parametrize("start, end, count", [(START, END, 0), (END, START, 2)])
+def test_time_windows_invalid(start: datetime, end: datetime, count: int) -> None:
+    with pytest.raises(ValueError):
+        time_windows(start, end, count)
+
+
+def test_max_results_up_to_500(client: SearchAll) -> None:
+    client.max_results(500)
+
+    assert client.fields["max_results"] == 500
+    with pytest.raises(ValueError):
+        client.max_results(501)
+
+
+def test_backfill_paginates_each_window(client: SearchAll) -> None:
+    client._next_token = "untouched"
+    windows = time_windows(START, datetime(2021, 1, 3), 2)
+
+    pages = list(client.backfill(windows, max_workers=2))
+
+    ids = sorted(page["data"][0]["id"] for page in pages)
+    assert ids == ["11", "12", "21", "22"]
+    assert client._next_token == "untouched"
+
+
+def test_backfill_dedup(client: SearchAll) -> None:
+    seen = BloomFilter(capacity=100, error_rate=0.001)
+    seen.add("12")
+    windows = time_windows(START, datetime(2021, 1, 3), 2)
+
+    pages = list(client.backfill(windows, max_workers=2, dedup=seen))
+    again = list(client.backfill(windows, max_workers=2, dedup=seen))
+
+    ids = sorted(tweet["id"] for page in pages for tweet in page["data"])
+    assert ids == ["11", "21", "22"]
+    assert len(again) == 4
+    assert not any(page["data"] for page in again)
+
+
+def test_backfill_raises_worker_errors(client: SearchAll) -> None:
+    with pytest.raises(Exception, match="503"):
+        list(client.backfill(time_windows(START, END, 3), max_workers=3))
+
+
+def test_backfill_stops_when_closed(client: SearchAll) -> None:
+    for page in client.backfill(time_windows(START, datetime(2021, 1, 3), 2)):
+        assert page["data"]
+        break
+
+
+def test_backfill_query_required() -> None:
+    with pytest.raises(ValueError):
+        next(SearchAll(MagicMock()).backfill([(START, END)]))
+
+
+def test_async_backfill() -> None:
+    auth_mock = MagicMock(get_bearer=AsyncMock(return_value="mock"))
+    client = AsyncSearchAll(auth_mock)
+    client.use_pool(HttpPool(async_transport=httpx.MockTransport(_async_handler)))
+    client.query("hello")
+    windows = time_windows(START, datetime(2021, 1, 3), 2)
+
+    async def collect() -> list[str]:
+        pages = client.backfill(windows, max_concurrency=1)
+        return [page["data"][0]["id"] async for page in pages]
+
+    assert sorted(asyncio.run(collect())) == ["11", "12", "21", "22"]
+
+
+def test_async_backfill_raises_worker_errors() -> None:
+    auth_mock = MagicMock(get_bearer=AsyncMock(return_value="mock"))
+    client = AsyncSearchAll(auth_mock)
+    client.use_pool(HttpPool(async_transport=httpx.MockTransport(_async_handler)))
+    client.query("hello")
+
+    async def collect() -> None:
+        async for _ in client.backfill(time_windows(START, END, 3)):
+            pass
+
+    with pytest.raises(Exception, match="503"):
+        asyncio.run(collect())
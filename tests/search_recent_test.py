@@ -1,18 +1,38 @@
 from __future__ import annotations
 
+import asyncio
+import json
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import AsyncMock
 from unittest.mock import MagicMock
 from unittest.mock import patch
 
 import pytest
+from httpx import Response
+from twitterapiv2.checkpoint_store import FileCheckpointStore
+from twitterapiv2.dedup import ExactFilter
+from twitterapiv2.model.checkpoint import Checkpoint
+from twitterapiv2.search_recent import AsyncSearchRecent
 from twitterapiv2.search_recent import SearchRecent
 from twitterapiv2.search_recent import URL
 
+from tests.fixtures.httpmocker import AsyncHttpMocker
 from tests.fixtures.httpmocker import HttpMocker
 from tests.fixtures.mock_headers import HEADERS
 
 MOCK_RESP = '{"data":[{"id":"1461880347478528007","text":"RT @forlalisa_th: Hello  @BigReidRadio I would LOVE to hear #MONEY  on @997now !! Can you please play \\uD83D\\uDCB8\\uD83D\\uDCB8 for us ?\\uD83E\\uDD70\\uD83D\\uDE01 \\nThank youuuuu!\\uD83E\\uDD17 https:…"},{"id":"1461880346580979715","text":"RT @SAVY13479352: Hello, I am a retired man, trying my best to do Affiliate Marketing, Since last few months I have not received a single s…"},{"id":"1461880346165788678","text":"Hello @God it’s me, I love it here. Thank you."},{"id":"1461880345511432193","text":"RT @skjnkim_cart: [#skjnkim_sells] \\nwts • lfb • ph • nct dream\\n\\n･ᴗ･ Hello Future PCS\\n       •jaemin (future) - clean\\n       •jeno (future)…"},{"id":"1461880344974540805","text":"hello someone pspspspsp https://t.co/qVLlxCEBA4"},{"id":"1461880344026746884","text":"RT @lizehtriosreal: Hello ❤️ https://t.co/gf88tYT4QD"},{"id":"1461880343821176837","text":"RT @mom_tho: hello darkness my old friend\\nis it 5 or 10 pm"},{"id":"1461880343695290368","text":"RT @_naminaminaeee: hello, drop the tags for jihyo!!"},{"id":"1461880343229878276","text":"@NaughtyLoise Hello Tom New Jersey"},{"id":"1461880343020060673","text":"@Hello_Easyaim す"}],"meta":{"newest_id":"1461880347478528007","oldest_id":"1461880343020060673","result_count":10,"next_token":"b26v89c19zqg8o3fpdy5zsnp3n3qzp909cim472adoxa5"}}'  # noqa: E501
 
 
+def _page(ids: list[int], next_token: str | None = None) -> str:
+    data = [{"id": str(i), "created_at": f"2021-11-{i:02d}T00:00:00.000Z"} for i in ids]
+    meta = {"result_count": len(ids), "next_token": next_token}
+    return json.dumps({"data": data, "meta": meta})
+
+
+PAGES = [_page([20, 19, 18], "page2"), _page([17, 16, 15], "page3"), _page([14, 13])]
+
+
 @pytest.fixture
 def client() -> SearchRecent:
     return SearchRecent(MagicMock())
@@ -31,3 +51,221 @@ def test_valid_search(client: SearchRecent) -> None:
 def test_query_required(client: SearchRecent) -> None:
     with pytest.raises(ValueError):
         client.fetch()
+
+
+def test_async_valid_search() -> None:
+    auth_mock = MagicMock(get_bearer=AsyncMock(return_value="mock"))
+    client = AsyncSearchRecent(auth_mock)
+
+    with patch.object(client, "http", AsyncHttpMocker()) as mock_http:
+        mock_http.add_response(MOCK_RESP, HEADERS, 200, URL)
+
+        client.query("hello")
+        result = asyncio.run(client.fetch())
+
+        assert result["data"]
+        assert client.more
+
+
+def test_async_query_required() -> None:
+    with pytest.raises(ValueError):
+        asyncio.run(AsyncSearchRecent(MagicMock()).fetch())
+
+
+def test_iter_pages_follows_next_token(client: SearchRecent) -> None:
+    with patch.object(client, "http", HttpMocker()) as mock_http:
+        for page in PAGES:
+            mock_http.add_response(page, HEADERS, 200, URL)
+        client.query("hello")
+
+        result = list(client.iter_pages())
+
+    assert len(result) == 3
+    assert not client.more
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "expected_ids"),
+    (
+        ({}, ["20", "19", "18", "17", "16", "15", "14", "13"]),
+        ({"max_pages": 1}, ["20", "19", "18"]),
+        ({"max_tweets": 4}, ["20", "19", "18", "17"]),
+        ({"oldest": datetime(2021, 11, 16)}, ["20", "19", "18", "17", "16"]),
+    ),
+)
+def test_iter_tweets_stop_conditions(
+    client: SearchRecent,
+    kwargs: dict[str, int | datetime],
+    expected_ids: list[str],
+) -> None:
+    with patch.object(client, "http", HttpMocker()) as mock_http:
+        for page in PAGES:
+            mock_http.add_response(page, HEADERS, 200, URL)
+        client.query("hello")
+
+        result = [tweet["id"] for tweet in client.iter_tweets(**kwargs)]  # type: ignore
+
+        assert result == expected_ids
+        # Lazy: pages past the stop condition are never requested
+        assert len(mock_http._responses) == 3 - -(-len(expected_ids) // 3)
+
+
+def test_async_iter_tweets() -> None:
+    auth_mock = MagicMock(get_bearer=AsyncMock(return_value="mock"))
+    client = AsyncSearchRecent(auth_mock)
+
+    async def collect() -> list[str]:
+        return [tweet["id"] async for tweet in client.iter_tweets(max_tweets=5)]
+
+    with patch.object(client, "http", AsyncHttpMocker()) as mock_http:
+        for page in PAGES:
+            mock_http.add_response(page, HEADERS, 200, URL)
+        client.query("hello")
+
+        result = asyncio.run(collect())
+
+    assert result == ["20", "19", "18", "17", "16"]
+    assert client.more
+
+
+def test_iter_tweets_dedup(client: SearchRecent) -> None:
+    seen = ExactFilter()
+    seen.add("19")
+    overlapping = [_page([20, 19, 18], "page2"), _page([18, 17, 16])]
+
+    with patch.object(client, "http", HttpMocker()) as mock_http:
+        for page in overlapping:
+            mock_http.add_response(page, HEADERS, 200, URL)
+        client.query("hello")
+
+        result = [tweet["id"] for tweet in client.iter_tweets(dedup=seen)]
+
+    assert result == ["20", "18", "17", "16"]
+    assert "16" in seen
+
+
+def test_async_iter_pages_dedup() -> None:
+    client = AsyncSearchRecent(MagicMock(get_bearer=AsyncMock(return_value="mock")))
+    seen = ExactFilter()
+
+    async def collect() -> list[list[str]]:
+        pages = client.iter_pages(max_tweets=4, dedup=seen)
+        return [[tweet["id"] for tweet in page["data"]] async for page in pages]
+
+    with patch.object(client, "http", AsyncHttpMocker()) as mock_http:
+        for page in (_page([20, 19], "page2"), _page([20, 19], "page3"), *PAGES):
+            mock_http.add_response(page, HEADERS, 200, URL)
+        client.query("hello")
+
+        result = asyncio.run(collect())
+
+    assert result == [["20", "19"], [], ["18"], ["17", "16", "15"]]
+    assert len(seen) == 6
+
+
+def _checkpoint_page(newest_id: str, next_token: str | None = None) -> Response:
+    meta = {"newest_id": newest_id, "next_token": next_token}
+    body = json.dumps({"data": [{"id": newest_id}], "meta": meta})
+    return Response(200, content=body, headers=HEADERS)
+
+
+def test_checkpoint_resumes_interrupted_run(tmp_path: Path) -> None:
+    store = FileCheckpointStore(str(tmp_path / "checkpoints.json"))
+    crashed = SearchRecent(MagicMock())
+    crashed.checkpoint_store = store
+    crashed.query("hello")
+
+    with patch.object(crashed.http, "get", return_value=_checkpoint_page("30", "p2")):
+        crashed.fetch()
+    assert store.load("hello") == Checkpoint(None, "p2", "30")
+
+    client = SearchRecent(MagicMock())
+    client.checkpoint_store = store
+    client.query("hello")
+    responses = [_checkpoint_page("20"), _checkpoint_page("40")]
+
+    with patch.object(client.http, "get", side_effect=responses) as mock_get:
+        client.fetch()
+        assert not client.more
+        assert store.load("hello") == Checkpoint("30")
+
+        client.fetch()
+
+    resumed, polled = (call.kwargs["params"] for call in mock_get.call_args_list)
+    assert resumed == {"query": "hello", "next_token": "p2"}
+    assert polled == {"query": "hello", "since_id": "30"}
+    assert store.load("hello") == Checkpoint("40")
+
+
+def test_checkpoint_key(tmp_path: Path) -> None:
+    store = FileCheckpointStore(str(tmp_path / "checkpoints.json"))
+    client = SearchRecent(MagicMock())
+    client.checkpoint_store = store
+    client.checkpoint_key = "job-1"
+    client.query("hello")
+
+    with patch.object(client.http, "get", return_value=_checkpoint_page("30")):
+        client.fetch()
+
+    assert store.load("job-1") == Checkpoint("30")
+    assert store.load("hello") is None
+
+
+def test_async_checkpoint(tmp_path: Path) -> None:
+    store = FileCheckpointStore(str(tmp_path / "checkpoints.json"))
+    store.save("hello", Checkpoint("10"))
+    auth_mock = MagicMock(get_bearer=AsyncMock(return_value="mock"))
+    client = AsyncSearchRecent(auth_mock)
+    client.checkpoint_store = store
+    client.query("hello")
+
+    with patch.object(client.http, "get", AsyncMock()) as mock_get:
+        mock_get.return_value = _checkpoint_page("30")
+        asyncio.run(client.fetch())
+
+    assert mock_get.call_args.kwargs["params"]["since_id"] == "10"
+    assert store.load("hello") == Checkpoint("30")
+
+
+def test_fetch_prepared_spec_shared_by_clients() -> None:
+    builder = SearchRecent(MagicMock())
+    builder.query("hello")
+    builder.max_results(10)
+    spec = builder.prepare()
+    builder.query("changed")
+
+    sent: list[str] = []
+    for _ in range(2):
+        client = SearchRecent(MagicMock())
+        with patch.object(client, "http", HttpMocker()) as mock_http:
+            for page in PAGES:
+                mock_http.add_response(page, HEADERS, 200, URL)
+            with patch.object(mock_http, "get", wraps=mock_http.get) as mock_get:
+                pages = list(client.iter_pages(spec=spec))
+            sent.extend(call.kwargs["params"] for call in mock_get.call_args_list)
+
+        assert len(pages) == 3
+
+    assert sent[0] == "max_results=10&query=hello"
+    assert sent[1] == "max_results=10&next_token=page2&query=hello"
+    assert sent[3:] == sent[:3]
+
+
+def test_prepare_requires_query(client: SearchRecent) -> None:
+    with pytest.raises(ValueError):
+        client.prepare()
+
+
+def test_async_fetch_prepared_spec() -> None:
+    auth_mock = MagicMock(get_bearer=AsyncMock(return_value="mock"))
+    client = AsyncSearchRecent(auth_mock)
+    client.query("hello")
+    spec = client.prepare()
+
+    with patch.object(client, "http", AsyncHttpMocker()) as mock_http:
+        mock_http.add_response(PAGES[0], HEADERS, 200, URL)
+
+        result = asyncio.run(client.fetch(spec))
+
+    assert [tweet["id"] for tweet in result["data"]] == ["20", "19", "18"]
+    assert client.more
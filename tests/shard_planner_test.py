@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+import httpx
+import pytest
+from twitterapiv2.http_pool import HttpPool
+from twitterapiv2.model.tweet_count import Count
+from twitterapiv2.shard_planner import async_plan_shards
+from twitterapiv2.shard_planner import balance_shards
+from twitterapiv2.shard_planner import plan_shards
+from twitterapiv2.tweets_counts import AsyncTweetsCounts
+from twitterapiv2.tweets_counts import TweetsCounts
+from twitterapiv2.tweets_counts import URL_ALL
+
+from tests.fixtures.httpmocker import AsyncHttpMocker
+from tests.fixtures.mock_headers import HEADERS
+
+START = datetime(2021, 1, 1)
+END = datetime(2021, 1, 1, 6)
+
+
+def _bucket(hour: int, tweet_count: int) -> Count:
+    return {
+        "start": f"2021-01-01T{hour:02d}:00:00.000Z",
+        "end": f"2021-01-01T{hour + 1:02d}:00:00.000Z",
+        "tweet_count": tweet_count,
+    }
+
+
+BUCKETS = [_bucket(0, 40), _bucket(1, 40), _bucket(2, 40), _bucket(3, 300)]
+BUCKETS += [_bucket(4, 0), _bucket(5, 10)]
+
+
+def _hour(hour: int, minute: int = 0) -> datetime:
+    return datetime(2021, 1, 1, hour, minute)
+
+
+def test_balance_merges_light_buckets_and_splits_spikes() -> None:
+    shards = balance_shards(BUCKETS, START, END, 100)
+
+    assert shards == [
+        (_hour(0), _hour(2)),
+        (_hour(2), _hour(3)),
+        (_hour(3), _hour(3, 20)),
+        (_hour(3, 20), _hour(3, 40)),
+        (_hour(3, 40), _hour(4)),
+        (_hour(4), END),
+    ]
+
+
+def test_balance_shards_are_contiguous() -> None:
+    shards = balance_shards(BUCKETS, START, END, 75)
+
+    assert shards[0][0] == START
+    assert shards[-1][1] == END
+    assert all(left[1] == right[0] for left, right in zip(shards, shards[1:]))
+
+
+def test_balance_stretches_last_shard_over_empty_tail() -> None:
+    shards = balance_shards([_bucket(0, 500), _bucket(1, 0)], START, _hour(2), 250)
+
+    assert shards == [(_hour(0), _hour(0, 30)), (_hour(0, 30), _hour(2))]
+
+
+def test_balance_without_tweets_is_one_shard() -> None:
+    assert balance_shards([], START, END, 100) == [(START, END)]
+
+
+def test_balance_aware_range() -> None:
+    eastern = timezone(timedelta(hours=-5))
+    start = datetime(2020, 12, 31, 19, tzinfo=eastern)
+    end = datetime(2021, 1, 1, 6, tzinfo=timezone.utc)
+
+    shards = balance_shards(BUCKETS, start, end, 100)
+
+    assert shards == balance_shards(BUCKETS, START, END, 100)
+
+
+def test_balance_invalid_target() -> None:
+    with pytest.raises(ValueError):
+        balance_shards(BUCKETS, START, END, 0)
+
+
+def _pages() -> list[str]:
+    first = {"data": BUCKETS[:3], "meta": {"next_token": "more"}}
+    second = {"data": BUCKETS[3:], "meta": {"total_tweet_count": 430}}
+    return [json.dumps(first), json.dumps(second)]
+
+
+def test_plan_shards_leaves_client_unchanged() -> None:
+    pages = _pages()
+    params: list[dict[str, str]] = []
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        params.append(dict(request.url.params))
+        return httpx.Response(200, content=pages.pop(0), headers=HEADERS)
+
+    counts = TweetsCounts(MagicMock(), end_point="all")
+    counts.use_pool(HttpPool(transport=httpx.MockTransport(handle)))
+    counts.query("hello")
+    counts.granularity("day")
+    counts._next_token = "untouched"
+    start = START.replace(tzinfo=timezone.utc)
+
+    shards = plan_shards(counts, start, END, pages_per_shard=1, page_size=100)
+
+    assert len(shards) == 6
+    assert shards[0][0] == START
+    assert params[0] == {
+        "query": "hello",
+        "granularity": "hour",
+        "start_time": "2021-01-01T00:00:00Z",
+        "end_time": "2021-01-01T06:00:00Z",
+    }
+    assert params[1]["next_token"] == "more"
+    assert counts.fields["granularity"] == "day"
+    assert "start_time" not in counts.fields
+    assert counts._next_token == "untouched"
+
+
+def test_async_plan_shards() -> None:
+    auth_mock = MagicMock(get_bearer=AsyncMock(return_value="mock"))
+    counts = AsyncTweetsCounts(auth_mock, end_point="all")
+    counts.query("hello")
+
+    with patch.object(counts, "http", AsyncHttpMocker()) as mock_http:
+        for page in _pages():
+            mock_http.add_response(page, HEADERS, 200, URL_ALL)
+
+        shards = asyncio.run(
+            async_plan_shards(counts, START, END, granularity="minute", page_size=10)
+        )
+
+    assert len(shards) == 6
+    assert counts.fields.get("granularity") is None
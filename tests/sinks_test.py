@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import gzip
+import json
+from pathlib import Path
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+from httpx import Response
+from twitterapiv2.cache import MemoryCache
+from twitterapiv2.search_recent import SearchRecent
+from twitterapiv2.sinks import GzipNDJSONSink
+from twitterapiv2.sinks import NDJSONSink
+from twitterapiv2.sinks import RotatingSink
+
+from tests.fixtures.mock_headers import HEADERS
+
+RAW = b'{"data":[{"id":"1","text":"caf\\u00e9"}],"meta":{"result_count":1}}'
+PAGE = json.loads(RAW)
+
+
+def _lines(path: Path) -> list[bytes]:
+    return path.read_bytes().splitlines()
+
+
+def test_ndjson_writes_raw_body_as_is(tmp_path: Path) -> None:
+    path = tmp_path / "pages.ndjson"
+
+    with NDJSONSink(str(path)) as sink:
+        sink.write(PAGE, RAW + b"\n")
+        sink.write_raw(RAW)
+
+    assert _lines(path) == [RAW, RAW]
+    assert sink.pages == 2
+    assert sink.bytes_written == 2 * (len(RAW) + 1)
+
+
+def test_ndjson_encodes_page_without_raw(tmp_path: Path) -> None:
+    path = tmp_path / "pages.ndjson"
+
+    with NDJSONSink(str(path)) as sink:
+        sink.write(PAGE)
+
+    assert [json.loads(line) for line in _lines(path)] == [PAGE]
+
+
+def test_multiline_raw_is_compacted(tmp_path: Path) -> None:
+    path = tmp_path / "pages.ndjson"
+    pretty = json.dumps(PAGE, indent=2).encode()
+
+    with NDJSONSink(str(path)) as sink:
+        sink.write(PAGE, pretty)
+        sink.write_raw(pretty)
+
+    assert [json.loads(line) for line in _lines(path)] == [PAGE, PAGE]
+
+
+def test_ndjson_appends(tmp_path: Path) -> None:
+    path = tmp_path / "pages.ndjson"
+    for _ in range(2):
+        with NDJSONSink(str(path)) as sink:
+            sink.write_raw(RAW)
+
+    assert len(_lines(path)) == 2
+
+
+def test_buffers_until_flush(tmp_path: Path) -> None:
+    path = tmp_path / "pages.ndjson"
+    sink = NDJSONSink(str(path), buffer_size=1024)
+
+    sink.write_raw(RAW)
+    assert path.read_bytes() == b""
+
+    sink.flush()
+    assert _lines(path) == [RAW]
+    sink.close()
+
+
+def test_gzip(tmp_path: Path) -> None:
+    path = tmp_path / "pages.ndjson.gz"
+    for _ in range(2):
+        with GzipNDJSONSink(str(path), compresslevel=1) as sink:
+            sink.write_raw(RAW)
+
+    with gzip.open(path) as infile:
+        assert infile.read().splitlines() == [RAW, RAW]
+
+
+def test_rotating_by_pages(tmp_path: Path) -> None:
+    pattern = str(tmp_path / "out" / "pages-{index:03d}.ndjson")
+
+    with RotatingSink(pattern, max_pages=2) as sink:
+        for _ in range(5):
+            sink.write_raw(RAW)
+
+    assert [Path(path).name for path in sink.paths] == [
+        "pages-000.ndjson",
+        "pages-001.ndjson",
+        "pages-002.ndjson",
+    ]
+    assert [len(_lines(Path(path))) for path in sink.paths] == [2, 2, 1]
+    assert sink.pages == 5
+
+
+def test_rotating_by_bytes_compressed(tmp_path: Path) -> None:
+    pattern = str(tmp_path / "pages-{index}.ndjson.gz")
+
+    with RotatingSink(pattern, max_bytes=len(RAW) * 2, compress=True) as sink:
+        for _ in range(3):
+            sink.write_raw(RAW)
+
+    assert len(sink.paths) == 3
+    with gzip.open(sink.paths[0]) as infile:
+        assert infile.read().splitlines() == [RAW]
+
+
+def test_client_last_content() -> None:
+    client = SearchRecent(MagicMock())
+    client.cache = MemoryCache()
+    client.query("hello")
+    response = Response(200, content=RAW, headers=HEADERS)
+
+    with patch.object(client.http, "get", return_value=response):
+        client.fetch()
+        assert client.last_content == RAW
+
+        client.fetch()
+        assert client.last_content is None
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+from twitterapiv2.model.oauth_token import OAuthToken
+from twitterapiv2.token_store import FileTokenStore
+from twitterapiv2.token_store import SQLiteTokenStore
+from twitterapiv2.token_store import TokenStore
+
+TOKEN = OAuthToken("access", "refresh", 1700000000.0)
+
+
+@pytest.fixture(params=["file", "sqlite"])
+def store(request: pytest.FixtureRequest, tmp_path: Path) -> TokenStore:
+    if request.param == "file":
+        return FileTokenStore(str(tmp_path / "tokens.json"))
+    return SQLiteTokenStore(str(tmp_path / "tokens.db"))
+
+
+def test_load_missing(store: TokenStore) -> None:
+    assert store.load("missing") is None
+
+
+def test_save_and_load(store: TokenStore) -> None:
+    store.save("user:mock", TOKEN)
+
+    assert store.load("user:mock") == TOKEN
+
+
+def test_save_replaces(store: TokenStore) -> None:
+    store.save("user:mock", TOKEN)
+    replacement = OAuthToken("new_access")
+
+    store.save("user:mock", replacement)
+
+    assert store.load("user:mock") == replacement
+
+
+def test_delete(store: TokenStore) -> None:
+    store.save("user:mock", TOKEN)
+    store.save("app:mock", TOKEN)
+
+    store.delete("user:mock")
+    store.delete("user:mock")
+
+    assert store.load("user:mock") is None
+    assert store.load("app:mock") == TOKEN
+
+
+def test_persists_across_instances(store: TokenStore) -> None:
+    store.save("user:mock", TOKEN)
+
+    reopened = type(store)(store.path)  # type: ignore
+
+    assert reopened.load("user:mock") == TOKEN
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX file modes")
+def test_file_store_is_private(tmp_path: Path) -> None:
+    path = tmp_path / "tokens.json"
+
+    FileTokenStore(str(path)).save("user:mock", TOKEN)
+
+    assert os.stat(path).st_mode & 0o777 == 0o600
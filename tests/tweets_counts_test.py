@@ -1,13 +1,19 @@
 from __future__ import annotations
 
+import asyncio
 import json
+from unittest.mock import AsyncMock
 from unittest.mock import MagicMock
 from unittest.mock import patch
 
 import pytest
+from twitterapiv2.model.tweet_count import TweetCount
+from twitterapiv2.tweets_counts import AsyncTweetsCounts
 from twitterapiv2.tweets_counts import TweetsCounts
+from twitterapiv2.tweets_counts import URL_ALL
 from twitterapiv2.tweets_counts import URL_RECENT
 
+from tests.fixtures.httpmocker import AsyncHttpMocker
 from tests.fixtures.httpmocker import HttpMocker
 from tests.fixtures.mock_headers import HEADERS
 
@@ -47,3 +53,79 @@ def test_valid_count(client: TweetsCounts) -> None:
 def test_query_field_is_required(client: TweetsCounts) -> None:
     with pytest.raises(ValueError):
         client.fetch()
+
+
+def test_async_valid_count() -> None:
+    auth_mock = MagicMock(get_bearer=AsyncMock(return_value="mock"))
+    client = AsyncTweetsCounts(auth_mock, end_point="all")
+
+    with patch.object(client, "http", AsyncHttpMocker()) as mock_http:
+        mock_http.add_response(json.dumps(MOCK_BODY), HEADERS, 200, URL_ALL)
+
+        client.query("hello")
+
+        result = asyncio.run(client.fetch())
+        assert result["meta"]["total_tweet_count"]
+        assert not client.more
+
+
+def test_async_query_field_is_required() -> None:
+    with pytest.raises(ValueError):
+        asyncio.run(AsyncTweetsCounts(MagicMock()).fetch())
+
+
+def test_iter_pages(client: TweetsCounts) -> None:
+    first_page = {**MOCK_BODY, "meta": {"total_tweet_count": 1, "next_token": "a"}}
+
+    with patch.object(client, "http", HttpMocker()) as mock_http:
+        mock_http.add_response(json.dumps(first_page), HEADERS, 200, URL_RECENT)
+        mock_http.add_response(json.dumps(MOCK_BODY), HEADERS, 200, URL_RECENT)
+        client.query("hello")
+
+        result = list(client.iter_pages())
+
+    assert len(result) == 2
+    assert not client.more
+
+
+def test_iter_pages_max_pages(client: TweetsCounts) -> None:
+    first_page = {**MOCK_BODY, "meta": {"total_tweet_count": 1, "next_token": "a"}}
+
+    with patch.object(client, "http", HttpMocker()) as mock_http:
+        mock_http.add_response(json.dumps(first_page), HEADERS, 200, URL_RECENT)
+        client.query("hello")
+
+        result = list(client.iter_pages(max_pages=1))
+
+    assert len(result) == 1
+    assert client.more
+
+
+def test_async_iter_pages() -> None:
+    auth_mock = MagicMock(get_bearer=AsyncMock(return_value="mock"))
+    client = AsyncTweetsCounts(auth_mock)
+
+    async def collect() -> list[TweetCount]:
+        return [page async for page in client.iter_pages()]
+
+    with patch.object(client, "http", AsyncHttpMocker()) as mock_http:
+        mock_http.add_response(json.dumps(MOCK_BODY), HEADERS, 200, URL_RECENT)
+        client.query("hello")
+
+        result = asyncio.run(collect())
+
+    assert len(result) == 1
+
+
+def test_fetch_prepared_spec(client: TweetsCounts) -> None:
+    client.query("hello")
+    client.granularity("day")
+    spec = client.prepare()
+
+    with patch.object(client, "http", HttpMocker()) as mock_http:
+        mock_http.add_response(json.dumps(MOCK_BODY), HEADERS, 200, URL_RECENT)
+
+        result = client.fetch(spec)
+
+    assert result["meta"]["total_tweet_count"]
+    assert spec.get("granularity") == "day"
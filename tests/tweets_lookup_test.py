@@ -1,12 +1,20 @@
 from __future__ import annotations
 
+import asyncio
+import json
+import time
+from typing import Any
+from unittest.mock import AsyncMock
 from unittest.mock import MagicMock
 from unittest.mock import patch
 
 import pytest
+from httpx import Response
+from twitterapiv2.tweets_lookup import AsyncTweetsLookup
 from twitterapiv2.tweets_lookup import TweetsLookup
 from twitterapiv2.tweets_lookup import URL
 
+from tests.fixtures.httpmocker import AsyncHttpMocker
 from tests.fixtures.httpmocker import HttpMocker
 from tests.fixtures.mock_headers import HEADERS
 
@@ -43,3 +51,140 @@ def test_valid_multi_search(client: TweetsLookup) -> None:
 def test_id_required(client: TweetsLookup) -> None:
     with pytest.raises(ValueError):
         client.fetch()
+
+
+def test_async_valid_multi_search() -> None:
+    auth_mock = MagicMock(get_bearer=AsyncMock(return_value="mock"))
+    client = AsyncTweetsLookup(auth_mock)
+
+    with patch.object(client, "http", AsyncHttpMocker()) as mock_http:
+        mock_http.add_response(MULTI_SEARCH, HEADERS, 200, URL)
+
+        client.ids(LUCKY_IDS)
+        result = asyncio.run(client.fetch())
+        assert len(result) == 2
+
+
+def test_async_id_required() -> None:
+    with pytest.raises(ValueError):
+        asyncio.run(AsyncTweetsLookup(MagicMock()).fetch())
+
+
+def _lookup_response(*args: Any, **kwargs: Any) -> Response:
+    ids = kwargs["params"]["ids"].split(",")
+    body = {
+        "data": [{"id": tweet_id, "text": "mock"} for tweet_id in ids],
+        "includes": {"users": [{"id": "1"}], "media": [{"media_key": ids[0]}]},
+    }
+    return Response(200, content=json.dumps(body), headers=HEADERS)
+
+
+def test_fetch_many_chunks_ids(client: TweetsLookup) -> None:
+    ids = [str(tweet_id) for tweet_id in range(250)]
+    client.tweet_fields("lang")
+
+    with patch.object(client.http, "get", side_effect=_lookup_response) as mock_get:
+        result = list(client.fetch_many(ids, max_workers=3))
+
+    assert mock_get.call_count == 3
+    assert [len(page["data"]) for page in result] == [100, 100, 50]
+    assert [tweet["id"] for page in result for tweet in page["data"]] == ids
+    assert all(
+        call.kwargs["params"]["tweet.fields"] == "lang"
+        for call in mock_get.call_args_list
+    )
+
+
+def test_fetch_many_leaves_client_state(client: TweetsLookup) -> None:
+    client._next_token = "untouched"
+    client._page_depth = 3
+
+    with patch.object(client.http, "get", side_effect=_lookup_response):
+        list(client.fetch_many(range(1, 251), max_workers=3))
+
+    assert client._next_token == "untouched"
+    assert client._page_depth == 3
+    assert client._last_content is None
+
+
+def test_fetch_many_waits_out_throttle(client: TweetsLookup) -> None:
+    reset = str(int(time.time()) + 30)
+    throttled = Response(429, headers={**HEADERS, "x-rate-limit-reset": reset})
+    responses = iter([None, throttled, None, None])
+
+    def respond(*args: Any, **kwargs: Any) -> Response:
+        return next(responses) or _lookup_response(*args, **kwargs)
+
+    with patch.object(client.http, "get", side_effect=respond) as mock_get:
+        with patch("twitterapiv2.rate_limit.time.sleep") as mock_sleep:
+            result = list(client.fetch_many(range(1, 251), max_workers=1))
+
+    assert client.rate_limiter is not None
+    assert [len(page["data"]) for page in result] == [100, 100, 50]
+    assert mock_get.call_count == 4
+    mock_sleep.assert_called_once()
+
+
+def test_async_fetch_many_assigns_rate_limiter() -> None:
+    client = AsyncTweetsLookup(MagicMock(get_bearer=AsyncMock(return_value="mock")))
+
+    async def collect() -> None:
+        async for _ in client.fetch_many([]):
+            pass
+
+    asyncio.run(collect())
+
+    assert client.rate_limiter is not None
+
+
+def test_fetch_many_unordered(client: TweetsLookup) -> None:
+    ids = range(1, 251)
+
+    with patch.object(client.http, "get", side_effect=_lookup_response):
+        result = list(client.fetch_many(ids, ordered=False))
+
+    assert sorted(len(page["data"]) for page in result) == [50, 100, 100]
+
+
+def test_fetch_bulk_merges_results(client: TweetsLookup) -> None:
+    ids = [str(tweet_id) for tweet_id in range(150)]
+
+    with patch.object(client.http, "get", side_effect=_lookup_response):
+        result = client.fetch_bulk(ids)
+
+    assert len(result["data"]) == 150
+    assert result["includes"]["users"] == [{"id": "1"}]
+    assert result["includes"]["media"] == [{"media_key": "0"}, {"media_key": "100"}]
+    assert result["errors"] == []
+
+
+def test_async_fetch_bulk() -> None:
+    auth_mock = MagicMock(get_bearer=AsyncMock(return_value="mock"))
+    client = AsyncTweetsLookup(auth_mock)
+    ids = [str(tweet_id) for tweet_id in range(150)]
+    mock_get = AsyncMock(side_effect=_lookup_response)
+
+    with patch.object(client.http, "get", mock_get):
+        result = asyncio.run(client.fetch_bulk(ids))
+
+    assert [tweet["id"] for tweet in result["data"]] == ids
+    assert mock_get.await_count == 2
+    assert client._page_depth == 0
+
+
+def test_fetch_prepared_spec(client: TweetsLookup) -> None:
+    client.ids(LUCKY_IDS)
+    spec = client.prepare()
+
+    with patch.object(client, "http", HttpMocker()) as mock_http:
+        mock_http.add_response(MULTI_SEARCH, HEADERS, 200, URL)
+
+        result = client.fetch(spec)
+
+    assert len(result) == 2
+    assert spec.get("ids") == "1461880347478528007,1461880346580979715"
+
+
+def test_prepare_requires_ids(client: TweetsLookup) -> None:
+    with pytest.raises(ValueError):
+        client.prepare()
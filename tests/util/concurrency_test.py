@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from collections.abc import Iterator
+
+import pytest
+from twitterapiv2.util.concurrency import async_bounded_map
+from twitterapiv2.util.concurrency import bounded_map
+from twitterapiv2.util.concurrency import chunked
+
+
+def test_chunked() -> None:
+    result = list(chunked(range(7), 3))
+
+    assert result == [[0, 1, 2], [3, 4, 5], [6]]
+
+
+def test_chunked_empty() -> None:
+    assert list(chunked([], 3)) == []
+
+
+def _slow_square(value: int) -> int:
+    time.sleep(random.random() / 100)
+    return value * value
+
+
+@pytest.mark.parametrize("ordered", (True, False))
+def test_bounded_map(ordered: bool) -> None:
+    result = list(bounded_map(_slow_square, range(20), max_workers=4, ordered=ordered))
+
+    assert sorted(result) == [value * value for value in range(20)]
+    if ordered:
+        assert result == [value * value for value in range(20)]
+
+
+def test_bounded_map_is_lazy() -> None:
+    consumed: list[int] = []
+
+    def items() -> Iterator[int]:
+        for value in range(1000):
+            consumed.append(value)
+            yield value
+
+    results = bounded_map(_slow_square, items(), max_workers=2)
+    next(results)
+    results.close()  # type: ignore
+
+    assert len(consumed) < 10
+
+
+@pytest.mark.parametrize("ordered", (True, False))
+def test_async_bounded_map(ordered: bool) -> None:
+    async def square(value: int) -> int:
+        await asyncio.sleep(random.random() / 100)
+        return value * value
+
+    async def collect() -> list[int]:
+        results = async_bounded_map(
+            square,
+            range(20),
+            max_concurrency=4,
+            ordered=ordered,
+        )
+        return [result async for result in results]
+
+    result = asyncio.run(collect())
+
+    assert sorted(result) == [value * value for value in range(20)]
+    if ordered:
+        assert result == [value * value for value in range(20)]
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import json
+from unittest.mock import patch
+
+import pytest
+from twitterapiv2.util import json_decoder
+from twitterapiv2.util.json_decoder import default_decoder
+from twitterapiv2.util.json_decoder import stdlib_decoder
+
+BODY = b'{"data":[{"id":"1461880347478528007","text":"MOCK \\u00e9"}]}'
+
+
+def test_stdlib_decoder() -> None:
+    assert stdlib_decoder(BODY) == json.loads(BODY)
+
+
+def test_default_decoder_matches_stdlib() -> None:
+    assert default_decoder()(BODY) == stdlib_decoder(BODY)
+
+
+def test_default_decoder_without_orjson() -> None:
+    default_decoder.cache_clear()
+    try:
+        with patch.dict("sys.modules", {"orjson": None}):
+            assert json_decoder.default_decoder() is stdlib_decoder
+    finally:
+        default_decoder.cache_clear()
+
+
+def test_default_decoder_uses_orjson() -> None:
+    orjson = pytest.importorskip("orjson")
+    assert default_decoder() is orjson.loads